@@ -1,54 +1,49 @@
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 from OpenGL.GLU import *
+import argparse
+import atexit
 import math
-import random
+import sys
+import time
+
+from simulation import (Simulation, FixedTimestep, WORLD_LIMIT, TICK_RATE,
+                        STREAK_WINDOW, HAZARD_TYPES, ENTITY_KINDS, UPDATE_PHASES,
+                        EFFECT_POOL_SIZE, EFFECT_LIFETIME)
+from gl_resources import ModelLibrary, LOD_SCALES, part, solid_cube
+from hud_text import FontAtlas, TextCache
+from culling import Frustum
+from draw_queue import DrawQueue, StateCache
+from materials import PALETTES
+# The explosion puffs and the timing overlay keep their data in NumPy arrays, so the
+# game always needs NumPy; only the instanced and shader renderers load on demand
+from particles import ParticleSystem, PARTICLES_PER_BURST
+from particle_sprites import ParticleSprites
+from dynamic_resolution import ResolutionScaler, SceneTarget, MIN_SCALE
+from profiling import Profiler
+from perf_overlay import PerfOverlay, PHASE_COLORS
+from tracing import TraceRecorder
 
 
 # Configuration constants
 WINDOW_WIDTH = 1000
 WINDOW_HEIGHT = 800
-WORLD_LIMIT = 2000
 GRID_LINES = 40
 CAMERA_FOV = 60
-RECYCLE_DISTANCE = 400
-SPAWN_AHEAD = 1800
-
-
-# Game state container
-class GameState:
-    def __init__(self):
-        self.score = 0
-        self.lives = 3
-        self.base_speed = 0.70
-        self.boost_duration = 0
-        self.finished = False
-        self.difficulty = 1
-        self.frames = 0
-        self.enemy_hits = 0
-        self.cheat_enabled = False
-        self.weapon_cooldown = 0
-        self.active = False
-        self.suspended = False
-        self.streak = 0
-        self.streak_timeout = 0
-        self.last_collected_y = -999999
-        self.total_kills = 0
-
-
-# Player vehicle state
-class Aircraft:
-    def __init__(self):
-        self.position = [0, 0, 50]
-        self.angles = [0, 0, 0]  # roll, pitch, yaw
-        self.velocity = [0, 0, 1.0]  # horizontal, vertical, forward
-        self.prop_spin = 0
-    
-    def get_x(self): return self.position[0]
-    def get_y(self): return self.position[1]
-    def get_z(self): return self.position[2]
-    def set_position(self, x, y, z):
-        self.position = [x, y, z]
+DRAW_DISTANCE = 5000            # far clip plane; entities beyond it are culled
+# Projected radius in pixels below which a model drops to the next level of detail
+LOD_PIXEL_THRESHOLDS = (60, 20)
+RENDERERS = ('lists', 'instanced', 'shader')
+DEFAULT_PALETTE = 'final'
+TARGET_FPS = 30                 # frame rate the performance overlay's budget line marks
+PICKUP_SPIN_Z = 120.0           # degrees per second
+PICKUP_SPIN_X = 90.0
+PULSE_FREQUENCY = 6.0           # radians per second, for pickup pulses and the title blink
+MASS_KILL_COUNT = 3             # kills in one tick that the trace marks as a burst
+# Render passes timed when profiling, looked up by name on this module
+RENDER_PASSES = ('render_world', 'setup_camera_view', 'render_sky_gradient', 'render_terrain_surface',
+                 'render_player_vehicle', 'render_entities', 'render_entities_instanced',
+                 'render_entities_shaded', 'render_interface', 'glutSwapBuffers')
 
 
 # Camera system
@@ -56,255 +51,223 @@ class CameraSystem:
     def __init__(self):
         self.view_mode = 0
         self.offset = [0, -200, 150]
+        self.draw_distance = DRAW_DISTANCE
+        self.eye = (0, 0, 0)
     
     def cycle(self):
         self.view_mode = (self.view_mode + 1) % 3
 
 
-# Entity collections
-class WorldEntities:
-    def __init__(self):
-        self.collectibles = []
-        self.hazards = []
-        self.hostiles = []
-        self.missiles = []
-        self.pickups = []
-        self.effects = []
-
-
-# Initialize global objects
-state = GameState()
-player = Aircraft()
+# Key bindings for flight controls
+FLIGHT_KEYS = {
+    b'i': 'climb',          # was 'w'
+    b'k': 'dive',           # was 's'
+    b'j': 'bank_left',      # was 'a'
+    b'l': 'bank_right',     # was 'd'
+    b'u': 'strafe_left',    # was 'q'
+    b'o': 'strafe_right',   # was 'e'
+}
+
+ARROW_KEYS = {
+    GLUT_KEY_UP: 'nudge_up',
+    GLUT_KEY_DOWN: 'nudge_down',
+    GLUT_KEY_LEFT: 'nudge_left',
+    GLUT_KEY_RIGHT: 'nudge_right',
+}
+
+
+# Initialize global objects. The game runs the dict-based Simulation, whose
+# scalar missile loop finds hits through the hostile grid and needs no NumPy;
+# the batched array updates are ArraySimulation's, for headless runs and benchmarks
+sim = Simulation(active=False, verbose=True, tick_rate=TICK_RATE)
+scheduler = FixedTimestep(sim.dt)
 cam = CameraSystem()
-world = WorldEntities()
-
-
-def distance_3d(x1, y1, z1, x2, y2, z2):
-    """Calculate Euclidean distance using alternative formula"""
-    dx = x2 - x1
-    dy = y2 - y1
-    dz = z2 - z1
-    return math.sqrt(dx * dx + dy * dy + dz * dz)
-
-
-def clamp_value(val, min_val, max_val):
-    """Restrict value within bounds"""
-    if val < min_val:
-        return min_val
-    if val > max_val:
-        return max_val
-    return val
 
 
-def apply_damping(value, factor):
-    """Apply friction/damping to a value"""
-    return value * factor
-
-
-def spawn_collectible(x, y, z):
-    """Create a new collectible ring"""
-    return {
-        'pos': [x, y, z],
-        'taken': False,
-        'radius': 80,
-        'thickness': 20
-    }
-
-
-def spawn_hazard(x, y, z, hazard_type):
-    """Create environmental obstacle"""
-    return {
-        'pos': [x, y, z],
-        'variant': hazard_type,
-        'size': 50
-    }
-
-
-def spawn_hostile(x, y, z):
-    """Create enemy aircraft"""
-    return {
-        'pos': [x, y, z],
-        'alive': True,
-        'size': 35
-    }
-
-
-def spawn_pickup(x, y, z):
-    """Create powerup item"""
-    return {
-        'pos': [x, y, z],
-        'taken': False,
-        'radius': 35
-    }
+# Model geometry: parts compiled once into display lists (or meshes for instancing);
+# colours are material names looked up in the active palette
+MODEL_PARTS = {
+    # Player aircraft without its propeller: body, wings, tails and canopy
+    'aircraft': [
+        part('cube', (30,), 'hull', ('scale', 1, 3, 0.5)),
+        part('cube', (30,), 'wing', ('scale', 5, 0.3, 0.2)),
+        part('cube', (30,), 'tail', ('translate', 0, -35, 10), ('scale', 0.2, 0.5, 1.5)),
+        part('cube', (20,), 'tail', ('translate', 0, -35, 5), ('scale', 2, 0.3, 0.2)),
+        part('cube', (15,), 'canopy', ('translate', 0, 10, 8)),
+    ],
+    # Propeller blade, spun about y when drawn
+    'propeller': [
+        part('cube', (25,), 'propeller', ('scale', 2, 0.1, 0.3)),
+    ],
+    # Ring gate standing across the flight path: navy outer, olive and black inner bands
+    'ring': [
+        part('cylinder', (80, 80, 20, 20, 5), 'ring_outer', ('rotate', 90, 1, 0, 0)),
+        part('cylinder', (60, 60, 20, 20, 5), 'ring_middle', ('rotate', 90, 1, 0, 0)),
+        part('cylinder', (40, 40, 20, 20, 5), 'ring_inner', ('rotate', 90, 1, 0, 0)),
+    ],
+    # Cloud using alternative sphere arrangement
+    'cloud': [
+        part('sphere', (40, 10, 10), 'cloud'),
+        part('sphere', (35, 10, 10), 'cloud', ('translate', 30, 0, 0)),
+        part('sphere', (35, 10, 10), 'cloud', ('translate', -30, 0, 0)),
+    ],
+    'rock': [
+        part('cube', (50,), 'rock'),
+    ],
+    # Pink balloon (slight variation) on a light gray tether
+    'balloon': [
+        part('sphere', (32, 10, 10), 'balloon'),
+        part('cylinder', (4, 2, 22, 10, 10), 'tether', ('translate', 0, 0, -38), ('rotate', -90, 1, 0, 0)),
+    ],
+    # Enemy body, wings, tail and marker beacon
+    'hostile': [
+        part('cube', (30,), 'hostile_body', ('scale', 1, 2, 0.5)),
+        part('cube', (25,), 'hostile_wing', ('scale', 4, 0.3, 0.2)),
+        part('cube', (25,), 'hostile_tail', ('translate', 0, -25, 8), ('scale', 0.2, 0.4, 1.2)),
+        part('sphere', (8, 8, 8), 'beacon', ('translate', 0, 0, 15)),
+    ],
+    'missile': [
+        part('sphere', (5, 8, 8), 'missile'),
+    ],
+    # Powerup crystal; spin and pulse are applied when drawn
+    'pickup': [
+        part('cube', (25,), 'pickup'),
+        part('wire_cube', (30,), 'pickup_frame'),
+    ],
+}
+
+# edit01.py's models, drawn with the classic palette: two-band rings and its
+# slightly smaller balloon on a thicker tether
+CLASSIC_PARTS = dict(
+    MODEL_PARTS,
+    ring=[
+        part('cylinder', (80, 80, 20, 20, 5), 'ring_outer', ('rotate', 90, 1, 0, 0)),
+        part('cylinder', (60, 60, 20, 20, 5), 'ring_middle', ('rotate', 90, 1, 0, 0)),
+    ],
+    balloon=[
+        part('sphere', (30, 10, 10), 'balloon'),
+        part('cylinder', (5, 2, 20, 10, 10), 'tether', ('translate', 0, 0, -40), ('rotate', -90, 1, 0, 0)),
+    ],
+)
+
+# Model geometry drawn with each palette
+PALETTE_PARTS = {
+    'final': MODEL_PARTS,
+    'classic': CLASSIC_PARTS,
+}
+
+def draw_terrain_geometry():
+    """Ground, grid and mountains in immediate mode; baked once into a display list"""
+    # Main ground
+    glBegin(GL_QUADS)
+    glColor3f(0.15, 0.55, 0.15)
+    glVertex3f(-WORLD_LIMIT, -WORLD_LIMIT, 0)
+    glVertex3f(WORLD_LIMIT, -WORLD_LIMIT, 0)
+    glVertex3f(WORLD_LIMIT, WORLD_LIMIT, 0)
+    glVertex3f(-WORLD_LIMIT, WORLD_LIMIT, 0)
+    glEnd()
+    
+    # Grid using different calculation
+    glColor3f(0.05, 0.35, 0.05)
+    glLineWidth(1)
+    cell_size = (WORLD_LIMIT * 2) / GRID_LINES
+    
+    glBegin(GL_LINES)
+    line_count = GRID_LINES + 1
+    for i in range(line_count):
+        coord = -WORLD_LIMIT + i * cell_size
+        # Horizontal lines
+        glVertex3f(-WORLD_LIMIT, coord, 0)
+        glVertex3f(WORLD_LIMIT, coord, 0)
+        # Vertical lines
+        glVertex3f(coord, -WORLD_LIMIT, 0)
+        glVertex3f(coord, WORLD_LIMIT, 0)
+    glEnd()
+    
+    # Mountains with different positioning
+    mountain_count = 5
+    for i in range(mountain_count):
+        glPushMatrix()
+        x_pos = -800 + i * 400
+        y_pos = -800
+        glTranslatef(x_pos, y_pos, 50)
+        glColor3f(0.35, 0.25, 0.15)
+        glScalef(1, 1, 2)
+        solid_cube(100)
+        glPopMatrix()
 
 
-def spawn_missile(x, y, z, direction):
-    """Create projectile"""
-    return {
-        'pos': [x, y, z],
-        'dir': direction,
-        'vel': 30,
-        'range': 1000
-    }
+# Bounding-sphere radius of each model around its origin, for culling and LOD
+MODEL_RADII = {
+    'ring': 83,
+    'cloud': 65,
+    'rock': 44,
+    'balloon': 48,
+    'hostile': 51,
+    'missile': 5,
+    'pickup': 32,
+    # Explosion burst: spawn spread and drift over its lifetime, plus the largest puff
+    'effect': 120,
+}
+
+models = ModelLibrary(MODEL_PARTS, PALETTES[DEFAULT_PALETTE], static={'terrain': draw_terrain_geometry})
+instanced = None    # InstancedRenderer once enabled with --renderer instanced
+shaded = None       # ShaderRenderer once enabled with --renderer shader
+hud_text = TextCache(FontAtlas(GLUT_BITMAP_HELVETICA_18))
+frustum = Frustum()
+gl_state = StateCache()
+draw_queue = DrawQueue(models, gl_state)
+sprites = ParticleSprites()
+particles = ParticleSystem(EFFECT_POOL_SIZE * PARTICLES_PER_BURST, EFFECT_LIFETIME)
+window_size = [WINDOW_WIDTH, WINDOW_HEIGHT]
+scene_target = SceneTarget()
+resolution = None   # a ResolutionScaler with --target-fps; None renders straight to the window
+profiler = Profiler()   # enabled with --profile
+overlay = PerfOverlay(1.0 / TARGET_FPS)    # toggled with F3
+tracer = TraceRecorder()    # enabled with --trace
+trace_path = None
+focal_pixels = 0.0  # set by render_world from the height it renders at
+
+
+def focal_length(height):
+    """Pixels covered by one unit at unit distance, for a view height in pixels"""
+    return (height / 2) / math.tan(math.radians(CAMERA_FOV) / 2)
+
+
+def detail_level(kind, pos):
+    """Level of detail for a model from how many pixels its bounding radius covers"""
+    ex, ey, ez = cam.eye
+    distance = math.sqrt((pos[0] - ex) ** 2 + (pos[1] - ey) ** 2 + (pos[2] - ez) ** 2)
+    if distance == 0:
+        return 0
+    pixels = MODEL_RADII[kind] * focal_pixels / distance
+    level = 0
+    for threshold in LOD_PIXEL_THRESHOLDS:
+        if pixels >= threshold:
+            break
+        level += 1
+    return level
 
 
-def spawn_effect(x, y, z):
-    """Create explosion visual"""
-    return {
-        'pos': [x, y, z],
-        'timer': 30,
-        'base_size': 10
-    }
+def player_attitude():
+    """Yaw, pitch and roll of the player aircraft as rotate ops"""
+    angles = sim.player.angles
+    return (('rotate', angles[2], 0, 0, 1), ('rotate', angles[1], 1, 0, 0),
+            ('rotate', angles[0], 0, 1, 0))
 
 
-def initialize_entities():
-    """Populate world with initial objects using different distribution"""
-    world.collectibles.clear()
-    world.hazards.clear()
-    world.hostiles.clear()
-    world.pickups.clear()
-    
-    # Distribute rings using different spacing logic
-    spacing = 300
-    for i in range(5):
-        world.collectibles.append(
-            spawn_collectible(
-                random.randint(-500, 500),
-                200 + i * spacing,
-                random.randint(100, 300)
-            )
-        )
-    
-    # Scatter hazards randomly
-    hazard_types = ['cloud', 'rock', 'balloon']
-    for _ in range(8):
-        world.hazards.append(
-            spawn_hazard(
-                random.randint(-600, 600),
-                random.randint(100, 1500),
-                random.randint(50, 400),
-                random.choice(hazard_types)
-            )
-        )
-    
-    # Place enemies in visible range using different logic
-    enemy_count = 3
-    for i in range(enemy_count):
-        offset = 300 + (i * 200)
-        world.hostiles.append(
-            spawn_hostile(
-                player.get_x() + random.randint(-300, 300),
-                player.get_y() + offset,
-                player.get_z() + random.randint(-100, 100)
-            )
-        )
-    
-    # Distribute powerups
-    for _ in range(3):
-        world.pickups.append(
-            spawn_pickup(
-                random.randint(-300, 300),
-                random.randint(200, 1000),
-                random.randint(100, 250)
-            )
-        )
-
-
-def manage_object_recycling():
-    """Alternative recycling logic using different threshold checks"""
-    player_y = player.get_y()
-    threshold = player_y - RECYCLE_DISTANCE
-    spawn_pos = player_y + SPAWN_AHEAD
-    
-    # Recycle collectibles
-    for item in world.collectibles:
-        if item['pos'][1] < threshold:
-            item['pos'][0] = random.uniform(-500, 500)
-            item['pos'][1] = spawn_pos
-            item['pos'][2] = random.uniform(100, 300)
-            item['taken'] = False
-    
-    # Recycle hazards
-    for hazard in world.hazards:
-        if hazard['pos'][1] < threshold:
-            hazard['pos'][0] = random.uniform(-600, 600)
-            hazard['pos'][1] = spawn_pos
-            hazard['pos'][2] = random.uniform(50, 400)
-            hazard['variant'] = random.choice(['cloud', 'rock', 'balloon'])
-    
-    # Recycle hostiles with proximity-based spawning
-    for hostile in world.hostiles:
-        should_recycle = hostile['pos'][1] < threshold or not hostile['alive']
-        if should_recycle:
-            hostile['pos'][0] = player.get_x() + random.uniform(-300, 300)
-            hostile['pos'][1] = player.get_y() + random.uniform(300, 800)
-            hostile['pos'][2] = player.get_z() + random.uniform(-100, 100)
-            hostile['alive'] = True
-    
-    # Recycle pickups
-    for pickup in world.pickups:
-        if pickup['pos'][1] < threshold or pickup['taken']:
-            pickup['pos'][0] = random.uniform(-300, 300)
-            pickup['pos'][1] = spawn_pos
-            pickup['pos'][2] = random.uniform(100, 250)
-            pickup['taken'] = False
+def propeller_mount():
+    """Propeller placement and spin relative to the aircraft"""
+    return (('translate', 0, 45, 0), ('rotate', sim.player.prop_spin, 0, 1, 0))
 
 
 def render_player_vehicle():
-    """Draw player aircraft with alternative rendering approach"""
-    glPushMatrix()
-    glTranslatef(*player.position)
-    glRotatef(player.angles[2], 0, 0, 1)
-    glRotatef(player.angles[1], 1, 0, 0)
-    glRotatef(player.angles[0], 0, 1, 0)
-    
-    # Body - using different scaling approach
-    glPushMatrix()
-    glColor3f(0.75, 0.75, 0.75)
-    glScalef(1, 3, 0.5)
-    glutSolidCube(30)
-    glPopMatrix()
-    
-    # Wings - scaled differently
-    glPushMatrix()
-    glColor3f(0.85, 0.85, 0.85)
-    glScalef(5, 0.3, 0.2)
-    glutSolidCube(30)
-    glPopMatrix()
-    
-    # Vertical tail
-    glPushMatrix()
-    glTranslatef(0, -35, 10)
-    glColor3f(0.65, 0.65, 0.65)
-    glScalef(0.2, 0.5, 1.5)
-    glutSolidCube(30)
-    glPopMatrix()
-    
-    # Horizontal tail
-    glPushMatrix()
-    glTranslatef(0, -35, 5)
-    glColor3f(0.65, 0.65, 0.65)
-    glScalef(2, 0.3, 0.2)
-    glutSolidCube(20)
-    glPopMatrix()
+    """Queue the player aircraft and its spinning propeller"""
+    pose = (('translate', *sim.player.position),) + player_attitude()
+    draw_queue.add('aircraft', pose)
     
     # Animated propeller with different rotation
-    glPushMatrix()
-    glTranslatef(0, 45, 0)
-    glRotatef(player.prop_spin, 0, 1, 0)
-    glColor3f(0.25, 0.25, 0.25)
-    glScalef(2, 0.1, 0.3)
-    glutSolidCube(25)
-    glPopMatrix()
-    
-    # Cockpit canopy
-    glPushMatrix()
-    glTranslatef(0, 10, 8)
-    glColor3f(0.15, 0.15, 0.55)
-    glutSolidCube(15)
-    glPopMatrix()
-    
-    glPopMatrix()
+    draw_queue.add('propeller', pose + propeller_mount())
 
 
 def render_collectible_ring(item):
@@ -312,59 +275,14 @@ def render_collectible_ring(item):
     if item['taken']:
         return
     
-    glPushMatrix()
-    glTranslatef(*item['pos'])
-    glRotatef(90, 1, 0, 0)
-    
-    
-    # Outer ring cylinder in bright gold color
-    glColor3f(0.0, 0.0, 0.5)   # Navy blue
-
-    gluCylinder(gluNewQuadric(), 80, 80, 20, 20, 5)
-    
-    # Inner ring creating hollow center for flying through
-    glColor3f(0.5, 0.5, 0)
-    gluCylinder(gluNewQuadric(), 60, 60, 20, 20, 5)
-
-    glColor3f(0, 0, 0)
-    gluCylinder(gluNewQuadric(), 40, 40, 20, 20, 5)
-    
-    glPopMatrix()
+    draw_queue.add('ring', (('translate', *item['pos']),), detail_level('ring', item['pos']))
 
 
 def render_hazard_object(hazard):
     """Draw obstacle with different structure"""
-    glPushMatrix()
-    glTranslatef(*hazard['pos'])
-    
+    # Cloud, rock and balloon each have their own model
     variant = hazard['variant']
-    
-    if variant == 'cloud':
-        # Cloud using alternative sphere arrangement
-        glColor3f(0.95, 0.95, 0.95)
-        quad1 = gluNewQuadric()
-        gluSphere(quad1, 40, 10, 10)
-        glTranslatef(30, 0, 0)
-        quad2 = gluNewQuadric()
-        gluSphere(quad2, 35, 10, 10)
-        glTranslatef(-60, 0, 0)
-        quad3 = gluNewQuadric()
-        gluSphere(quad3, 35, 10, 10)
-    elif variant == 'rock':
-        glColor3f(0.45, 0.35, 0.25)
-        glutSolidCube(50)
-    else:  # balloon variant
-        glColor3f(1.0, 0.42, 0.72)   # Pink balloon (slight variation)
-        gluSphere(gluNewQuadric(), 32, 10, 10)
-
-        glPushMatrix()
-        glTranslatef(0, 0, -38)
-        glRotatef(-90, 1, 0, 0)
-        glColor3f(0.9, 0.9, 0.9)    # Light gray tether
-        gluCylinder(gluNewQuadric(), 4, 2, 22, 10, 10)
-        glPopMatrix()
-    
-    glPopMatrix()
+    draw_queue.add(variant, (('translate', *hazard['pos']),), detail_level(variant, hazard['pos']))
 
 
 def render_hostile_vehicle(hostile):
@@ -372,50 +290,12 @@ def render_hostile_vehicle(hostile):
     if not hostile['alive']:
         return
     
-    glPushMatrix()
-    glTranslatef(*hostile['pos'])
-    
-    # Enemy body
-    glPushMatrix()
-    glColor3f(0.85, 0.15, 0.15)
-    glScalef(1, 2, 0.5)
-    glutSolidCube(30)
-    glPopMatrix()
-    
-    # Enemy wings
-    glPushMatrix()
-    glColor3f(0.65, 0.05, 0.05)
-    glScalef(4, 0.3, 0.2)
-    glutSolidCube(25)
-    glPopMatrix()
-    
-    # Enemy tail
-    glPushMatrix()
-    glTranslatef(0, -25, 8)
-    glColor3f(0.55, 0.05, 0.05)
-    glScalef(0.2, 0.4, 1.2)
-    glutSolidCube(25)
-    glPopMatrix()
-    
-    # Marker beacon
-    glPushMatrix()
-    glTranslatef(0, 0, 15)
-    glColor3f(1, 0, 0)
-    marker = gluNewQuadric()
-    gluSphere(marker, 8, 8, 8)
-    glPopMatrix()
-    
-    glPopMatrix()
+    draw_queue.add('hostile', (('translate', *hostile['pos']),), detail_level('hostile', hostile['pos']))
 
 
 def render_missile_projectile(missile):
     """Draw bullet with alternative rendering"""
-    glPushMatrix()
-    glTranslatef(*missile['pos'])
-    glColor3f(1, 0.95, 0)
-    bullet_quad = gluNewQuadric()
-    gluSphere(bullet_quad, 5, 8, 8)
-    glPopMatrix()
+    draw_queue.add('missile', (('translate', *missile['pos']),), detail_level('missile', missile['pos']))
 
 
 def render_pickup_item(pickup):
@@ -423,141 +303,142 @@ def render_pickup_item(pickup):
     if pickup['taken']:
         return
     
-    glPushMatrix()
-    glTranslatef(*pickup['pos'])
-    
-    # Different rotation calculation
-    rotation_z = state.frames * 2
-    rotation_x = state.frames * 1.5
-    glRotatef(rotation_z, 0, 0, 1)
-    glRotatef(rotation_x, 1, 0, 0)
+    # Different rotation calculation, in simulated seconds so the tick rate does not matter
+    rotation_z = sim.state.clock * PICKUP_SPIN_Z
+    rotation_x = sim.state.clock * PICKUP_SPIN_X
     
     # Alternative pulsing calculation
-    pulse_factor = 0.8 + 0.4 * math.sin(state.frames * 0.1)
-    glScalef(pulse_factor, pulse_factor, pulse_factor)
-    glColor3f(0, 0.95, 0.95)
-    glutSolidCube(25)
-    
-    glColor3f(1, 1, 1)
-    glutWireCube(30)
-    
-    glPopMatrix()
+    pulse_factor = 0.8 + 0.4 * math.sin(sim.state.clock * PULSE_FREQUENCY)
+    draw_queue.add('pickup', (('translate', *pickup['pos']), ('rotate', rotation_z, 0, 0, 1),
+                              ('rotate', rotation_x, 1, 0, 0),
+                              ('scale', pulse_factor, pulse_factor, pulse_factor)))
 
 
-def render_explosion_effect(effect):
-    """Draw explosion with different calculation"""
-    glPushMatrix()
-    glTranslatef(*effect['pos'])
+def visible_hazards(variant):
+    """Hazards of one variant inside the view frustum"""
+    hazards = [hazard for hazard in sim.world.hazards if hazard['variant'] == variant]
+    return frustum.visible(variant, hazards, MODEL_RADII[variant])
+
+
+def visible_entities():
+    """Drawable entities of every kind that survive frustum culling"""
+    world = sim.world
+    rings = [ring for ring in world.collectibles if not ring['taken']]
+    hostiles = [hostile for hostile in world.hostiles if hostile['alive']]
+    pickups = [pickup for pickup in world.pickups if not pickup['taken']]
+    return {
+        'ring': frustum.visible('ring', rings, MODEL_RADII['ring']),
+        'hostile': frustum.visible('hostile', hostiles, MODEL_RADII['hostile']),
+        'missile': frustum.visible('missile', list(world.missiles), MODEL_RADII['missile']),
+        'pickup': frustum.visible('pickup', pickups, MODEL_RADII['pickup']),
+    }
+
+
+def render_entities():
+    """Queue every visible entity for material-sorted display list calls"""
+    visible = visible_entities()
+    for ring in visible['ring']:
+        render_collectible_ring(ring)
     
-    # Alternative progress calculation
-    progress_ratio = 1.0 - (effect['timer'] / 30.0)
-    current_size = effect['base_size'] + progress_ratio * 40
+    for variant in HAZARD_TYPES:
+        for hazard in visible_hazards(variant):
+            render_hazard_object(hazard)
     
-    # Different sphere generation
-    sphere_count = 5
-    for idx in range(sphere_count):
-        glPushMatrix()
-        offset_val = random.uniform(-20, 20)
-        glTranslatef(offset_val, offset_val, offset_val)
-        
-        # Alternative color transition
-        r_component = 1.0
-        g_component = 1.0 - progress_ratio
-        b_component = 0.0
-        glColor3f(r_component, g_component, b_component)
-        
-        size_multiplier = 1.0 - idx * 0.2
-        glutSolidSphere(current_size * size_multiplier, 8, 8)
-        glPopMatrix()
+    for hostile in visible['hostile']:
+        render_hostile_vehicle(hostile)
     
-    glPopMatrix()
+    for missile in visible['missile']:
+        render_missile_projectile(missile)
+    
+    for pickup in visible['pickup']:
+        render_pickup_item(pickup)
 
 
-def process_visual_effects():
-    """Update effects with different iteration approach"""
-    effects_to_remove = []
-    for i, effect in enumerate(world.effects):
-        effect['timer'] -= 1
-        if effect['timer'] <= 0:
-            effects_to_remove.append(i)
-    
-    # Remove in reverse order
-    for idx in reversed(effects_to_remove):
-        world.effects.pop(idx)
+def draw_by_level(draw, kind, entities, shape_ops=()):
+    """One batched draw call per level of detail in use for a kind"""
+    levels = [[] for _ in LOD_SCALES]
+    for entity in entities:
+        levels[detail_level(kind, entity['pos'])].append(entity['pos'])
+    for level, positions in enumerate(levels):
+        draw(kind, positions, shape_ops=shape_ops, level=level)
+
+
+def pickup_spin():
+    """The spin and pulse every pickup shares this frame, as mesh ops"""
+    clock = sim.state.clock
+    pulse_factor = 0.8 + 0.4 * math.sin(clock * PULSE_FREQUENCY)
+    return (('rotate', clock * PICKUP_SPIN_Z, 0, 0, 1), ('rotate', clock * PICKUP_SPIN_X, 1, 0, 0),
+            ('scale', pulse_factor, pulse_factor, pulse_factor))
+
+
+def draw_visible_batches(draw):
+    """Hand every visible entity to a batched draw function, grouped by kind and level"""
+    visible = visible_entities()
+    draw_by_level(draw, 'ring', visible['ring'])
+    for variant in HAZARD_TYPES:
+        draw_by_level(draw, variant, visible_hazards(variant))
+    draw_by_level(draw, 'hostile', visible['hostile'])
+    draw_by_level(draw, 'missile', visible['missile'])
+    draw_by_level(draw, 'pickup', visible['pickup'], shape_ops=pickup_spin())
+
+
+def render_entities_instanced():
+    """Draw each entity kind with one instanced call per mesh and detail level"""
+    instanced.begin()
+    draw_visible_batches(instanced.draw)
+    instanced.end()
+
+
+def render_entities_shaded():
+    """Draw the player and every visible entity from one buffer of model matrices"""
+    if cam.view_mode != 1:
+        position = [sim.player.position]
+        attitude = player_attitude()
+        shaded.queue('aircraft', position, attitude)
+        shaded.queue('propeller', position, attitude + propeller_mount())
+    draw_visible_batches(shaded.queue)
+    shaded.flush()
 
 
 def render_terrain_surface():
-    """Draw ground with alternative approach"""
-    # Main ground
-    glBegin(GL_QUADS)
-    glColor3f(0.15, 0.55, 0.15)
-    glVertex3f(-WORLD_LIMIT, -WORLD_LIMIT, 0)
-    glVertex3f(WORLD_LIMIT, -WORLD_LIMIT, 0)
-    glVertex3f(WORLD_LIMIT, WORLD_LIMIT, 0)
-    glVertex3f(-WORLD_LIMIT, WORLD_LIMIT, 0)
-    glEnd()
-    
-    # Grid using different calculation
-    glColor3f(0.05, 0.35, 0.05)
-    glLineWidth(1)
-    cell_size = (WORLD_LIMIT * 2) / GRID_LINES
-    
-    glBegin(GL_LINES)
-    line_count = GRID_LINES + 1
-    for i in range(line_count):
-        coord = -WORLD_LIMIT + i * cell_size
-        # Horizontal lines
-        glVertex3f(-WORLD_LIMIT, coord, 0)
-        glVertex3f(WORLD_LIMIT, coord, 0)
-        # Vertical lines
-        glVertex3f(coord, -WORLD_LIMIT, 0)
-        glVertex3f(coord, WORLD_LIMIT, 0)
-    glEnd()
-    
-    # Mountains with different positioning
-    mountain_count = 5
-    for i in range(mountain_count):
-        glPushMatrix()
-        x_pos = -800 + i * 400
-        y_pos = -800
-        glTranslatef(x_pos, y_pos, 50)
-        glColor3f(0.35, 0.25, 0.15)
-        glScalef(1, 1, 2)
-        glutSolidCube(100)
-        glPopMatrix()
+    """Draw the baked ground, grid and mountains with one call"""
+    models.draw('terrain')
+    # The baked list sets its own colours
+    gl_state.forget_color()
 
 
 def render_sky_gradient():
     """Draw sky with alternative setup"""
-    glDisable(GL_DEPTH_TEST)
-    glMatrixMode(GL_PROJECTION)
+    gl_state.disable(GL_DEPTH_TEST)
+    gl_state.matrix_mode(GL_PROJECTION)
     glPushMatrix()
     glLoadIdentity()
     gluOrtho2D(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT)
     
-    glMatrixMode(GL_MODELVIEW)
+    gl_state.matrix_mode(GL_MODELVIEW)
     glPushMatrix()
     glLoadIdentity()
     
     # Gradient with different colors
     glBegin(GL_QUADS)
-    glColor3f(0.35, 0.55, 0.85)
+    gl_state.color((0.35, 0.55, 0.85))
     glVertex2f(0, WINDOW_HEIGHT)
     glVertex2f(WINDOW_WIDTH, WINDOW_HEIGHT)
-    glColor3f(0.65, 0.75, 0.95)
+    gl_state.color((0.65, 0.75, 0.95))
     glVertex2f(WINDOW_WIDTH, 400)
     glVertex2f(0, 400)
     glEnd()
     
     glPopMatrix()
-    glMatrixMode(GL_PROJECTION)
+    gl_state.matrix_mode(GL_PROJECTION)
     glPopMatrix()
-    glMatrixMode(GL_MODELVIEW)
-    glEnable(GL_DEPTH_TEST)
+    gl_state.matrix_mode(GL_MODELVIEW)
+    gl_state.enable(GL_DEPTH_TEST)
 
 
 def render_interface():
     """Draw HUD with completely rewritten text and layout"""
+    state = sim.state
     glDisable(GL_DEPTH_TEST)
     glMatrixMode(GL_PROJECTION)
     glPushMatrix()
@@ -568,12 +449,25 @@ def render_interface():
     glPushMatrix()
     glLoadIdentity()
     
+    # Suspension backdrop goes under the text
+    if state.active and state.suspended:
+        glColor3f(0, 0, 0)
+        glBegin(GL_QUADS)
+        glVertex2f(0, 0)
+        glVertex2f(WINDOW_WIDTH, 0)
+        glVertex2f(WINDOW_WIDTH, WINDOW_HEIGHT)
+        glVertex2f(0, WINDOW_HEIGHT)
+        glEnd()
+    
+    if hud_text.atlas.ready:
+        hud_text.begin()
+    
     # Welcome screen with different text
     if not state.active:
         glColor3f(1, 1, 0)
         show_text(280, 500, "AERIAL COMBAT ADVENTURE")
         
-        blink = 0.5 + 0.5 * math.sin(state.frames * 0.1)
+        blink = 0.5 + 0.5 * math.sin(state.clock * PULSE_FREQUENCY)
         glColor3f(blink, blink, blink)
         show_text(330, 400, "Hit ENTER to Begin Mission")
         
@@ -593,14 +487,6 @@ def render_interface():
     
     # Suspension overlay with different text
     elif state.suspended:
-        glColor3f(0, 0, 0)
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0)
-        glVertex2f(WINDOW_WIDTH, 0)
-        glVertex2f(WINDOW_WIDTH, WINDOW_HEIGHT)
-        glVertex2f(0, WINDOW_HEIGHT)
-        glEnd()
-        
         glColor3f(1, 1, 0)
         show_text(380, 450, "-- MISSION SUSPENDED --")
         glColor3f(1, 1, 1)
@@ -608,32 +494,32 @@ def render_interface():
         show_text(330, 370, "N: New Mission")
         
         glColor3f(0.7, 0.7, 0.7)
-        show_text(350, 320, f"Mission Score: {state.score}")
-        show_text(350, 290, f"Craft Integrity: {state.lives}")
-        show_text(350, 260, f"Difficulty Tier: {state.difficulty}")
+        show_text(350, 320, "Mission Score: {}", state.score)
+        show_text(350, 290, "Craft Integrity: {}", state.lives)
+        show_text(350, 260, "Difficulty Tier: {}", state.difficulty)
     
     # Mission HUD with different terminology
     elif state.active and not state.finished:
         glColor3f(1, 1, 1)
-        show_text(10, 770, f"Mission Score: {state.score}")
-        show_text(10, 740, f"Hull Status: {state.lives}")
-        show_text(10, 710, f"Threat Level: {state.difficulty}")
-        show_text(10, 680, f"Airspeed: {player.velocity[2]:.1f}")
+        show_text(10, 770, "Mission Score: {}", state.score)
+        show_text(10, 740, "Hull Status: {}", state.lives)
+        show_text(10, 710, "Threat Level: {}", state.difficulty)
+        show_text(10, 680, "Airspeed: {:.1f}", sim.player.velocity[2])
         
         if state.enemy_hits > 0:
             glColor3f(1, 0.5, 0)
-            show_text(10, 650, f"Hull Damage: {state.enemy_hits}/5 - CRITICAL WARNING!")
+            show_text(10, 650, "Hull Damage: {}/5 - CRITICAL WARNING!", state.enemy_hits)
         else:
             glColor3f(0.7, 0.7, 0.7)
-            show_text(10, 650, f"Hull Damage: {state.enemy_hits}/5")
+            show_text(10, 650, "Hull Damage: {}/5", state.enemy_hits)
         
         glColor3f(0, 1, 0)
-        show_text(10, 620, f"Hostiles Neutralized: {state.total_kills}")
+        show_text(10, 620, "Hostiles Neutralized: {}", state.total_kills)
         
         if state.boost_duration > 0:
             glColor3f(1, 0.95, 0)
-            seconds_left = state.boost_duration // 60
-            show_text(10, 590, f"BOOST ENGAGED! {seconds_left}s - SHIELD ACTIVE!")
+            seconds_left = int(state.boost_duration)
+            show_text(10, 590, "BOOST ENGAGED! {}s - SHIELD ACTIVE!", seconds_left)
             glColor3f(0, 0.95, 0)
             show_text(10, 560, "MAXIMUM THRUST! Demolishing debris!")
         
@@ -645,12 +531,12 @@ def render_interface():
         
         if state.streak > 1:
             glColor3f(1, 1, 0)
-            show_text(400, 600, f"{state.streak}x MULTIPLIER ACTIVE!")
+            show_text(400, 600, "{}x MULTIPLIER ACTIVE!", state.streak)
             
             if state.streak_timeout > 0:
-                timer_ratio = state.streak_timeout / 180.0
+                timer_ratio = state.streak_timeout / STREAK_WINDOW
                 glColor3f(1 - timer_ratio, timer_ratio, 0)
-                show_text(400, 570, f"Multiplier Decay: {state.streak_timeout//60}s")
+                show_text(400, 570, "Multiplier Decay: {}s", int(state.streak_timeout))
         
         view_labels = ["Tail Camera", "Pilot View", "Wing Camera"]
         glColor3f(1, 0.95, 0)
@@ -660,10 +546,13 @@ def render_interface():
     if state.finished:
         glColor3f(1, 0, 0)
         show_text(380, 400, "MISSION FAILED!")
-        show_text(330, 370, f"Total Score: {state.score}")
-        show_text(330, 340, f"Enemies Eliminated: {state.total_kills}")
+        show_text(330, 370, "Total Score: {}", state.score)
+        show_text(330, 340, "Enemies Eliminated: {}", state.total_kills)
         show_text(330, 310, "Press N for New Mission")
     
+    if hud_text.atlas.ready:
+        hud_text.end()
+    
     glPopMatrix()
     glMatrixMode(GL_PROJECTION)
     glPopMatrix()
@@ -671,436 +560,140 @@ def render_interface():
     glEnable(GL_DEPTH_TEST)
 
 
-def show_text(x, y, message):
-    """Display text using alternative method"""
-    glRasterPos2f(x, y)
-    for ch in message:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+def draw_call_count():
+    """GL draw calls issued for the last frame's 3D view: sky, terrain, entities and effects"""
+    calls = 2 + draw_queue.submitted + sprites.draw_calls
+    if instanced is not None:
+        calls += instanced.draw_calls
+    if shaded is not None:
+        calls += shaded.draw_calls
+    return calls
 
 
-def physics_update():
-    """Update player physics with alternative logic"""
-    if state.finished:
-        return
-    
-    # Propeller animation with different increment
-    player.prop_spin = (player.prop_spin + 20) % 360
-    
-    # Yaw stabilization
-    player.angles[2] = 0
-
-    # Forward motion with boost multiplier
-    speed_multiplier = 5 if state.boost_duration > 0 else 1
-    player.position[1] += state.base_speed * speed_multiplier
-    
-    # Apply velocities using different approach
-    player.position[0] += player.velocity[0]
-    player.position[2] += player.velocity[1]
-    
-    # Roll-induced lateral drift with alternative calculation
-    roll_rad = math.radians(player.angles[0])
-    drift = player.velocity[2] * math.sin(roll_rad) * 0.3
-    player.position[0] += drift
-    
-    # Pitch-induced vertical movement
-    pitch_rad = math.radians(player.angles[1])
-    climb = player.velocity[2] * math.sin(pitch_rad) * 0.5
-    player.position[2] += climb
-    
-    # Damping with different factors
-    player.velocity[0] = apply_damping(player.velocity[0], 0.85)
-    player.velocity[1] = apply_damping(player.velocity[1], 0.90)
-    
-    # Auto-stabilization using alternative threshold
-    threshold_roll = 1
-    if abs(player.angles[0]) > threshold_roll:
-        player.angles[0] = apply_damping(player.angles[0], 0.95)
-    else:
-        player.angles[0] = 0
-    
-    threshold_pitch = 1
-    if abs(player.angles[1]) > threshold_pitch:
-        player.angles[1] = apply_damping(player.angles[1], 0.98)
-    else:
-        player.angles[1] = 0
-    
-    # Ground collision with different bounds
-    min_altitude = 20
-    if player.position[2] < min_altitude:
-        player.position[2] = min_altitude
-        player.angles[1] = max(player.angles[1], 0)
+def render_performance_overlay():
+    """Frame timings, draw calls and entity counts over the right of the HUD"""
+    glDisable(GL_DEPTH_TEST)
+    glMatrixMode(GL_PROJECTION)
+    glPushMatrix()
+    glLoadIdentity()
+    gluOrtho2D(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT)
     
-    # Ceiling with different limit
-    max_altitude = 500
-    if player.position[2] > max_altitude:
-        player.position[2] = max_altitude
-        player.angles[1] = min(player.angles[1], 0)
+    glMatrixMode(GL_MODELVIEW)
+    glPushMatrix()
+    glLoadIdentity()
     
-    # Horizontal boundaries using different approach
-    left_bound = -1000
-    right_bound = 1000
-    if player.position[0] < left_bound:
-        player.position[0] = left_bound
-        player.angles[0] = max(player.angles[0], 0)
-    elif player.position[0] > right_bound:
-        player.position[0] = right_bound
-        player.angles[0] = min(player.angles[0], 0)
+    overlay.draw_graph()
     
-    # Boost timer countdown
-    if state.boost_duration > 0:
-        state.boost_duration -= 1
-        if state.boost_duration == 0:
-            player.velocity[2] = state.base_speed
+    if hud_text.atlas.ready:
+        hud_text.begin()
     
-    # Streak timer with different logic
-    if state.streak_timeout > 0:
-        state.streak_timeout -= 1
-        if state.streak_timeout == 0:
-            state.streak = 0
-            print("Multiplier expired!")
-
-
-def ai_behavior_update():
-    """Update enemy AI with alternative pursuit logic"""
-    for hostile in world.hostiles:
-        if not hostile['alive']:
-            continue
-        
-        # Calculate vector to player
-        target_x = player.get_x()
-        target_y = player.get_y()
-        target_z = player.get_z()
-        
-        dx = target_x - hostile['pos'][0]
-        dy = target_y - hostile['pos'][1]
-        dz = target_z - hostile['pos'][2]
-        
-        # Distance calculation
-        dist = math.sqrt(dx * dx + dy * dy + dz * dz)
-        
-        if dist > 0:
-            # Normalize direction
-            norm_x = dx / dist
-            norm_y = dy / dist
-            norm_z = dz / dist
-            
-            # Speed calculation with difficulty scaling
-            chase_vel = 0.5 + (state.difficulty * 0.1)
-            
-            # Apply movement
-            hostile['pos'][0] += norm_x * chase_vel
-            hostile['pos'][1] += norm_y * chase_vel
-            hostile['pos'][2] += norm_z * chase_vel
-            
-            # Evasive pattern with different formula
-            time_factor = state.frames * 0.05
-            position_factor = hostile['pos'][1] * 0.005
-            evade_x = math.sin(time_factor + position_factor) * 3
-            hostile['pos'][0] += evade_x
-            
-            time_factor2 = state.frames * 0.04
-            position_factor2 = hostile['pos'][0] * 0.005
-            evade_z = math.cos(time_factor2 + position_factor2) * 2
-            hostile['pos'][2] += evade_z
-
-
-def projectile_physics():
-    """Update missiles with alternative logic"""
-    missiles_to_remove = []
+    # Rounded so the cached lines are only laid out again when a digit changes
+    times = {name: round(seconds * 1000, 1) for name, seconds in overlay.averages().items()}
+    fps = round(1000 / times['frame']) if times['frame'] else 0
+    glColor3f(1, 1, 1)
+    show_text(500, 490, "FPS: {}  Frame: {} ms  Budget: {} ms", fps, times['frame'],
+              round(overlay.budget * 1000, 1))
+    for row, phase in enumerate(('sim', 'render', 'swap')):
+        glColor3f(*PHASE_COLORS[phase])
+        show_text(500 + row * 160, 460, phase.capitalize() + ": {} ms", times[phase])
     
-    for i, missile in enumerate(world.missiles):
-        # Extract direction components
-        dx = missile['dir'][0]
-        dy = missile['dir'][1]
-        dz = missile['dir'][2]
-        
-        # Apply velocity
-        speed = missile['vel']
-        missile['pos'][0] += dx * speed
-        missile['pos'][1] += dy * speed
-        missile['pos'][2] += dz * speed
-        
-        # Range check using different calculation
-        offset_x = missile['pos'][0] - player.get_x()
-        offset_y = missile['pos'][1] - player.get_y()
-        offset_z = missile['pos'][2] - player.get_z()
-        travel_dist = math.sqrt(offset_x**2 + offset_y**2 + offset_z**2)
-        
-        if travel_dist > missile['range']:
-            missiles_to_remove.append(i)
-            continue
-        
-        # Collision detection with different approach
-        for hostile in world.hostiles:
-            if not hostile['alive']:
-                continue
-            
-            hit_dx = missile['pos'][0] - hostile['pos'][0]
-            hit_dy = missile['pos'][1] - hostile['pos'][1]
-            hit_dz = missile['pos'][2] - hostile['pos'][2]
-            hit_dist = math.sqrt(hit_dx**2 + hit_dy**2 + hit_dz**2)
-            
-            hit_radius = 40
-            if hit_dist < hit_radius:
-                world.effects.append(spawn_effect(*hostile['pos']))
-                hostile['alive'] = False
-                missiles_to_remove.append(i)
-                state.score += 100
-                state.total_kills += 1
-                print(f"Target destroyed! +100 | Total neutralized: {state.total_kills}")
-                break
+    glColor3f(1, 1, 1)
+    show_text(500, 430, "Draw calls: {}  Render scale: {}", draw_call_count(),
+              resolution.scale if resolution is not None else 1.0)
+    # Entities alive per kind, and per model how many survived culling
+    glColor3f(0.8, 0.8, 0.8)
+    for row, kind in enumerate(ENTITY_KINDS):
+        show_text(500, 400 - row * 25, kind.capitalize() + ": {}", len(getattr(sim.world, kind)))
+    show_text(500, 400 - len(ENTITY_KINDS) * 25, "Particles: {}", len(particles))
+    for row, name in enumerate(sorted(frustum.submitted)):
+        show_text(700, 400 - row * 25, name.capitalize() + ": {} drawn, {} culled",
+                  frustum.submitted[name], frustum.culled.get(name, 0))
+    
+    if hud_text.atlas.ready:
+        hud_text.end()
     
-    # Remove missiles in reverse
-    for idx in reversed(missiles_to_remove):
-        if idx < len(world.missiles):
-            world.missiles.pop(idx)
+    glPopMatrix()
+    glMatrixMode(GL_PROJECTION)
+    glPopMatrix()
+    glMatrixMode(GL_MODELVIEW)
+    glEnable(GL_DEPTH_TEST)
 
 
-def collision_detection():
-    """Check collisions with alternative detection logic"""
-    if state.finished:
+def show_text(x, y, template, *values):
+    """Display a HUD line, formatting template with values only when they changed"""
+    if hud_text.atlas.ready:
+        hud_text.draw(x, y, template, values)
         return
-    
-    px, py, pz = player.position
-    
-    # Ring collection with combo system
-    for ring in world.collectibles:
-        if ring['taken']:
-            continue
-        
-        rx, ry, rz = ring['pos']
-        dist = distance_3d(px, py, pz, rx, ry, rz)
-        
-        collection_radius = 80
-        if dist < collection_radius:
-            ring['taken'] = True
-            
-            # Combo logic with different order check
-            is_forward = ry > state.last_collected_y
-            if is_forward:
-                state.streak += 1
-                state.streak_timeout = 180
-                state.last_collected_y = ry
-                
-                base_value = 100
-                multiplier = state.streak
-                points_earned = base_value * multiplier
-                state.score += points_earned
-                
-                print(f"{state.streak}x CHAIN! +{points_earned} points")
-            else:
-                state.streak = 0
-                state.streak_timeout = 0
-                state.score += 100
-    
-    # Hazard collisions with alternative logic
-    hazards_to_remove = []
-    for idx, hazard in enumerate(world.hazards):
-        hx, hy, hz = hazard['pos']
-        dist = distance_3d(px, py, pz, hx, hy, hz)
-        
-        # Skip non-solid hazards
-        if hazard['variant'] == 'cloud':
-            continue
-        
-        collision_size = 40
-        if dist < collision_size:
-            if state.boost_duration > 0:
-                hazards_to_remove.append(idx)
-                world.effects.append(spawn_effect(hx, hy, hz))
-                state.score += 50
-            else:
-                state.streak = 0
-                state.streak_timeout = 0
-                handle_crash()
-                hazards_to_remove.append(idx)
-            break
-    
-    # Remove hazards
-    for idx in reversed(hazards_to_remove):
-        world.hazards.pop(idx)
-    
-    # Enemy collisions with different handling
-    for hostile in world.hostiles:
-        if not hostile['alive']:
-            continue
-        
-        ex, ey, ez = hostile['pos']
-        dist = distance_3d(px, py, pz, ex, ey, ez)
-        
-        collision_threshold = 35
-        if dist < collision_threshold:
-            invincible = state.boost_duration > 0 or state.cheat_enabled
-            if invincible:
-                hostile['alive'] = False
-                world.effects.append(spawn_effect(ex, ey, ez))
-                state.score += 150
-                state.total_kills += 1
-                print(f"Direct hit! +150 | Total neutralized: {state.total_kills}")
-            else:
-                state.enemy_hits += 1
-                hostile['alive'] = False
-                
-                world.effects.append(spawn_effect(ex, ey, ez))
-                print(f"IMPACT! Damage sustained {state.enemy_hits}/5")
-                
-                max_hits = 5
-                if state.enemy_hits >= max_hits:
-                    state.streak = 0
-                    state.streak_timeout = 0
-                    handle_crash()
-                    state.enemy_hits = 0
-            break
-    
-    # Pickup collection with different approach
-    for pickup in world.pickups:
-        if pickup['taken']:
-            continue
-        
-        px_item, py_item, pz_item = pickup['pos']
-        dist = distance_3d(px, py, pz, px_item, py_item, pz_item)
-        
-        if dist < pickup['radius']:
-            pickup['taken'] = True
-            state.boost_duration = 420
-            player.velocity[2] = state.base_speed * 5
-            
-            world.effects.append(spawn_effect(px_item, py_item, pz_item))
-            
-            state.score += 200
-            print("BOOST ACQUIRED! Maximum velocity and shields engaged!")
-
-
-def handle_crash():
-    """Process crash with alternative logic"""
-    state.lives -= 1
-    print(f"HULL BREACH! Remaining integrity: {state.lives}")
-    
-    if state.lives <= 0:
-        state.finished = True
-        print(f"MISSION TERMINATED! Total score: {state.score} | Hostiles neutralized: {state.total_kills}")
-    else:
-        # Reset position using different method
-        player.set_position(0, 0, 50)
-        player.angles = [0, 0, 0]
-
-
-def difficulty_progression():
-    """Scale difficulty with different calculation"""
-    points_per_level = 500
-    new_difficulty = 1 + (state.score // points_per_level)
-    
-    if new_difficulty > state.difficulty:
-        state.difficulty = new_difficulty
-        state.base_speed += 0.5
-        player.velocity[2] = state.base_speed
-        
-        # Spawn enemies differently
-        spawn_count = 1
-        for _ in range(spawn_count):
-            new_enemy = spawn_hostile(
-                random.uniform(-400, 400),
-                player.get_y() + random.uniform(300, 600),
-                random.uniform(150, 350)
-            )
-            world.hostiles.append(new_enemy)
-        
-        print(f"THREAT LEVEL {new_difficulty}! Enhanced velocity, additional hostiles detected!")
+    # No framebuffer support for the atlas: fall back to per-character bitmaps
+    glRasterPos2f(x, y)
+    for ch in template.format(*values) if values else template:
+        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
 
 
-def launch_weapon():
-    """Fire projectile with alternative direction calculation"""
-    pitch = player.angles[1]
-    pitch_rad = math.radians(pitch)
-    
-    # Direction vector components
-    dir_x = 0
-    dir_y = math.cos(pitch_rad)
-    dir_z = math.sin(pitch_rad)
-    
-    # Spawn position offset
-    spawn_x = player.get_x()
-    spawn_y = player.get_y() + 50
-    spawn_z = player.get_z() + 20
-    
-    missile = spawn_missile(spawn_x, spawn_y, spawn_z, [dir_x, dir_y, dir_z])
-    world.missiles.append(missile)
+def reshape_handler(width, height):
+    """Track the window size; the 3D view and HUD stretch to fill it"""
+    window_size[0] = max(1, width)
+    window_size[1] = max(1, height)
+    glViewport(0, 0, window_size[0], window_size[1])
 
 
 def keyboard_handler(key, mx, my):
     """Handle keyboard with completely different key mappings"""
     # Start screen handling - Changed from SPACE to ENTER (key 13)
-    if not state.active:
+    if not sim.state.active:
         if key == b'\r':  # Enter key
-            state.active = True
+            sim.state.active = True
         return
     
     # Pause toggle - Changed from 'p' to ESC (key 27)
     if key == b'\x1b':  # ESC key
-        state.suspended = not state.suspended
+        sim.state.suspended = not sim.state.suspended
         return
     
     # Pause menu actions - Changed from 'r' to 'n'
-    if state.suspended:
+    if sim.state.suspended:
         if key == b'n':
             restart_game()
         return
     
     # Game over actions - Changed from 'r' to 'n'
-    if state.finished:
+    if sim.state.finished:
         if key == b'n':
             restart_game()
         return
     
     # Flight controls - COMPLETELY DIFFERENT KEY LAYOUT
     # Changed from WASD to IJKL
-    if key == b'i':  # Climb (was 'w')
-        player.angles[1] = clamp_value(player.angles[1] + 5, -25, 25)
-        player.velocity[1] += 3
-    elif key == b'k':  # Dive (was 's')
-        player.angles[1] = clamp_value(player.angles[1] - 5, -25, 25)
-        player.velocity[1] -= 3
-    elif key == b'j':  # Bank left (was 'a')
-        player.angles[0] = clamp_value(player.angles[0] + 8, -35, 35)
-        player.velocity[0] -= 4
-    elif key == b'l':  # Bank right (was 'd')
-        player.angles[0] = clamp_value(player.angles[0] - 8, -35, 35)
-        player.velocity[0] += 4
-    elif key == b'u':  # Direct left strafe (was 'q')
-        player.velocity[0] -= 8
-    elif key == b'o':  # Direct right strafe (was 'e')
-        player.velocity[0] += 8
+    if key in FLIGHT_KEYS:
+        sim.apply_input(FLIGHT_KEYS[key])
     
     # Action commands
     if key == b'f':  # Fire weapon (was SPACE)
-        launch_weapon()
+        sim.apply_input('fire')
     elif key == b'v':  # Cycle camera views (was 'c')
         cam.cycle()
     elif key == b'g':  # Toggle invincibility cheat (was 'x')
-        state.cheat_enabled = not state.cheat_enabled
-        print("GOD MODE ACTIVATED!" if state.cheat_enabled else "God mode deactivated")
+        sim.apply_input('toggle_cheat')
     elif key == b'n':  # Manual restart
         restart_game()
 
 
 def special_keys_handler(key, mx, my):
     """Handle special keys - Arrow keys remain for accessibility"""
-    if state.finished:
+    # Performance tools work on every screen
+    if key == GLUT_KEY_F3:
+        overlay.toggle()
+        return
+    if key == GLUT_KEY_F4:
+        write_trace()
+        return
+    
+    if sim.state.finished:
         return
     
     # Arrow key controls kept as alternative
-    if key == GLUT_KEY_UP:
-        player.angles[1] = clamp_value(player.angles[1] + 4, -25, 25)
-        player.velocity[1] += 2
-    elif key == GLUT_KEY_DOWN:
-        player.angles[1] = clamp_value(player.angles[1] - 4, -25, 25)
-        player.velocity[1] -= 2
-    elif key == GLUT_KEY_LEFT:
-        player.angles[0] = clamp_value(player.angles[0] + 6, -35, 35)
-        player.velocity[0] -= 3
-    elif key == GLUT_KEY_RIGHT:
-        player.angles[0] = clamp_value(player.angles[0] - 6, -35, 35)
-        player.velocity[0] += 3
+    if key in ARROW_KEYS:
+        sim.apply_input(ARROW_KEYS[key])
 
 
 def mouse_handler(button, button_state, mx, my):
@@ -1108,24 +701,24 @@ def mouse_handler(button, button_state, mx, my):
     is_pressed = button_state == GLUT_DOWN
     
     if button == GLUT_LEFT_BUTTON and is_pressed:
-        if not state.finished:
-            launch_weapon()
+        if not sim.state.finished:
+            sim.apply_input('fire')
     elif button == GLUT_RIGHT_BUTTON and is_pressed:
         cam.cycle()
 
 
 def setup_camera_view():
     """Configure camera with alternative calculation"""
-    glMatrixMode(GL_PROJECTION)
+    gl_state.matrix_mode(GL_PROJECTION)
     glLoadIdentity()
-    aspect_ratio = WINDOW_WIDTH / WINDOW_HEIGHT
-    gluPerspective(CAMERA_FOV, aspect_ratio, 0.1, 5000)
+    aspect_ratio = window_size[0] / window_size[1]
+    gluPerspective(CAMERA_FOV, aspect_ratio, 0.1, cam.draw_distance)
     
-    glMatrixMode(GL_MODELVIEW)
+    gl_state.matrix_mode(GL_MODELVIEW)
     glLoadIdentity()
     
     mode = cam.view_mode
-    px, py, pz = player.position
+    px, py, pz = sim.player.position
     
     if mode == 0:  # Third person view
         distance_back = 300
@@ -1142,15 +735,15 @@ def setup_camera_view():
         cam_y = py - 20
         cam_z = pz + 15
         
-        pitch_angle = math.radians(player.angles[1])
-        yaw_angle = math.radians(player.angles[2])
+        pitch_angle = math.radians(sim.player.angles[1])
+        yaw_angle = math.radians(sim.player.angles[2])
         
         look_distance = 500
         target_x = px + look_distance * math.sin(yaw_angle) * math.cos(pitch_angle)
         target_y = py + look_distance * math.cos(yaw_angle) * math.cos(pitch_angle)
         target_z = pz + look_distance * math.sin(pitch_angle)
         
-        roll_angle = math.radians(player.angles[0])
+        roll_angle = math.radians(sim.player.angles[0])
         up_x = math.sin(roll_angle)
         up_y = 0
         up_z = math.cos(roll_angle)
@@ -1165,99 +758,225 @@ def setup_camera_view():
         cam_z = pz + 200
         
         gluLookAt(cam_x, cam_y, cam_z, px, py, pz, 0, 0, 1)
+    
+    # Level of detail is picked from the distance to the eye
+    cam.eye = (cam_x, cam_y, cam_z)
+
+
+def enable_instancing():
+    """Switch entity drawing to the instanced renderer when the context allows it"""
+    global instanced
+    # Imported here so the shader path is only loaded when asked for
+    from instancing import InstancedRenderer, instancing_supported
+    if not instancing_supported():
+        print("Instanced rendering needs OpenGL 3.3; falling back to display lists")
+        return
+    instanced = InstancedRenderer(models.models, models.palette)
+    instanced.build()
+
+
+def enable_shaders():
+    """Switch the player and entities to the core-profile shader pipeline"""
+    global shaded
+    from instancing import instancing_supported
+    from shader_renderer import ShaderRenderer
+    if not instancing_supported():
+        print("Shader rendering needs OpenGL 3.3; falling back to display lists")
+        return
+    shaded = ShaderRenderer(models.models, models.palette)
+    shaded.build()
+
+
+def instrument_loops(recorder):
+    """Wrap every update phase, render pass and frame callback with recorder's timing"""
+    game = sys.modules[__name__]
+    recorder.instrument(sim, UPDATE_PHASES + ('tick',), 'update.')
+    recorder.instrument(game, RENDER_PASSES, 'render.')
+    recorder.instrument(frustum, ['extract'], 'render.frustum.')
+    recorder.instrument(draw_queue, ['flush'], 'render.draw_queue.')
+    recorder.instrument(sprites, ['draw'], 'render.sprites.')
+    recorder.instrument(scene_target, ['present'], 'render.scene_target.')
+    recorder.instrument(game, ['update_loop'], 'frame.')
+    recorder.instrument(game, ['render_scene'], 'frame.', sample=True)
+
+
+def enable_profiling():
+    """Time every update phase and render pass, sample entity counts each frame, report at exit"""
+    profiler.enabled = True
+    instrument_loops(profiler)
+    
+    for kind in ENTITY_KINDS:
+        profiler.add_gauge('entities.' + kind, lambda kind=kind: len(getattr(sim.world, kind)))
+    profiler.add_gauge('entities.particles', lambda: len(particles))
+    profiler.add_gauge('render.submitted', lambda: frustum.total_submitted)
+    profiler.add_gauge('render.culled', lambda: frustum.total_culled)
+    profiler.add_gauge('render.scale', lambda: resolution.scale if resolution is not None else 1.0)
+    atexit.register(profiler.dump)
+
+
+def enable_tracing(path):
+    """Record the loops, gameplay events and collections as a Chrome trace written to path at exit"""
+    global trace_path
+    trace_path = path
+    tracer.enabled = True
+    instrument_loops(tracer)
+    tracer.instrument(sim, ['handle_crash'], 'gameplay.')
+    tracer.watch(sim, 'difficulty_progression', 'level_up', lambda: sim.state.difficulty)
+    tracer.watch(sim, 'tick', 'mass_kill', lambda: sim.state.total_kills, MASS_KILL_COUNT)
+    tracer.watch_gc()
+    tracer.add_counter('entities', lambda: dict(
+        {kind: len(getattr(sim.world, kind)) for kind in ENTITY_KINDS}, particles=len(particles)))
+    atexit.register(write_trace)
+
+
+def write_trace():
+    """Save the trace recorded so far; bound to F4 and run at exit"""
+    if trace_path is not None:
+        tracer.write(trace_path)
+
+
+def release_resources():
+    """Free GL objects while the window's context still exists"""
+    models.release()
+    hud_text.atlas.release()
+    sprites.release()
+    if instanced is not None:
+        instanced.release()
+    if shaded is not None:
+        shaded.release()
+    scene_target.release()
 
 
 def restart_game():
     """Reset game with alternative initialization"""
-    global state, player, world
-    
-    state = GameState()
-    state.active = True
-    
-    player = Aircraft()
-    
-    world.collectibles.clear()
-    world.hazards.clear()
-    world.hostiles.clear()
-    world.missiles.clear()
-    world.pickups.clear()
-    world.effects.clear()
-    
-    initialize_entities()
+    sim.restart()
+    particles.clear()
+
+
+def advance_simulation():
+    """One fixed tick of the world, then of the explosion puffs it started"""
+    sim.tick()
+    state = sim.state
+    if state.active and not state.suspended:
+        # Bursts age from the tick that started them, so no puff outlives its effect
+        if sim.bursts:
+            particles.emit(list(sim.bursts))
+            sim.bursts.clear()
+        particles.advance(sim.dt)
 
 
 def update_loop():
-    """Main update loop with alternative structure"""
-    state.frames += 1
-    
-    if not state.active or state.suspended:
-        glutPostRedisplay()
-        return
-    
-    if not state.finished:
-        # Auto-fire in cheat mode
-        if state.cheat_enabled:
-            state.weapon_cooldown += 1
-            if state.weapon_cooldown >= 5:
-                launch_weapon()
-                state.weapon_cooldown = 0
-        
-        # Update all systems
-        physics_update()
-        ai_behavior_update()
-        projectile_physics()
-        process_visual_effects()
-        collision_detection()
-        manage_object_recycling()
-        difficulty_progression()
-    
+    """Advance the simulation by however many fixed ticks have elapsed"""
+    with overlay.measure('sim'):
+        scheduler.advance(time.perf_counter(), advance_simulation)
     glutPostRedisplay()
 
 
-def render_scene():
-    """Main render with alternative order"""
+def render_world(size=None):
+    """Draw the 3D view: sky, terrain, player and entities, at size or the window's"""
+    global focal_pixels
+    width, height = size or window_size
+    # Detail follows the pixels actually rendered, after resizing and render scaling
+    focal_pixels = focal_length(height)
+    # The HUD and other passes change GL state directly between frames
+    gl_state.invalidate()
     glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
     glLoadIdentity()
-    glViewport(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+    glViewport(0, 0, width, height)
     
     setup_camera_view()
+    frustum.extract()
     
     render_sky_gradient()
     
-    glEnable(GL_DEPTH_TEST)
+    gl_state.enable(GL_DEPTH_TEST)
     
     render_terrain_surface()
     
-    # Don't render player in first person
-    if cam.view_mode != 1:
-        render_player_vehicle()
-    
-    # Render all entities
-    for ring in world.collectibles:
-        render_collectible_ring(ring)
-    
-    for hazard in world.hazards:
-        render_hazard_object(hazard)
-    
-    for hostile in world.hostiles:
-        render_hostile_vehicle(hostile)
-    
-    for missile in world.missiles:
-        render_missile_projectile(missile)
-    
-    for pickup in world.pickups:
-        render_pickup_item(pickup)
+    if shaded is not None:
+        render_entities_shaded()
+    else:
+        # Don't render player in first person
+        if cam.view_mode != 1:
+            render_player_vehicle()
+        
+        # Render all entities
+        if instanced is not None:
+            render_entities_instanced()
+        else:
+            render_entities()
+        draw_queue.flush()
     
-    for effect in world.effects:
-        render_explosion_effect(effect)
+    # Explosion puffs from every effect in one call, skipped when every explosion is out of view
+    if frustum.visible('effect', list(sim.world.effects), MODEL_RADII['effect']):
+        sprites.draw(particles)
+    else:
+        sprites.draw_calls = 0
+
+
+def render_scene():
+    """Main render with alternative order"""
+    with overlay.measure('render'):
+        if resolution is not None and scene_target.ready:
+            # Scaled 3D view stretched over the window; the HUD stays at full resolution
+            scale = resolution.update(time.perf_counter())
+            size = (max(1, round(window_size[0] * scale)), max(1, round(window_size[1] * scale)))
+            scene_target.bind(*size)
+            render_world(size)
+            scene_target.present(*window_size)
+            glViewport(0, 0, window_size[0], window_size[1])
+        else:
+            render_world()
+        
+        render_interface()
     
-    render_interface()
+    # Drawn outside the render phase so it does not time itself
+    if overlay.visible:
+        render_performance_overlay()
     
-    glutSwapBuffers()
+    with overlay.measure('swap'):
+        glutSwapBuffers()
+    overlay.end_frame()
 
 
-def main():
+def main(argv=None):
     """Entry point with alternative initialization"""
+    global resolution
+    parser = argparse.ArgumentParser(description="Sky Racer - Flight Simulator")
+    parser.add_argument('--renderer', choices=RENDERERS, default='lists',
+                        help="entity drawing path: display lists per entity, instanced batches, "
+                             "or lit core-profile shaders fed one buffer of model matrices")
+    parser.add_argument('--draw-distance', type=float, default=DRAW_DISTANCE,
+                        help="far clip distance in world units; farther entities are culled")
+    parser.add_argument('--palette', choices=sorted(PALETTES), default=DEFAULT_PALETTE,
+                        help="model look; 'classic' has the two-band gold rings and red balloons of edit01.py")
+    parser.add_argument('--target-fps', type=float, default=None,
+                        help="lower the 3D view's render resolution as needed to hold this frame "
+                             "rate (e.g. 30); by default, or with 0, always render at window resolution")
+    parser.add_argument('--min-render-scale', type=float, default=MIN_SCALE,
+                        help="lowest fraction of the window resolution the 3D view may drop to")
+    parser.add_argument('--profile', action='store_true',
+                        help="time every update phase and render pass and print a report at exit")
+    parser.add_argument('--trace', metavar='PATH',
+                        help="record the last few hundred frames as Chrome trace JSON, "
+                             "written to PATH at exit or when F4 is pressed")
+    parser.add_argument('--perf-overlay', action='store_true',
+                        help="start with the frame timing overlay shown (F3 toggles it)")
+    args = parser.parse_args(argv)
+    if args.target_fps is not None and args.target_fps < 0:
+        parser.error("--target-fps must not be negative")
+    if not 0 < args.min_render_scale <= 1:
+        parser.error("--min-render-scale must be greater than 0 and at most 1")
+    cam.draw_distance = args.draw_distance
+    models.models = dict(PALETTE_PARTS[args.palette])
+    models.palette = PALETTES[args.palette]
+    resolution = None
+    if args.target_fps:
+        resolution = ResolutionScaler(1.0 / args.target_fps, args.min_render_scale)
+        overlay.budget = 1.0 / args.target_fps
+    if args.perf_overlay:
+        overlay.toggle()
+    
     glutInit()
     glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGB | GLUT_DEPTH)
     glutInitWindowSize(WINDOW_WIDTH, WINDOW_HEIGHT)
@@ -1267,13 +986,28 @@ def main():
     glEnable(GL_DEPTH_TEST)
     glClearColor(0.45, 0.65, 0.95, 1.0)
     
-    initialize_entities()
+    # Models need the window's GL context, so they are compiled here
+    models.build()
+    hud_text.atlas.build()
+    sprites.build()
+    scene_target.build()
+    if args.renderer == 'instanced':
+        enable_instancing()
+    elif args.renderer == 'shader':
+        enable_shaders()
+    if args.profile:
+        enable_profiling()
+    if args.trace:
+        enable_tracing(args.trace)
     
     glutDisplayFunc(render_scene)
+    glutReshapeFunc(reshape_handler)
     glutKeyboardFunc(keyboard_handler)
     glutSpecialFunc(special_keys_handler)
     glutMouseFunc(mouse_handler)
     glutIdleFunc(update_loop)
+    if bool(glutCloseFunc):
+        glutCloseFunc(release_resources)
     
     glutMainLoop()
 
@@ -0,0 +1,296 @@
+import numpy as np
+
+from entity_store import EntityStore
+from kernels import (squared_distances, resolve_first_hits, resolve_missile_hits, pursue_targets,
+                     segment_sphere_entries, ring_crossings, earliest_first)
+from simulation import (Simulation, HAZARD_TYPES, RECYCLE_DISTANCE, SPAWN_AHEAD,
+                        STREAK_WINDOW, BOOST_TIME, BOOST_MULTIPLIER, MISSILE_RANGE, TIMER_EPSILON,
+                        EFFECT_LIFETIME, PICKUP_RADIUS, MISSILE_SPEED, CHASE_SPEED, CHASE_SPEED_PER_LEVEL, EVADE_X_SPEED,
+                        EVADE_X_FREQUENCY, EVADE_Z_SPEED, EVADE_Z_FREQUENCY)
+
+
+CLOUD = HAZARD_TYPES.index('cloud')
+MISSILE_HIT_RADIUS = 40
+
+
+class ArraySimulation(Simulation):
+    """Simulation whose entities live in NumPy columns and update in bulk"""
+
+    def __init__(self, seed=None, capacity=64, max_pairs=None, broadphase=True, interest=None,
+                 **kwargs):
+        self.capacity = capacity
+        self.max_pairs = max_pairs
+        self.broadphase = broadphase
+        self.interest = interest
+        self.np_rng = np.random.default_rng(seed)
+        super().__init__(seed=seed, **kwargs)
+
+    def create_world(self):
+        return EntityStore(self.capacity, self.broadphase, *self.pool_sizes)
+
+    def add_effect(self, x, y, z):
+        slot = self.world.effects.allocate(x, y, z)
+        if slot is None:
+            return
+        self.world.effects.timer[slot] = EFFECT_LIFETIME
+        self.bursts.append((x, y, z))
+
+    def add_missile(self, x, y, z, dir_x, dir_y, dir_z):
+        missiles = self.world.missiles
+        slot = missiles.allocate(x, y, z)
+        if slot is None:
+            return
+        missiles.vel[slot] = (dir_x * MISSILE_SPEED, dir_y * MISSILE_SPEED, dir_z * MISSILE_SPEED)
+
+    def candidates(self, columns, point, radius):
+        """Slots that need an exact distance test against a point"""
+        if columns.grid is None:
+            return columns.live()
+        return columns.nearby(point[0], point[1], point[2], radius)
+
+    def contacts(self, kind, start, end, radius, test=segment_sphere_entries):
+        """Slots of a kind touched by the path start->end, earliest contact first"""
+        columns = getattr(self.world, kind)
+        step = end - start
+        reach = radius + np.sqrt(step @ step) * 0.5
+        slots = self.candidates(columns, (start + end) * 0.5, reach)
+        entries = test(start, end, columns.pos[slots], radius)
+        touched = np.isfinite(entries)
+        slots = slots[touched]
+        return slots[np.lexsort((slots, entries[touched]))]
+
+    def manage_object_recycling(self):
+        """Respawn every entity that fell behind the player in one pass per kind"""
+        world = self.world
+        rng = self.np_rng
+        px, py, pz = self.player.position
+        threshold = py - RECYCLE_DISTANCE
+        spawn_pos = py + SPAWN_AHEAD
+
+        # Recycle collectibles
+        rings = world.collectibles
+        mask = rings.used & (rings.pos[:, 1] < threshold)
+        count = np.count_nonzero(mask)
+        if count:
+            rings.pos[mask, 0] = rng.uniform(-500, 500, count)
+            rings.pos[mask, 1] = spawn_pos
+            rings.pos[mask, 2] = rng.uniform(100, 300, count)
+            rings.taken[mask] = False
+            rings.refresh(mask)
+
+        # Recycle hazards
+        hazards = world.hazards
+        mask = hazards.used & (hazards.pos[:, 1] < threshold)
+        count = np.count_nonzero(mask)
+        if count:
+            hazards.pos[mask, 0] = rng.uniform(-600, 600, count)
+            hazards.pos[mask, 1] = spawn_pos
+            hazards.pos[mask, 2] = rng.uniform(50, 400, count)
+            hazards.variant[mask] = rng.integers(0, len(HAZARD_TYPES), count)
+            hazards.refresh(mask)
+
+        # Recycle hostiles with proximity-based spawning
+        hostiles = world.hostiles
+        mask = hostiles.used & ((hostiles.pos[:, 1] < threshold) | ~hostiles.alive)
+        count = np.count_nonzero(mask)
+        if count:
+            hostiles.pos[mask, 0] = px + rng.uniform(-300, 300, count)
+            hostiles.pos[mask, 1] = py + rng.uniform(300, 800, count)
+            hostiles.pos[mask, 2] = pz + rng.uniform(-100, 100, count)
+            hostiles.alive[mask] = True
+            hostiles.timer[mask] = 0.0
+            hostiles.refresh(mask)
+
+        # Recycle pickups
+        pickups = world.pickups
+        mask = pickups.used & ((pickups.pos[:, 1] < threshold) | pickups.taken)
+        count = np.count_nonzero(mask)
+        if count:
+            pickups.pos[mask, 0] = rng.uniform(-300, 300, count)
+            pickups.pos[mask, 1] = spawn_pos
+            pickups.pos[mask, 2] = rng.uniform(100, 250, count)
+            pickups.taken[mask] = False
+            pickups.refresh(mask)
+
+    def process_visual_effects(self):
+        """Age every effect at once and free the expired slots"""
+        effects = self.world.effects
+        live = effects.used
+        effects.timer[live] -= self.dt
+        effects.release_mask(live & (effects.timer <= TIMER_EPSILON))
+
+    def ai_behavior_update(self):
+        """Pursuit and evasion for every live hostile in one batched kernel"""
+        state = self.state
+        hostiles = self.world.hostiles
+        active = hostiles.used & hostiles.alive
+
+        # Interest management picks which rows run this tick and how much time each owes
+        if self.interest is None:
+            rows = np.flatnonzero(active)
+            step = self.dt
+        else:
+            player_pos = np.asarray(self.player.position, dtype=float)
+            rows, step = self.interest.plan(hostiles, active, player_pos, state.frames, self.dt)
+
+        chase_vel = (CHASE_SPEED + state.difficulty * CHASE_SPEED_PER_LEVEL) * step
+        pursue_targets(hostiles.pos, rows, self.player.position, chase_vel,
+                       state.clock * EVADE_X_FREQUENCY, state.clock * EVADE_Z_FREQUENCY,
+                       EVADE_X_SPEED, EVADE_Z_SPEED, step)
+
+        updated = np.zeros(hostiles.capacity, dtype=bool)
+        updated[rows] = True
+        hostiles.refresh(updated)
+
+    def projectile_physics(self):
+        """Move all missiles at once, drop those out of range, then test hits"""
+        state = self.state
+        world = self.world
+        missiles = world.missiles
+        hostiles = world.hostiles
+        player_pos = np.asarray(self.player.position, dtype=float)
+
+        live = missiles.used
+        swept = self.sweeps(MISSILE_SPEED * self.dt, MISSILE_HIT_RADIUS)
+        starts = missiles.pos.copy() if swept else missiles.pos
+        missiles.pos[live] += missiles.vel[live] * self.dt
+        out_of_range = squared_distances(missiles.pos, player_pos) > MISSILE_RANGE * MISSILE_RANGE
+        missiles.release_mask(live & out_of_range)
+
+        # Oldest missile claims first, each hostile dies at most once
+        shooters = missiles.live_by_age()
+        if hostiles.grid is None:
+            targets = np.flatnonzero(hostiles.used & hostiles.alive)
+            kwargs = {} if self.max_pairs is None else {'max_pairs': self.max_pairs}
+            hit_missiles, hit_hostiles = resolve_missile_hits(
+                missiles.pos[shooters], hostiles.pos[targets], MISSILE_HIT_RADIUS,
+                missile_start=starts[shooters], **kwargs)
+            victims = targets[hit_hostiles]
+        else:
+            pair_missiles, pair_hostiles = self.missile_pairs(shooters, starts)
+            hit_missiles, victims = resolve_first_hits(pair_missiles, pair_hostiles, hostiles.capacity)
+        if not len(hit_missiles):
+            return
+
+        # Apply every kill's side effects together
+        effect_slots = world.effects.allocate_rows(hostiles.pos[victims])
+        world.effects.timer[effect_slots] = EFFECT_LIFETIME
+        # A refusing pool fills up part way through, so the leading victims got effects
+        self.bursts.extend(map(tuple, hostiles.pos[victims[:len(effect_slots)]].tolist()))
+        hostiles.alive[victims] = False
+        missiles.release_slots(shooters[hit_missiles])
+        state.score += 100 * len(victims)
+        for _ in range(len(victims)):
+            state.total_kills += 1
+            self.log(f"Target destroyed! +100 | Total neutralized: {state.total_kills}")
+
+    def missile_pairs(self, shooters, starts):
+        """Missile/hostile pairs whose flight path came within hit radius, via the hostile grid"""
+        hostiles = self.world.hostiles
+        positions = self.world.missiles.pos[shooters]
+        starts = starts[shooters]
+        steps = positions - starts
+        reaches = MISSILE_HIT_RADIUS + np.sqrt(np.einsum('ij,ij->i', steps, steps)) * 0.5
+        mids = (starts + positions) * 0.5
+        pair_missiles = []
+        pair_hostiles = []
+        for index, ((x, y, z), reach) in enumerate(zip(mids.tolist(), reaches.tolist())):
+            nearby = hostiles.nearby(x, y, z, reach)
+            if len(nearby):
+                pair_missiles.append(np.full(len(nearby), index))
+                pair_hostiles.append(nearby)
+        if not pair_missiles:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+
+        pair_missiles = np.concatenate(pair_missiles)
+        pair_hostiles = np.concatenate(pair_hostiles)
+        alive = hostiles.alive[pair_hostiles]
+        pair_missiles = pair_missiles[alive]
+        pair_hostiles = pair_hostiles[alive]
+        entries = segment_sphere_entries(starts[pair_missiles], positions[pair_missiles],
+                                         hostiles.pos[pair_hostiles], MISSILE_HIT_RADIUS)
+        return earliest_first(pair_missiles, pair_hostiles, entries)
+
+    def collision_detection(self):
+        """Test the player against every entity kind with one distance pass each"""
+        state = self.state
+        player = self.player
+        world = self.world
+        if state.finished:
+            return
+
+        end = np.asarray(player.position, dtype=float)
+        previous = np.asarray(player.previous, dtype=float)
+        step = float(np.sqrt((end - previous) @ (end - previous)))
+
+        # Ring collection with combo system; swept flight has to pass through the ring
+        rings = world.collectibles
+        if self.sweeps(step, 80):
+            slots = self.contacts('collectibles', previous, end, 80, ring_crossings)
+        else:
+            slots = self.contacts('collectibles', end, end, 80)
+        for slot in slots[~rings.taken[slots]]:
+            rings.taken[slot] = True
+            ry = rings.pos[slot, 1]
+            if ry > state.last_collected_y:
+                state.streak += 1
+                state.streak_timeout = STREAK_WINDOW
+                state.last_collected_y = float(ry)
+                points_earned = 100 * state.streak
+                state.score += points_earned
+                self.log(f"{state.streak}x CHAIN! +{points_earned} points")
+            else:
+                state.streak = 0
+                state.streak_timeout = 0
+                state.score += 100
+
+        # Solid hazards: only the first hit counts
+        hazards = world.hazards
+        start = previous if self.sweeps(step, 40) else end
+        slots = self.contacts('hazards', start, end, 40)
+        hits = slots[hazards.variant[slots] != CLOUD]
+        if len(hits):
+            slot = hits[0]
+            if state.boost_duration > 0:
+                self.add_effect(*hazards.pos[slot].tolist())
+                state.score += 50
+            else:
+                state.streak = 0
+                state.streak_timeout = 0
+                self.handle_crash()
+            hazards.release(slot)
+
+        # Enemy collisions: only the first hit counts
+        hostiles = world.hostiles
+        start = previous if self.sweeps(step, 35) else end
+        slots = self.contacts('hostiles', start, end, 35)
+        hits = slots[hostiles.alive[slots]]
+        if len(hits):
+            slot = hits[0]
+            hostiles.alive[slot] = False
+            self.add_effect(*hostiles.pos[slot].tolist())
+            if state.boost_duration > 0 or state.cheat_enabled:
+                state.score += 150
+                state.total_kills += 1
+                self.log(f"Direct hit! +150 | Total neutralized: {state.total_kills}")
+            else:
+                state.enemy_hits += 1
+                self.log(f"IMPACT! Damage sustained {state.enemy_hits}/5")
+                if state.enemy_hits >= 5:
+                    state.streak = 0
+                    state.streak_timeout = 0
+                    self.handle_crash()
+                    state.enemy_hits = 0
+
+        # Pickup collection
+        pickups = world.pickups
+        start = previous if self.sweeps(step, PICKUP_RADIUS) else end
+        slots = self.contacts('pickups', start, end, PICKUP_RADIUS)
+        for slot in slots[~pickups.taken[slots]]:
+            pickups.taken[slot] = True
+            state.boost_duration = BOOST_TIME
+            player.velocity[2] = state.base_speed * BOOST_MULTIPLIER
+            self.add_effect(*pickups.pos[slot].tolist())
+            state.score += 200
+            self.log("BOOST ACQUIRED! Maximum velocity and shields engaged!")
@@ -0,0 +1,131 @@
+import argparse
+import datetime
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+
+from array_simulation import ArraySimulation
+from interest import InterestManager, TIER_NAMES
+from profiling import Profiler
+from simulation import Simulation, ENTITY_COUNTS, ENTITY_KINDS, UPDATE_PHASES
+
+
+BACKENDS = {'dict': Simulation, 'array': ArraySimulation}
+COUNTS = (10, 100, 1000, 10000, 100000)
+FIRE_RATES = (0.0, 12.0)        # missiles per second; 12 matches cheat-mode auto fire
+SEED = 7
+
+
+def run_point(backend, counts, fire_rate, ticks, warmup, time_limit, interest=False):
+    """Tick one world headlessly; returns its rate, per-phase costs and final entity counts
+
+    With interest, array worlds tier their hostiles' AI by distance, and the point
+    also reports the final tier counts and the mean hostiles integrated per tick.
+    """
+    manager = InterestManager() if interest and backend == 'array' else None
+    kwargs = {} if manager is None else {'interest': manager}
+    sim = BACKENDS[backend](seed=SEED, entity_counts=counts, missile_capacity=max(64, int(fire_rate * 2)),
+                            **kwargs)
+    # Never end the mission: crashes still cost what they cost, but ticks keep running
+    sim.state.lives = sys.maxsize
+    fire_due = 0.0
+
+    def step():
+        nonlocal fire_due
+        fire_due += fire_rate * sim.dt
+        shots = int(fire_due)
+        fire_due -= shots
+        sim.step(('fire',) * shots)
+
+    for _ in range(warmup):
+        step()
+
+    profiler = Profiler(enabled=True)
+    profiler.instrument(sim, UPDATE_PHASES + ('tick',))
+    done = 0
+    updated = 0
+    start = time.perf_counter()
+    while done < ticks:
+        step()
+        done += 1
+        if manager is not None:
+            updated += manager.updated
+        if time.perf_counter() - start > time_limit:
+            break
+    seconds = time.perf_counter() - start
+
+    scopes = profiler.stats()['scopes']
+    point = {
+        'ticks': done,
+        'seconds': seconds,
+        'ticks_per_second': done / seconds,
+        'phases': {name: {'mean_us': row['mean'], 'p99_us': row['p99']} for name, row in scopes.items()},
+        'entities': {kind: len(getattr(sim.world, kind)) for kind in ENTITY_KINDS},
+    }
+    if manager is not None:
+        point['tiers'] = dict(manager.counts)
+        point['updated_per_tick'] = updated / done
+    return point
+
+
+def report(point):
+    phases = point['phases']
+    busiest = max(UPDATE_PHASES, key=lambda name: phases[name]['mean_us'])
+    print(f"{point['backend']:<6}{point['kind']:<13}{point['count']:>8}{point['fire_rate']:>7.1f}/s"
+          f"{point['ticks_per_second']:>11.1f} ticks/s   tick {phases['tick']['mean_us']:>10.1f} us"
+          f"   busiest {busiest} {phases[busiest]['mean_us']:.1f} us", flush=True)
+    if 'tiers' in point:
+        tiers = point['tiers']
+        print("      tiers " + "  ".join(f"{name} {tiers[name]}" for name in TIER_NAMES)
+              + f"   updated {point['updated_per_tick']:.1f}/tick", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulation tick cost as entity counts and fire rates grow")
+    parser.add_argument('--backends', nargs='+', choices=sorted(BACKENDS), default=sorted(BACKENDS))
+    parser.add_argument('--kinds', nargs='+', choices=sorted(ENTITY_COUNTS) + ['all'],
+                        default=sorted(ENTITY_COUNTS),
+                        help="kinds scaled one at a time, the others keeping their usual counts; "
+                             "'all' scales every kind together")
+    parser.add_argument('--counts', nargs='+', type=int, default=COUNTS)
+    parser.add_argument('--fire-rates', nargs='+', type=float, default=FIRE_RATES)
+    parser.add_argument('--ticks', type=int, default=300)
+    parser.add_argument('--warmup-ticks', type=int, default=30)
+    parser.add_argument('--time-limit', type=float, default=10.0,
+                        help="seconds after which a point stops early, reporting the ticks it ran")
+    parser.add_argument('--interest', action='store_true',
+                        help="tier the array backend's hostile AI by distance from the player "
+                             "and report the hostiles in each tier")
+    parser.add_argument('--output', default='bench_entities.json')
+    args = parser.parse_args(argv)
+
+    results = []
+    for backend in args.backends:
+        for kind in args.kinds:
+            for count in args.counts:
+                counts = dict.fromkeys(ENTITY_COUNTS, count) if kind == 'all' else {kind: count}
+                for fire_rate in args.fire_rates:
+                    point = {'backend': backend, 'kind': kind, 'count': count, 'fire_rate': fire_rate}
+                    point.update(run_point(backend, counts, fire_rate, args.ticks, args.warmup_ticks,
+                                           args.time_limit, args.interest))
+                    report(point)
+                    results.append(point)
+
+    with open(args.output, 'w') as stream:
+        json.dump({
+            'benchmark': 'entities',
+            'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'settings': vars(args),
+            'results': results,
+        }, stream, indent=1)
+    print(f"Wrote {len(results)} points to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
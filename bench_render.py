@@ -0,0 +1,179 @@
+import argparse
+import datetime
+import importlib
+import json
+import platform
+import sys
+import time
+
+from offscreen import OffscreenContext
+from OpenGL.GL import glFinish, glGetString, GL_RENDERER, GL_VERSION
+import numpy as np
+
+from profiling import Profiler
+from simulation import ENTITY_COUNTS
+
+
+DENSITIES = (1, 10, 100)        # multiples of the usual starting entity counts
+VIEW_MODES = (0, 1, 2)          # tail, pilot and wing cameras
+RENDERERS = ('lists', 'instanced', 'shader')
+SEED = 11
+
+
+def skip_text(x, y, template, *values):
+    """GLUT's bitmap fonts need a GLUT window, so offscreen frames draw the HUD without text"""
+
+
+def use_renderer(game, renderer):
+    """Switch the game's entity path, releasing the previous renderer's GL objects first"""
+    for previous in (game.instanced, game.shaded):
+        if previous is not None:
+            previous.release()
+    game.instanced = None
+    game.shaded = None
+    if renderer == 'instanced':
+        game.enable_instancing()
+        return game.instanced is not None
+    if renderer == 'shader':
+        game.enable_shaders()
+        return game.shaded is not None
+    return True
+
+
+def run(game, ticks):
+    """Tick the game's world and its explosion puffs, as its update loop would"""
+    for _ in range(ticks):
+        game.advance_simulation()
+
+
+def run_point(game, profiler, density, view_mode, frames, warmup_ticks):
+    """Render frames of a seeded world; returns frames/second, CPU time and per-pass costs"""
+    sim = game.sim
+    sim.rng.seed(SEED)
+    game.particles.rng = np.random.default_rng(SEED)
+    game.particles.clear()
+    sim.entity_counts = {kind: count * density for kind, count in ENTITY_COUNTS.items()}
+    sim.reset(True)
+    # Auto fire keeps missiles and explosions in view; the mission never ends
+    sim.state.cheat_enabled = True
+    sim.state.lives = sys.maxsize
+    run(game, warmup_ticks)
+    game.cam.view_mode = view_mode
+
+    # Two ticks per frame, as at 60 ticks per second and 30 frames per second;
+    # only render_scene() is timed
+    game.render_scene()
+    profiler.reset()
+    wall = cpu = 0.0
+    for _ in range(frames):
+        run(game, 2)
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        game.render_scene()
+        wall += time.perf_counter() - wall_start
+        cpu += time.process_time() - cpu_start
+
+    scopes = profiler.stats()['scopes']
+    return {
+        'frames': frames,
+        'frames_per_second': frames / wall,
+        'wall_ms_per_frame': wall * 1000 / frames,
+        # Includes llvmpipe's rasteriser threads, unlike the per-pass times
+        'cpu_ms_per_frame': cpu * 1000 / frames,
+        'passes': {name: {'mean_us': row['mean'], 'p99_us': row['p99']}
+                   for name, row in scopes.items() if not name.startswith('update.')},
+        'submitted': game.frustum.total_submitted,
+        'culled': game.frustum.total_culled,
+    }
+
+
+def report(point):
+    print(f"{point['renderer']:<10}{point['density']:>5}x  view {point['view_mode']}"
+          f"{point['frames_per_second']:>9.1f} fps  {point['wall_ms_per_frame']:>8.2f} ms/frame"
+          f"  cpu {point['cpu_ms_per_frame']:>8.2f} ms  drawn {point['submitted']:>5}", flush=True)
+
+
+def regressions(results, baseline_path, max_slowdown):
+    """Points whose frame rate fell more than max_slowdown below the same point in a baseline"""
+    with open(baseline_path) as stream:
+        baseline = json.load(stream)
+    previous = {point_key(point): point['frames_per_second'] for point in baseline['results']}
+    slower = []
+    for point in results:
+        before = previous.get(point_key(point))
+        if before and point['frames_per_second'] < before * (1 - max_slowdown):
+            slower.append((point_key(point), before, point['frames_per_second']))
+    return slower
+
+
+def point_key(point):
+    return point['renderer'], point['density'], point['view_mode']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offscreen frame rate of render_scene() on software GL")
+    parser.add_argument('--renderers', nargs='+', choices=RENDERERS, default=RENDERERS)
+    parser.add_argument('--densities', nargs='+', type=int, default=DENSITIES,
+                        help="multiples of the usual starting count of each entity kind")
+    parser.add_argument('--view-modes', nargs='+', type=int, choices=VIEW_MODES, default=VIEW_MODES)
+    parser.add_argument('--frames', type=int, default=120)
+    parser.add_argument('--warmup-ticks', type=int, default=120)
+    parser.add_argument('--output', default='bench_render.json')
+    parser.add_argument('--baseline', metavar='PATH',
+                        help="earlier output to compare against; exits with status 1 on a regression")
+    parser.add_argument('--max-slowdown', type=float, default=0.2,
+                        help="fraction of a baseline point's frame rate that may be lost")
+    args = parser.parse_args(argv)
+
+    context = OffscreenContext(1000, 800)
+    game = importlib.import_module('423_final_project')
+    game.sim.verbose = False
+    game.models.build()
+    game.sprites.build()
+    # Always the full window resolution, so points compare across machines
+    game.resolution = None
+    # render_scene looks these up at call time. A pbuffer has nothing to swap:
+    # finishing waits for the frame's rendering the way a swap would
+    game.glutSwapBuffers = glFinish
+    game.show_text = skip_text
+    profiler = Profiler(enabled=True)
+    game.instrument_loops(profiler)
+    print(f"{glGetString(GL_RENDERER).decode()} / OpenGL {glGetString(GL_VERSION).decode()}")
+
+    results = []
+    for renderer in args.renderers:
+        if not use_renderer(game, renderer):
+            continue
+        for density in args.densities:
+            for view_mode in args.view_modes:
+                point = {'renderer': renderer, 'density': density, 'view_mode': view_mode}
+                point.update(run_point(game, profiler, density, view_mode, args.frames,
+                                       args.warmup_ticks))
+                report(point)
+                results.append(point)
+
+    with open(args.output, 'w') as stream:
+        json.dump({
+            'benchmark': 'render',
+            'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'gl_renderer': glGetString(GL_RENDERER).decode(),
+            'gl_version': glGetString(GL_VERSION).decode(),
+            'settings': vars(args),
+            'results': results,
+        }, stream, indent=1)
+    print(f"Wrote {len(results)} points to {args.output}")
+
+    game.release_resources()
+    context.release()
+
+    if args.baseline:
+        slower = regressions(results, args.baseline, args.max_slowdown)
+        for (renderer, density, view_mode), before, after in slower:
+            print(f"REGRESSION {renderer} {density}x view {view_mode}: {before:.1f} -> {after:.1f} fps")
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
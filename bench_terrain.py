@@ -0,0 +1,57 @@
+import argparse
+import importlib
+import statistics
+import time
+
+from offscreen import OffscreenContext
+from OpenGL.GL import glFinish
+
+
+def time_calls(draw, frames):
+    """Per-call CPU submission times in microseconds; GL work is drained between calls"""
+    samples = []
+    for _ in range(frames):
+        start = time.perf_counter_ns()
+        draw()
+        samples.append((time.perf_counter_ns() - start) / 1000)
+        glFinish()
+    return samples
+
+
+def report(label, samples):
+    print(f"{label:<34} mean {statistics.fmean(samples):9.1f} us   "
+          f"median {statistics.median(samples):9.1f} us")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CPU cost of immediate versus baked terrain")
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--warmup-ticks', type=int, default=120)
+    args = parser.parse_args(argv)
+
+    context = OffscreenContext(1000, 800)
+    game = importlib.import_module('423_final_project')
+    game.models.build()
+    game.sim.state.active = True
+    game.sim.run(args.warmup_ticks)
+
+    immediate = time_calls(game.draw_terrain_geometry, args.frames)
+    baked = time_calls(game.render_terrain_surface, args.frames)
+    baked_world = time_calls(game.render_world, args.frames)
+    # render_world looks the terrain function up at call time
+    game.render_terrain_surface = game.draw_terrain_geometry
+    immediate_world = time_calls(game.render_world, args.frames)
+
+    report("terrain, immediate mode", immediate)
+    report("terrain, display list", baked)
+    report("render_world, immediate terrain", immediate_world)
+    report("render_world, baked terrain", baked_world)
+    saved = statistics.fmean(immediate_world) - statistics.fmean(baked_world)
+    print(f"CPU time saved per frame: {saved:.1f} us")
+
+    game.release_resources()
+    context.release()
+
+
+if __name__ == "__main__":
+    main()
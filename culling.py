@@ -0,0 +1,60 @@
+import math
+
+from OpenGL.GL import *
+
+
+def matrix_rows(name):
+    """Current GL matrix as row-major nested lists; GL hands them back column-major"""
+    columns = [[float(value) for value in column] for column in glGetFloatv(name)]
+    return [[columns[col][row] for col in range(4)] for row in range(4)]
+
+
+class Frustum:
+    """View-frustum planes of the current camera, plus per-kind cull counters
+
+    extract() reads the projection and modelview matrices set up for the frame
+    and derives the six clip planes from their product (Gribb/Hartmann).
+    """
+
+    def __init__(self):
+        self.planes = []
+        self.submitted = {}
+        self.culled = {}
+
+    def extract(self):
+        """Rebuild the planes from the current matrices and zero the counters"""
+        projection = matrix_rows(GL_PROJECTION_MATRIX)
+        modelview = matrix_rows(GL_MODELVIEW_MATRIX)
+        clip = [[sum(projection[row][k] * modelview[k][col] for k in range(4)) for col in range(4)]
+                for row in range(4)]
+
+        self.planes = []
+        w = clip[3]
+        for axis in range(3):
+            for sign in (1, -1):
+                plane = [w[col] + sign * clip[axis][col] for col in range(4)]
+                length = math.sqrt(plane[0] ** 2 + plane[1] ** 2 + plane[2] ** 2)
+                self.planes.append(tuple(value / length for value in plane))
+        self.submitted.clear()
+        self.culled.clear()
+
+    def contains_sphere(self, x, y, z, radius):
+        for a, b, c, d in self.planes:
+            if a * x + b * y + c * z + d < -radius:
+                return False
+        return True
+
+    def visible(self, kind, entities, radius):
+        """Entities whose bounding sphere touches the frustum, counting both outcomes"""
+        kept = [entity for entity in entities if self.contains_sphere(*entity['pos'], radius)]
+        self.submitted[kind] = self.submitted.get(kind, 0) + len(kept)
+        self.culled[kind] = self.culled.get(kind, 0) + len(entities) - len(kept)
+        return kept
+
+    @property
+    def total_submitted(self):
+        return sum(self.submitted.values())
+
+    @property
+    def total_culled(self):
+        return sum(self.culled.values())
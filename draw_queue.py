@@ -0,0 +1,98 @@
+from OpenGL.GL import *
+
+from gl_resources import apply_ops
+
+
+class StateCache:
+    """Last colour, capabilities and matrix mode set through it
+
+    Requests that match what GL already has are dropped. Anything that changes
+    this state directly must call invalidate() (or forget_color()) afterwards so
+    the cache never skips a change that is actually needed.
+    """
+
+    def __init__(self):
+        self.changes = 0
+        self.skipped = 0
+        self.invalidate()
+
+    def invalidate(self):
+        self.current_color = None
+        self.capabilities = {}
+        self.mode = None
+
+    def forget_color(self):
+        self.current_color = None
+
+    def color(self, rgb):
+        if rgb == self.current_color:
+            self.skipped += 1
+            return
+        glColor3f(*rgb)
+        self.current_color = rgb
+        self.changes += 1
+
+    def enable(self, capability):
+        self.set_capability(capability, True)
+
+    def disable(self, capability):
+        self.set_capability(capability, False)
+
+    def set_capability(self, capability, enabled):
+        if self.capabilities.get(capability) == enabled:
+            self.skipped += 1
+            return
+        if enabled:
+            glEnable(capability)
+        else:
+            glDisable(capability)
+        self.capabilities[capability] = enabled
+        self.changes += 1
+
+    def matrix_mode(self, mode):
+        if mode == self.mode:
+            self.skipped += 1
+            return
+        glMatrixMode(mode)
+        self.mode = mode
+        self.changes += 1
+
+    def reset_counters(self):
+        self.changes = 0
+        self.skipped = 0
+
+
+class DrawQueue:
+    """A frame's model draws, submitted sorted by material and then display list
+
+    add() records one entry per material group of a model together with the
+    transform ops placing it; flush() sorts the entries so every material's
+    colour is set once, then issues them through the state cache.
+    """
+
+    def __init__(self, models, state):
+        self.models = models
+        self.state = state
+        self.items = []
+        self.submitted = 0
+
+    def add(self, name, ops=(), level=0):
+        """Queue a model at a level of detail, placed by translate/rotate/scale ops"""
+        for material, display_list in self.models.groups(name, level):
+            self.items.append((material, display_list, ops))
+
+    def flush(self):
+        """Draw and forget everything queued since the last flush"""
+        items = self.items
+        items.sort(key=lambda item: item[:2])
+        palette = self.models.palette
+        state = self.state
+        state.matrix_mode(GL_MODELVIEW)
+        for material, display_list, ops in items:
+            state.color(palette[material])
+            glPushMatrix()
+            apply_ops(ops)
+            glCallList(display_list)
+            glPopMatrix()
+        self.submitted = len(items)
+        self.items = []
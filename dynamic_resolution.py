@@ -0,0 +1,116 @@
+import math
+
+from OpenGL.GL import *
+
+
+MIN_SCALE = 0.5
+SCALE_STEP = 0.05               # scales are quantised so the framebuffer is not resized every frame
+SMOOTHING = 0.1                 # weight of the newest frame in the running average
+SETTLE_FRAMES = 30              # frames to wait after a change before judging it
+HEADROOM = 0.85                 # only scale back up once frames are this far under target
+MAX_FRAME_INTERVAL = 0.25       # longer gaps are stalls, not rendering cost
+
+
+class ResolutionScaler:
+    """Render scale that follows the measured frame time toward a target
+
+    Rendering cost on a fill-bound machine grows with the pixel count, i.e. with
+    the square of the scale, so each adjustment aims straight for the scale that
+    would hit the target and then waits for the average to settle.
+    """
+
+    def __init__(self, target_frame_time, min_scale=MIN_SCALE):
+        if not 0 < min_scale <= 1:
+            raise ValueError(f"Minimum render scale must be in (0, 1]: {min_scale}")
+        self.target_frame_time = target_frame_time
+        self.min_scale = min_scale
+        self.scale = 1.0
+        self.average = None
+        self.last_time = None
+        self.settling = 0
+        self.changes = 0
+
+    def update(self, now):
+        """Feed the time a frame starts at; returns the scale to render it with"""
+        last, self.last_time = self.last_time, now
+        if last is None:
+            return self.scale
+        interval = min(now - last, MAX_FRAME_INTERVAL)
+        if self.average is None:
+            self.average = interval
+        else:
+            self.average += (interval - self.average) * SMOOTHING
+        if self.settling:
+            self.settling -= 1
+            return self.scale
+
+        ratio = self.target_frame_time / self.average
+        if 1.0 <= ratio < 1.0 / HEADROOM:
+            return self.scale
+        wanted = self.scale * math.sqrt(ratio)
+        # Round down so a slow frame rate is never left just above target
+        wanted = math.floor(wanted / SCALE_STEP + 1e-9) * SCALE_STEP
+        wanted = min(1.0, max(self.min_scale, wanted))
+        if abs(wanted - self.scale) >= SCALE_STEP / 2:
+            self.scale = wanted
+            self.settling = SETTLE_FRAMES
+            self.changes += 1
+        return self.scale
+
+
+class SceneTarget:
+    """Offscreen colour and depth framebuffer the 3D view is drawn into
+
+    bind() sizes it for the frame and redirects drawing to it; present() stretches
+    it over the window's framebuffer, after which the HUD draws at full resolution.
+    Nothing touches GL until build(), which needs the window's context.
+    """
+
+    def __init__(self):
+        self.framebuffer = None
+        self.color = None
+        self.depth = None
+        self.width = 0
+        self.height = 0
+
+    @property
+    def ready(self):
+        return self.framebuffer is not None
+
+    def build(self):
+        """Create the framebuffer if the context can blit between framebuffers"""
+        if self.framebuffer is not None or not bool(glBlitFramebuffer):
+            return
+        self.framebuffer = glGenFramebuffers(1)
+        self.color, self.depth = glGenRenderbuffers(2)
+
+    def bind(self, width, height):
+        """Draw into the target from now on, reallocating it if the size changed"""
+        glBindFramebuffer(GL_FRAMEBUFFER, self.framebuffer)
+        if (width, height) == (self.width, self.height):
+            return
+        self.width, self.height = width, height
+        glBindRenderbuffer(GL_RENDERBUFFER, self.color)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_RGBA8, width, height)
+        glBindRenderbuffer(GL_RENDERBUFFER, self.depth)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH_COMPONENT24, width, height)
+        glBindRenderbuffer(GL_RENDERBUFFER, 0)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_RENDERBUFFER, self.color)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_DEPTH_ATTACHMENT, GL_RENDERBUFFER, self.depth)
+
+    def present(self, width, height):
+        """Stretch the target over the window and draw to the window again"""
+        glBindFramebuffer(GL_READ_FRAMEBUFFER, self.framebuffer)
+        glBindFramebuffer(GL_DRAW_FRAMEBUFFER, 0)
+        scaled = (self.width, self.height) != (width, height)
+        glBlitFramebuffer(0, 0, self.width, self.height, 0, 0, width, height,
+                          GL_COLOR_BUFFER_BIT, GL_LINEAR if scaled else GL_NEAREST)
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+
+    def release(self):
+        if self.framebuffer is None:
+            return
+        glDeleteFramebuffers(1, [self.framebuffer])
+        glDeleteRenderbuffers(2, [self.color, self.depth])
+        self.framebuffer = None
+        self.width = self.height = 0
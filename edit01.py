@@ -4,6 +4,8 @@ from OpenGL.GLU import *
 import math
 import random
 
+from materials import CLASSIC_PALETTE as MATERIALS
+
 
 # Configuration constants
 WINDOW_WIDTH = 1000
@@ -260,14 +262,14 @@ def render_player_vehicle():
     
     # Body - using different scaling approach
     glPushMatrix()
-    glColor3f(0.75, 0.75, 0.75)
+    glColor3f(*MATERIALS['hull'])
     glScalef(1, 3, 0.5)
     glutSolidCube(30)
     glPopMatrix()
     
     # Wings - scaled differently
     glPushMatrix()
-    glColor3f(0.85, 0.85, 0.85)
+    glColor3f(*MATERIALS['wing'])
     glScalef(5, 0.3, 0.2)
     glutSolidCube(30)
     glPopMatrix()
@@ -275,7 +277,7 @@ def render_player_vehicle():
     # Vertical tail
     glPushMatrix()
     glTranslatef(0, -35, 10)
-    glColor3f(0.65, 0.65, 0.65)
+    glColor3f(*MATERIALS['tail'])
     glScalef(0.2, 0.5, 1.5)
     glutSolidCube(30)
     glPopMatrix()
@@ -283,7 +285,7 @@ def render_player_vehicle():
     # Horizontal tail
     glPushMatrix()
     glTranslatef(0, -35, 5)
-    glColor3f(0.65, 0.65, 0.65)
+    glColor3f(*MATERIALS['tail'])
     glScalef(2, 0.3, 0.2)
     glutSolidCube(20)
     glPopMatrix()
@@ -292,7 +294,7 @@ def render_player_vehicle():
     glPushMatrix()
     glTranslatef(0, 45, 0)
     glRotatef(player.prop_spin, 0, 1, 0)
-    glColor3f(0.25, 0.25, 0.25)
+    glColor3f(*MATERIALS['propeller'])
     glScalef(2, 0.1, 0.3)
     glutSolidCube(25)
     glPopMatrix()
@@ -300,7 +302,7 @@ def render_player_vehicle():
     # Cockpit canopy
     glPushMatrix()
     glTranslatef(0, 10, 8)
-    glColor3f(0.15, 0.15, 0.55)
+    glColor3f(*MATERIALS['canopy'])
     glutSolidCube(15)
     glPopMatrix()
     
@@ -317,12 +319,12 @@ def render_collectible_ring(item):
     glRotatef(90, 1, 0, 0)
     
     # Outer ring
-    glColor3f(1, 0.95, 0)
+    glColor3f(*MATERIALS['ring_outer'])
     quad = gluNewQuadric()
     gluCylinder(quad, 80, 80, 20, 20, 5)
     
     # Inner ring
-    glColor3f(0.5, 0.475, 0)
+    glColor3f(*MATERIALS['ring_middle'])
     quad2 = gluNewQuadric()
     gluCylinder(quad2, 60, 60, 20, 20, 5)
     
@@ -338,7 +340,7 @@ def render_hazard_object(hazard):
     
     if variant == 'cloud':
         # Cloud using alternative sphere arrangement
-        glColor3f(0.95, 0.95, 0.95)
+        glColor3f(*MATERIALS['cloud'])
         quad1 = gluNewQuadric()
         gluSphere(quad1, 40, 10, 10)
         glTranslatef(30, 0, 0)
@@ -348,14 +350,14 @@ def render_hazard_object(hazard):
         quad3 = gluNewQuadric()
         gluSphere(quad3, 35, 10, 10)
     elif variant == 'rock':
-        glColor3f(0.45, 0.35, 0.25)
+        glColor3f(*MATERIALS['rock'])
         glutSolidCube(50)
     else:  # balloon variant
-        glColor3f(0.95, 0.15, 0.15)
+        glColor3f(*MATERIALS['balloon'])
         quad_balloon = gluNewQuadric()
         gluSphere(quad_balloon, 30, 10, 10)
         glTranslatef(0, 0, -40)
-        glColor3f(0.75, 0.75, 0.75)
+        glColor3f(*MATERIALS['tether'])
         glRotatef(-90, 1, 0, 0)
         quad_string = gluNewQuadric()
         gluCylinder(quad_string, 5, 2, 20, 10, 10)
@@ -373,14 +375,14 @@ def render_hostile_vehicle(hostile):
     
     # Enemy body
     glPushMatrix()
-    glColor3f(0.85, 0.15, 0.15)
+    glColor3f(*MATERIALS['hostile_body'])
     glScalef(1, 2, 0.5)
     glutSolidCube(30)
     glPopMatrix()
     
     # Enemy wings
     glPushMatrix()
-    glColor3f(0.65, 0.05, 0.05)
+    glColor3f(*MATERIALS['hostile_wing'])
     glScalef(4, 0.3, 0.2)
     glutSolidCube(25)
     glPopMatrix()
@@ -388,7 +390,7 @@ def render_hostile_vehicle(hostile):
     # Enemy tail
     glPushMatrix()
     glTranslatef(0, -25, 8)
-    glColor3f(0.55, 0.05, 0.05)
+    glColor3f(*MATERIALS['hostile_tail'])
     glScalef(0.2, 0.4, 1.2)
     glutSolidCube(25)
     glPopMatrix()
@@ -396,7 +398,7 @@ def render_hostile_vehicle(hostile):
     # Marker beacon
     glPushMatrix()
     glTranslatef(0, 0, 15)
-    glColor3f(1, 0, 0)
+    glColor3f(*MATERIALS['beacon'])
     marker = gluNewQuadric()
     gluSphere(marker, 8, 8, 8)
     glPopMatrix()
@@ -408,7 +410,7 @@ def render_missile_projectile(missile):
     """Draw bullet with alternative rendering"""
     glPushMatrix()
     glTranslatef(*missile['pos'])
-    glColor3f(1, 0.95, 0)
+    glColor3f(*MATERIALS['missile'])
     bullet_quad = gluNewQuadric()
     gluSphere(bullet_quad, 5, 8, 8)
     glPopMatrix()
@@ -431,10 +433,10 @@ def render_pickup_item(pickup):
     # Alternative pulsing calculation
     pulse_factor = 0.8 + 0.4 * math.sin(state.frames * 0.1)
     glScalef(pulse_factor, pulse_factor, pulse_factor)
-    glColor3f(0, 0.95, 0.95)
+    glColor3f(*MATERIALS['pickup'])
     glutSolidCube(25)
     
-    glColor3f(1, 1, 1)
+    glColor3f(*MATERIALS['pickup_frame'])
     glutWireCube(30)
     
     glPopMatrix()
@@ -0,0 +1,241 @@
+import numpy as np
+
+from pools import DROP_OLDEST, REFUSE
+from simulation import HAZARD_TYPES, MISSILE_SPEED, ENTITY_KINDS, GRID_KINDS
+from spatial_hash import SpatialHash
+
+
+class EntityColumns:
+    """Structure-of-arrays storage for one entity kind with free-slot reuse
+
+    Columns double when they run out of slots. With a limit they stop growing
+    there and, once full, follow the same overflow policy as an EntityPool:
+    reuse the oldest slot, or refuse the new entity.
+    """
+
+    def __init__(self, capacity=16, grid=None, limit=None, overflow=DROP_OLDEST):
+        if overflow not in (DROP_OLDEST, REFUSE):
+            raise ValueError(f"Unknown pool overflow policy: {overflow}")
+        if limit is not None:
+            capacity = min(capacity, limit)
+        self.pos = np.zeros((capacity, 3))
+        self.vel = np.zeros((capacity, 3))
+        self.used = np.zeros(capacity, dtype=bool)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.taken = np.zeros(capacity, dtype=bool)
+        self.timer = np.zeros(capacity)
+        self.variant = np.zeros(capacity, dtype=np.int8)
+        self.tier = np.zeros(capacity, dtype=np.int8)
+        self.serial = np.zeros(capacity, dtype=np.int64)
+        self.cell = np.zeros((capacity, 3), dtype=np.int64)
+        self.grid = grid
+        self.free_slots = list(range(capacity - 1, -1, -1))
+        self.count = 0
+        self.next_serial = 0
+        self.limit = limit
+        self.overflow = overflow
+        self.overflows = 0
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def capacity(self):
+        return len(self.used)
+
+    def grow(self, capacity):
+        """Enlarge every column, keeping existing slots in place"""
+        old = self.capacity
+        for name in ('pos', 'vel', 'used', 'alive', 'taken', 'timer', 'variant', 'tier', 'serial', 'cell'):
+            column = getattr(self, name)
+            wider = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            wider[:old] = column
+            setattr(self, name, wider)
+        # New slots are handed out lowest index first
+        self.free_slots = list(range(capacity - 1, old - 1, -1)) + self.free_slots
+
+    def make_room(self):
+        """Free up a slot by growing or, at the limit, by the overflow policy; False if refused"""
+        if self.limit is None or self.capacity < self.limit:
+            capacity = max(16, self.capacity * 2)
+            self.grow(capacity if self.limit is None else min(capacity, self.limit))
+            return True
+        self.overflows += 1
+        if self.overflow == REFUSE:
+            return False
+        self.release(self.live_by_age()[0])
+        return True
+
+    def allocate(self, x, y, z):
+        """Claim a free slot at the given position and return its index, or None if refused"""
+        if not self.free_slots and not self.make_room():
+            return None
+        slot = self.free_slots.pop()
+        self.used[slot] = True
+        self.pos[slot] = (x, y, z)
+        self.vel[slot] = 0.0
+        self.alive[slot] = True
+        self.taken[slot] = False
+        self.timer[slot] = 0.0
+        self.variant[slot] = 0
+        self.tier[slot] = 0
+        self.serial[slot] = self.next_serial
+        self.next_serial += 1
+        self.count += 1
+        if self.grid is not None:
+            cell = self.grid.cell_of(x, y, z)
+            self.cell[slot] = cell
+            self.grid.insert_at(slot, cell, slot)
+        return slot
+
+    def allocate_rows(self, positions):
+        """Claim one slot per row of an (n, 3) position array"""
+        if self.limit is not None and len(self.free_slots) < len(positions):
+            # Rows past the limit overflow one at a time, as separate spawns would
+            slots = (self.allocate(*row) for row in positions.tolist())
+            return np.array([slot for slot in slots if slot is not None], dtype=np.intp)
+        while len(self.free_slots) < len(positions):
+            self.grow(max(16, self.capacity * 2))
+        slots = np.array([self.free_slots.pop() for _ in range(len(positions))], dtype=np.intp)
+        self.used[slots] = True
+        self.pos[slots] = positions
+        self.vel[slots] = 0.0
+        self.alive[slots] = True
+        self.taken[slots] = False
+        self.timer[slots] = 0.0
+        self.variant[slots] = 0
+        self.tier[slots] = 0
+        self.serial[slots] = np.arange(self.next_serial, self.next_serial + len(slots))
+        self.next_serial += len(slots)
+        self.count += len(slots)
+        if self.grid is not None:
+            cells = self.cells_for(slots)
+            self.cell[slots] = cells
+            for slot, cell in zip(slots.tolist(), map(tuple, cells.tolist())):
+                self.grid.insert_at(slot, cell, slot)
+        return slots
+
+    def append(self, entity):
+        """Add an entity described by one of the spawn_* dicts"""
+        slot = self.allocate(*entity['pos'])
+        if slot is None:
+            return None
+        if 'alive' in entity:
+            self.alive[slot] = entity['alive']
+        if 'taken' in entity:
+            self.taken[slot] = entity['taken']
+        if 'variant' in entity:
+            self.variant[slot] = HAZARD_TYPES.index(entity['variant'])
+        if 'dir' in entity:
+            self.vel[slot] = np.asarray(entity['dir'], dtype=float) * entity.get('vel', MISSILE_SPEED)
+        if 'timer' in entity:
+            self.timer[slot] = entity['timer']
+        return slot
+
+    def release(self, slot):
+        """Return one slot to the free list"""
+        if self.used[slot]:
+            self.used[slot] = False
+            self.free_slots.append(slot)
+            self.count -= 1
+            if self.grid is not None:
+                self.grid.remove(int(slot))
+
+    def release_mask(self, mask):
+        """Return every used slot selected by a boolean mask to the free list"""
+        slots = np.flatnonzero(mask & self.used)
+        if len(slots):
+            self.used[slots] = False
+            self.free_slots.extend(slots[::-1].tolist())
+            self.count -= len(slots)
+            if self.grid is not None:
+                for slot in slots.tolist():
+                    self.grid.remove(slot)
+        return slots
+
+    def release_slots(self, slots):
+        """Return the listed slots to the free list"""
+        mask = np.zeros(self.capacity, dtype=bool)
+        mask[slots] = True
+        return self.release_mask(mask)
+
+    def cells_for(self, slots):
+        """Grid cell coordinates of the given slots' current positions"""
+        return np.floor(self.pos[slots] / self.grid.cell_size).astype(np.int64)
+
+    def refresh(self, mask):
+        """Re-bucket the masked slots whose movement crossed a cell boundary"""
+        if self.grid is None:
+            return 0
+        slots = np.flatnonzero(mask & self.used)
+        cells = self.cells_for(slots)
+        changed = np.any(cells != self.cell[slots], axis=1)
+        moved = slots[changed]
+        if len(moved):
+            self.cell[moved] = cells[changed]
+            for slot, cell in zip(moved.tolist(), map(tuple, cells[changed].tolist())):
+                self.grid.move_to(slot, cell)
+        return len(moved)
+
+    def nearby(self, x, y, z, radius):
+        """Broadphase candidate slots around a point in ascending slot order"""
+        return np.array(self.grid.query(x, y, z, radius), dtype=np.intp)
+
+    def live(self):
+        """Indices of occupied slots in ascending order"""
+        return np.flatnonzero(self.used)
+
+    def live_by_age(self):
+        """Indices of occupied slots in the order they were allocated"""
+        slots = np.flatnonzero(self.used)
+        return slots[np.argsort(self.serial[slots], kind='stable')]
+
+    def clear(self):
+        self.used[:] = False
+        self.free_slots = list(range(self.capacity - 1, -1, -1))
+        self.count = 0
+        if self.grid is not None:
+            self.grid.clear()
+
+    def to_dicts(self):
+        """Rebuild spawn_*-style dicts for the occupied slots (debugging and rendering)"""
+        entities = []
+        for slot in self.live():
+            entities.append({
+                'pos': self.pos[slot].tolist(),
+                'alive': bool(self.alive[slot]),
+                'taken': bool(self.taken[slot]),
+                'variant': HAZARD_TYPES[self.variant[slot]],
+                'timer': float(self.timer[slot]),
+            })
+        return entities
+
+
+class EntityStore:
+    """Array-backed replacement for WorldEntities, one EntityColumns per kind
+
+    Missiles and effects are capped like WorldEntities' pools; the other kinds grow freely.
+    """
+
+    def __init__(self, capacity=16, broadphase=True, missile_capacity=None, effect_capacity=None,
+                 overflow=DROP_OLDEST):
+        limits = {'missiles': missile_capacity, 'effects': effect_capacity}
+        for name in ENTITY_KINDS:
+            grid = SpatialHash() if broadphase and name in GRID_KINDS else None
+            setattr(self, name, EntityColumns(capacity, grid, limits.get(name), overflow))
+
+    def add(self, kind, entity):
+        """Add a spawn_* dict to its kind's columns"""
+        return getattr(self, kind).append(entity)
+
+    def clear(self, kinds=ENTITY_KINDS):
+        for name in kinds:
+            getattr(self, name).clear()
+
+    def load(self, world):
+        """Copy every entity of a dict-based WorldEntities into the arrays"""
+        for name in ENTITY_KINDS:
+            columns = getattr(self, name)
+            columns.clear()
+            for entity in getattr(world, name):
+                columns.append(entity)
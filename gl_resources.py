@@ -0,0 +1,176 @@
+from OpenGL.GL import *
+from OpenGL.GLU import *
+
+
+# Tessellation scale of sphere and cylinder parts at each level of detail
+LOD_SCALES = (1.0, 0.5, 0.25)
+MIN_SLICES = 4
+MIN_STACKS = {'sphere': 2, 'cylinder': 1}
+
+# Unit cube faces: outward normal and corners in counter-clockwise order
+CUBE_FACES = (
+    ((1, 0, 0), ((1, -1, -1), (1, 1, -1), (1, 1, 1), (1, -1, 1))),
+    ((-1, 0, 0), ((-1, -1, -1), (-1, -1, 1), (-1, 1, 1), (-1, 1, -1))),
+    ((0, 1, 0), ((-1, 1, -1), (-1, 1, 1), (1, 1, 1), (1, 1, -1))),
+    ((0, -1, 0), ((-1, -1, -1), (1, -1, -1), (1, -1, 1), (-1, -1, 1))),
+    ((0, 0, 1), ((-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1))),
+    ((0, 0, -1), ((-1, -1, -1), (-1, 1, -1), (1, 1, -1), (1, -1, -1))),
+)
+
+
+def solid_cube(size):
+    """Filled cube centred on the origin, like glutSolidCube but without GLUT"""
+    half = size / 2
+    glBegin(GL_QUADS)
+    for normal, corners in CUBE_FACES:
+        glNormal3f(*normal)
+        for x, y, z in corners:
+            glVertex3f(x * half, y * half, z * half)
+    glEnd()
+
+
+def wire_cube(size):
+    """Cube outline centred on the origin, like glutWireCube"""
+    half = size / 2
+    for normal, corners in CUBE_FACES:
+        glBegin(GL_LINE_LOOP)
+        glNormal3f(*normal)
+        for x, y, z in corners:
+            glVertex3f(x * half, y * half, z * half)
+        glEnd()
+
+
+def part(shape, dims, material, *ops):
+    """One primitive of a model
+
+    shape is 'cube', 'wire_cube', 'sphere' or 'cylinder' and dims its GLUT/GLU
+    size arguments. material names the part's colour in a palette (see
+    materials.py), or is None to keep the colour set when drawn.
+    ops are ('translate', x, y, z), ('rotate', angle, x, y, z) and
+    ('scale', x, y, z) tuples, applied in order as GL would.
+    """
+    return {'shape': shape, 'dims': dims, 'material': material, 'ops': ops}
+
+
+def part_at_lod(item, level):
+    """The part with its sphere or cylinder tessellation reduced for a detail level"""
+    shape = item['shape']
+    if level == 0 or shape not in MIN_STACKS:
+        return item
+    scale = LOD_SCALES[level]
+    dims = list(item['dims'])
+    dims[-2] = max(MIN_SLICES, round(dims[-2] * scale))
+    dims[-1] = max(MIN_STACKS[shape], round(dims[-1] * scale))
+    return dict(item, dims=tuple(dims))
+
+
+def apply_ops(ops):
+    """Multiply translate/rotate/scale ops onto the current matrix"""
+    for op in ops:
+        if op[0] == 'translate':
+            glTranslatef(*op[1:])
+        elif op[0] == 'rotate':
+            glRotatef(*op[1:])
+        else:
+            glScalef(*op[1:])
+
+
+def material_groups(parts):
+    """Parts grouped by material, in the order each material first appears"""
+    groups = {}
+    for item in parts:
+        groups.setdefault(item['material'], []).append(item)
+    return list(groups.items())
+
+
+def draw_part(quadric, item):
+    """Issue one part's geometry in immediate mode; its colour is set by the caller"""
+    glPushMatrix()
+    apply_ops(item['ops'])
+
+    shape = item['shape']
+    if shape == 'cube':
+        solid_cube(*item['dims'])
+    elif shape == 'wire_cube':
+        wire_cube(*item['dims'])
+    elif shape == 'sphere':
+        gluSphere(quadric, *item['dims'])
+    else:
+        gluCylinder(quadric, *item['dims'])
+    glPopMatrix()
+
+
+class ModelLibrary:
+    """Owns the shared quadric and the compiled display lists of every model
+
+    models maps a model name to its list of parts, compiled once per level of
+    detail into one display list per material, so colour stays outside the lists
+    and comes from palette when drawn. static maps further names to functions
+    drawing fixed scenery in immediate mode, recorded once as they are.
+    Nothing touches GL until build(), which needs a current context, i.e. after
+    glutCreateWindow; release() frees everything while that context still exists.
+    """
+
+    def __init__(self, models, palette, static=None):
+        self.models = dict(models)
+        self.palette = palette
+        self.static = dict(static or {})
+        self.quadric = None
+        self.lists = {}
+        self.count = 0
+        self.base = 0
+
+    def __contains__(self, name):
+        return name in self.lists
+
+    def build(self):
+        """Compile every model once; later calls are no-ops"""
+        if self.lists:
+            return
+        self.quadric = gluNewQuadric()
+        grouped = {name: material_groups(parts) for name, parts in self.models.items()}
+        self.count = (sum(len(groups) for groups in grouped.values()) * len(LOD_SCALES)
+                      + len(self.static))
+        self.base = glGenLists(self.count)
+        offset = 0
+        for name, groups in grouped.items():
+            levels = []
+            for level in range(len(LOD_SCALES)):
+                entries = []
+                for material, parts in groups:
+                    glNewList(self.base + offset, GL_COMPILE)
+                    for item in parts:
+                        draw_part(self.quadric, part_at_lod(item, level))
+                    glEndList()
+                    entries.append((material, self.base + offset))
+                    offset += 1
+                levels.append(entries)
+            self.lists[name] = levels
+        # Static scenery sets its own colours inside its list
+        for name, draw in self.static.items():
+            glNewList(self.base + offset, GL_COMPILE)
+            draw()
+            glEndList()
+            self.lists[name] = [[(None, self.base + offset)]]
+            offset += 1
+
+    def groups(self, name, level=0):
+        """(material, display list) pairs making up a model at a level of detail"""
+        return self.lists[name][level]
+
+    def draw(self, name, level=0):
+        for material, display_list in self.lists[name][level]:
+            if material is not None:
+                glColor3f(*self.palette[material])
+            glCallList(display_list)
+
+    def release(self):
+        """Delete the display lists and the quadric"""
+        if self.lists:
+            glDeleteLists(self.base, self.count)
+            self.lists = {}
+            self.count = 0
+            self.base = 0
+        if self.quadric is not None:
+            gluDeleteQuadric(self.quadric)
+            self.quadric = None
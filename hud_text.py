@@ -0,0 +1,160 @@
+from OpenGL.GL import *
+from OpenGL.GLUT import *
+
+
+FIRST_CHAR = 32
+LAST_CHAR = 126
+ATLAS_COLUMNS = 16
+GLYPH_PADDING = 2               # pixels around each glyph so kerned edges never clip
+
+
+class FontAtlas:
+    """Printable ASCII glyphs of a GLUT bitmap font rasterised once into a texture
+
+    Each glyph sits in a fixed-size cell with its baseline at the same height, so
+    a string becomes one quad per character with pixel-exact texture coordinates.
+    """
+
+    def __init__(self, font=GLUT_BITMAP_HELVETICA_18):
+        self.font = font
+        self.texture = None
+        self.advances = {}
+        self.cell_width = 0
+        self.cell_height = 0
+        self.baseline = 0
+        self.width = 0
+        self.height = 0
+
+    @property
+    def ready(self):
+        return self.texture is not None
+
+    def build(self):
+        """Draw every glyph into a texture through a framebuffer; needs the window's context"""
+        if self.texture is not None or not bool(glGenFramebuffers):
+            return
+        font = self.font
+        line_height = glutBitmapHeight(font)
+        for code in range(FIRST_CHAR, LAST_CHAR + 1):
+            self.advances[chr(code)] = glutBitmapWidth(font, code)
+        self.cell_width = max(self.advances.values()) + 2 * GLYPH_PADDING
+        self.cell_height = line_height + 2 * GLYPH_PADDING
+        self.baseline = line_height // 4 + GLYPH_PADDING
+        rows = (LAST_CHAR - FIRST_CHAR) // ATLAS_COLUMNS + 1
+        self.width = ATLAS_COLUMNS * self.cell_width
+        self.height = rows * self.cell_height
+
+        self.texture = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, self.width, self.height, 0, GL_RGBA,
+                     GL_UNSIGNED_BYTE, None)
+        framebuffer = glGenFramebuffers(1)
+        glBindFramebuffer(GL_FRAMEBUFFER, framebuffer)
+        glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, self.texture, 0)
+
+        # White glyphs on transparent black, drawn in cell pixel coordinates
+        glPushAttrib(GL_COLOR_BUFFER_BIT | GL_VIEWPORT_BIT | GL_ENABLE_BIT | GL_CURRENT_BIT)
+        glViewport(0, 0, self.width, self.height)
+        glDisable(GL_DEPTH_TEST)
+        glClearColor(0, 0, 0, 0)
+        glClear(GL_COLOR_BUFFER_BIT)
+        glMatrixMode(GL_PROJECTION)
+        glPushMatrix()
+        glLoadIdentity()
+        glOrtho(0, self.width, 0, self.height, -1, 1)
+        glMatrixMode(GL_MODELVIEW)
+        glPushMatrix()
+        glLoadIdentity()
+        glColor4f(1, 1, 1, 1)
+        for code in range(FIRST_CHAR, LAST_CHAR + 1):
+            x, y = self.cell_origin(code)
+            glRasterPos2i(x + GLYPH_PADDING, y + self.baseline)
+            glutBitmapCharacter(font, code)
+        glPopMatrix()
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+        glPopAttrib()
+
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        glDeleteFramebuffers(1, [framebuffer])
+        glBindTexture(GL_TEXTURE_2D, 0)
+
+    def cell_origin(self, code):
+        index = code - FIRST_CHAR
+        return ((index % ATLAS_COLUMNS) * self.cell_width,
+                (index // ATLAS_COLUMNS) * self.cell_height)
+
+    def layout(self, x, y, message):
+        """Interleaved texcoord/vertex quads for a string whose baseline starts at x, y"""
+        coords = []
+        pen = x - GLYPH_PADDING
+        bottom = y - self.baseline
+        top = bottom + self.cell_height
+        for ch in message:
+            advance = self.advances.get(ch)
+            if advance is None:
+                continue
+            cell_x, cell_y = self.cell_origin(ord(ch))
+            s0 = cell_x / self.width
+            s1 = (cell_x + self.cell_width) / self.width
+            t0 = cell_y / self.height
+            t1 = (cell_y + self.cell_height) / self.height
+            right = pen + self.cell_width
+            coords.extend((s0, t0, pen, bottom, 0, s1, t0, right, bottom, 0,
+                           s1, t1, right, top, 0, s0, t1, pen, top, 0))
+            pen += advance
+        return (GLfloat * len(coords))(*coords), len(coords) // 5
+
+    def release(self):
+        if self.texture is not None:
+            glDeleteTextures(1, [self.texture])
+            self.texture = None
+
+
+class TextCache:
+    """HUD lines laid out once and redrawn from cached quads until their values change
+
+    Lines are keyed by position and template; the template is only formatted
+    again when the values passed in differ from the ones last laid out.
+    """
+
+    def __init__(self, atlas):
+        self.atlas = atlas
+        self.lines = {}
+        self.layouts = 0
+        self.reuses = 0
+
+    def begin(self):
+        """Bind the atlas and blending for a run of draw() calls"""
+        glPushAttrib(GL_ENABLE_BIT | GL_COLOR_BUFFER_BIT | GL_TEXTURE_BIT)
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self.atlas.texture)
+        glTexEnvi(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_MODULATE)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glPushClientAttrib(GL_CLIENT_VERTEX_ARRAY_BIT)
+
+    def end(self):
+        glPopClientAttrib()
+        glPopAttrib()
+
+    def draw(self, x, y, template, values=()):
+        """Draw one line in the current colour, laying it out again only if it changed"""
+        key = (x, y, template)
+        entry = self.lines.get(key)
+        if entry is None or entry[0] != values:
+            message = template.format(*values) if values else template
+            entry = self.lines[key] = (values,) + self.atlas.layout(x, y, message)
+            self.layouts += 1
+        else:
+            self.reuses += 1
+        _, quads, count = entry
+        if count:
+            glInterleavedArrays(GL_T2F_V3F, 0, quads)
+            glDrawArrays(GL_QUADS, 0, count)
+
+    def clear(self):
+        self.lines.clear()
@@ -0,0 +1,158 @@
+import ctypes
+
+import numpy as np
+from OpenGL.GL import *
+from OpenGL.GL import shaders
+
+from gl_resources import LOD_SCALES
+from meshes import build_mesh, transform_matrix
+
+
+# Instance rows: x, y, z, scale, r, g, b, tint weight (0 keeps the mesh colours)
+INSTANCE_FLOATS = 8
+VERTEX_FLOATS = 6
+
+# GLSL 1.20 with attribute divisors runs on any 3.3+ compatibility context,
+# Mesa's llvmpipe included, and keeps using the fixed-function matrices
+VERTEX_SHADER = """
+#version 120
+uniform mat4 shape;
+attribute vec3 position;
+attribute vec3 color;
+attribute vec4 placement;
+attribute vec4 tint;
+varying vec3 fragment_color;
+void main() {
+    vec4 local = shape * vec4(position, 1.0);
+    gl_Position = gl_ModelViewProjectionMatrix * vec4(local.xyz * placement.w + placement.xyz, 1.0);
+    fragment_color = mix(color, tint.rgb, tint.a);
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 120
+varying vec3 fragment_color;
+void main() {
+    gl_FragColor = vec4(fragment_color, 1.0);
+}
+"""
+
+
+def instancing_supported():
+    """Whether the current context can run the instanced path"""
+    version = glGetString(GL_VERSION).decode().split()[0]
+    major, minor = (int(number) for number in version.split('.')[:2])
+    return (major, minor) >= (3, 3)
+
+
+def pack_instances(positions, scales=1.0, colors=None):
+    """Instance rows for a list of positions, with optional per-instance scale and tint"""
+    rows = np.zeros((len(positions), INSTANCE_FLOATS), dtype=np.float32)
+    if not len(positions):
+        return rows
+    rows[:, :3] = positions
+    rows[:, 3] = scales
+    if colors is not None:
+        rows[:, 4:7] = colors
+        rows[:, 7] = 1.0
+    return rows
+
+
+class InstancedRenderer:
+    """Draws every instance of a mesh with one call per primitive type
+
+    Meshes are uploaded once by build(); each draw() streams that frame's
+    instance rows into a shared buffer and issues glDrawArraysInstanced.
+    """
+
+    def __init__(self, models, palette):
+        self.models = dict(models)
+        self.palette = palette
+        self.meshes = {}
+        self.program = None
+        self.locations = {}
+        self.mesh_buffers = {}
+        self.instance_buffer = None
+        self.draw_calls = 0
+
+    def build(self):
+        if self.program is not None:
+            return
+        self.program = shaders.compileProgram(
+            shaders.compileShader(VERTEX_SHADER, GL_VERTEX_SHADER),
+            shaders.compileShader(FRAGMENT_SHADER, GL_FRAGMENT_SHADER),
+            validate=False)
+        for name in ('position', 'color', 'placement', 'tint'):
+            self.locations[name] = glGetAttribLocation(self.program, name)
+        self.locations['shape'] = glGetUniformLocation(self.program, 'shape')
+
+        for name, parts in self.models.items():
+            for level in range(len(LOD_SCALES)):
+                mesh = self.meshes[name, level] = build_mesh(parts, self.palette, level)
+                buffers = []
+                for vertices in (mesh.triangles, mesh.lines):
+                    buffer = None
+                    if len(vertices):
+                        buffer = glGenBuffers(1)
+                        glBindBuffer(GL_ARRAY_BUFFER, buffer)
+                        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+                    buffers.append((buffer, len(vertices)))
+                self.mesh_buffers[name, level] = buffers
+        self.instance_buffer = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def begin(self):
+        """Bind the program; call before a run of draw() calls"""
+        glUseProgram(self.program)
+        self.draw_calls = 0
+
+    def end(self):
+        for name in ('position', 'color', 'placement', 'tint'):
+            glDisableVertexAttribArray(self.locations[name])
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glUseProgram(0)
+
+    def draw(self, name, positions, scales=1.0, colors=None, shape_ops=(), level=0):
+        """Draw a mesh at every position; shape_ops transform the mesh first"""
+        if not len(positions):
+            return
+        instances = pack_instances(positions, scales, colors)
+        locations = self.locations
+        glUniformMatrix4fv(locations['shape'], 1, GL_TRUE,
+                           transform_matrix(shape_ops).astype(np.float32))
+
+        # Per-instance attributes advance once per instance
+        stride = INSTANCE_FLOATS * 4
+        glBindBuffer(GL_ARRAY_BUFFER, self.instance_buffer)
+        glBufferData(GL_ARRAY_BUFFER, instances.nbytes, instances, GL_STREAM_DRAW)
+        for attribute, offset in (('placement', 0), ('tint', 16)):
+            glEnableVertexAttribArray(locations[attribute])
+            glVertexAttribPointer(locations[attribute], 4, GL_FLOAT, GL_FALSE, stride,
+                                  ctypes.c_void_p(offset))
+            glVertexAttribDivisor(locations[attribute], 1)
+
+        stride = VERTEX_FLOATS * 4
+        for (buffer, count), mode in zip(self.mesh_buffers[name, level], (GL_TRIANGLES, GL_LINES)):
+            if buffer is None:
+                continue
+            glBindBuffer(GL_ARRAY_BUFFER, buffer)
+            for attribute, offset in (('position', 0), ('color', 12)):
+                glEnableVertexAttribArray(locations[attribute])
+                glVertexAttribPointer(locations[attribute], 3, GL_FLOAT, GL_FALSE, stride,
+                                      ctypes.c_void_p(offset))
+                glVertexAttribDivisor(locations[attribute], 0)
+            glDrawArraysInstanced(mode, 0, count, len(instances))
+            self.draw_calls += 1
+
+    def release(self):
+        if self.program is None:
+            return
+        for buffers in self.mesh_buffers.values():
+            for buffer, _ in buffers:
+                if buffer is not None:
+                    glDeleteBuffers(1, [buffer])
+        glDeleteBuffers(1, [self.instance_buffer])
+        glDeleteProgram(self.program)
+        self.mesh_buffers = {}
+        self.instance_buffer = None
+        self.program = None
@@ -0,0 +1,58 @@
+import numpy as np
+
+from kernels import squared_distances
+
+
+# Distance bands around the player; anything a missile can reach runs at full rate
+NEAR_RADIUS = 1200
+FAR_RADIUS = 3000
+REDUCED_INTERVAL = 4            # ticks between updates in the reduced tier
+MAX_CATCH_UP = 1.0              # seconds of skipped AI integrated on promotion
+
+TIER_FULL = 0
+TIER_REDUCED = 1
+TIER_DORMANT = 2
+TIER_NAMES = ('full', 'reduced', 'dormant')
+
+
+class InterestManager:
+    """Sorts hostiles into AI update tiers by their distance from the player
+
+    Each live hostile banks the simulation time it has not been integrated for
+    (the hostiles' timer column). Full-tier rows spend it every tick, reduced
+    rows every few ticks on a per-slot stagger, and dormant rows only bank it,
+    capped at MAX_CATCH_UP, so a promoted hostile catches up in one step.
+    """
+
+    def __init__(self, near=NEAR_RADIUS, far=FAR_RADIUS, reduced_interval=REDUCED_INTERVAL,
+                 max_catch_up=MAX_CATCH_UP):
+        self.near = near
+        self.far = far
+        self.reduced_interval = reduced_interval
+        self.max_catch_up = max_catch_up
+        self.counts = dict.fromkeys(TIER_NAMES, 0)
+        self.updated = 0
+        self.promotions = 0
+
+    def plan(self, hostiles, active, player_pos, frame, dt):
+        """Bank this tick's time and return (rows to integrate, seconds owed per row)"""
+        rows = np.flatnonzero(active)
+        d2 = squared_distances(hostiles.pos[rows], player_pos)
+        tiers = np.full(len(rows), TIER_DORMANT, dtype=np.int8)
+        tiers[d2 < self.far * self.far] = TIER_REDUCED
+        tiers[d2 < self.near * self.near] = TIER_FULL
+
+        self.promotions = int(np.count_nonzero(tiers < hostiles.tier[rows]))
+        hostiles.tier[rows] = tiers
+        for tier, name in enumerate(TIER_NAMES):
+            self.counts[name] = int(np.count_nonzero(tiers == tier))
+
+        owed = np.minimum(hostiles.timer[rows] + dt, self.max_catch_up)
+        hostiles.timer[rows] = owed
+
+        staggered = (rows + frame) % self.reduced_interval == 0
+        due = (tiers == TIER_FULL) | ((tiers == TIER_REDUCED) & staggered)
+        due_rows = rows[due]
+        hostiles.timer[due_rows] = 0.0
+        self.updated = len(due_rows)
+        return due_rows, owed[due]
@@ -0,0 +1,180 @@
+import numpy as np
+
+
+# Upper bound on the missile x hostile distance block evaluated at once
+MAX_PAIR_BLOCK = 1 << 20
+
+
+def squared_distances(positions, point):
+    """Squared distance from every row of an (n, 3) array to one point"""
+    delta = positions - point
+    return np.einsum('ij,ij->i', delta, delta)
+
+
+def segment_sphere_entries(starts, ends, centers, radius):
+    """Fraction along each start->end segment where it first comes within radius of its center
+
+    Rows that never get that close come back as inf. Arguments broadcast against
+    each other, so one segment can be tested against many centers.
+    """
+    direction = ends - starts
+    offset = starts - centers
+    c = np.sum(offset * offset, axis=-1) - radius * radius
+    a = np.sum(direction * direction, axis=-1)
+    b = np.sum(offset * direction, axis=-1)
+    disc = b * b - a * c
+    with np.errstate(divide='ignore', invalid='ignore'):
+        entry = (-b - np.sqrt(disc)) / a
+    hit = (a > 0) & (b < 0) & (disc > 0) & (entry <= 1)
+    return np.where(c < 0, 0.0, np.where(hit, entry, np.inf))
+
+
+def ring_crossings(start, end, centers, radius):
+    """Fraction along start->end where it passes through each ring facing the y axis, or inf"""
+    y0 = start[1]
+    y1 = end[1]
+    ry = centers[:, 1]
+    crossed = (min(y0, y1) < ry) & (ry <= max(y0, y1))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        along = (ry - y0) / (y1 - y0)
+    ox = start[0] + (end[0] - start[0]) * along - centers[:, 0]
+    oz = start[2] + (end[2] - start[2]) * along - centers[:, 2]
+    inside = crossed & (ox * ox + oz * oz < radius * radius)
+    return np.where(inside, along, np.inf)
+
+
+def pursue_targets(pos, rows, target, chase_vel, time_x, time_z, evade_x_speed, evade_z_speed, dt):
+    """Chase-and-weave step for the given rows of an (n, 3) position array, in place
+
+    Performs the same floating-point operations in the same order as the scalar
+    Simulation.ai_behavior_update, so both produce identical positions.
+    chase_vel and dt may be scalars or per-row arrays.
+    """
+    x = pos[rows, 0]
+    y = pos[rows, 1]
+    z = pos[rows, 2]
+    dx = target[0] - x
+    dy = target[1] - y
+    dz = target[2] - z
+    dist = np.sqrt(dx * dx + dy * dy + dz * dz)
+
+    # Hostiles sitting exactly on the target stay put
+    moving = dist > 0
+    if not moving.all():
+        rows, x, y, z, dx, dy, dz, dist = (
+            values[moving] for values in (rows, x, y, z, dx, dy, dz, dist))
+        if np.ndim(chase_vel):
+            chase_vel = chase_vel[moving]
+        if np.ndim(dt):
+            dt = dt[moving]
+
+    x = x + dx / dist * chase_vel
+    y = y + dy / dist * chase_vel
+    z = z + dz / dist * chase_vel
+    x = x + np.sin(time_x + y * 0.005) * evade_x_speed * dt
+    z = z + np.cos(time_z + x * 0.005) * evade_z_speed * dt
+    pos[rows, 0] = x
+    pos[rows, 1] = y
+    pos[rows, 2] = z
+
+
+def candidate_pairs(sources, targets, radius, max_pairs=MAX_PAIR_BLOCK):
+    """All (source, target) index pairs closer than radius, sorted by source then target"""
+    if not len(sources) or not len(targets):
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+
+    radius_sq = radius * radius
+    chunk = max(1, max_pairs // len(targets))
+    pair_sources = []
+    pair_targets = []
+    for start in range(0, len(sources), chunk):
+        block = sources[start:start + chunk]
+        delta = block[:, None, :] - targets[None, :, :]
+        d2 = np.einsum('ijk,ijk->ij', delta, delta)
+        rows, cols = np.nonzero(d2 < radius_sq)
+        pair_sources.append(rows + start)
+        pair_targets.append(cols)
+    return np.concatenate(pair_sources), np.concatenate(pair_targets)
+
+
+def resolve_first_hits(pair_sources, pair_targets, target_count):
+    """Give each source its first free target, earlier sources claiming first
+
+    Matches processing the sources one by one in index order, each taking the
+    lowest-index target still available, but settles every source whose claim
+    cannot be affected by an earlier one in the same array pass.
+    """
+    taken = np.zeros(target_count, dtype=bool)
+    winners = []
+    victims = []
+    while len(pair_sources):
+        free = ~taken[pair_targets]
+        pair_sources = pair_sources[free]
+        pair_targets = pair_targets[free]
+        if not len(pair_sources):
+            break
+
+        # Each source proposes its lowest-index free target
+        first = np.ones(len(pair_sources), dtype=bool)
+        first[1:] = pair_sources[1:] != pair_sources[:-1]
+        claim_sources = pair_sources[first]
+        claim_targets = pair_targets[first]
+
+        # Claims are exact up to the first one already made by an earlier source
+        _, earliest = np.unique(claim_targets, return_index=True)
+        unique_claim = np.zeros(len(claim_targets), dtype=bool)
+        unique_claim[earliest] = True
+        clashes = np.flatnonzero(~unique_claim)
+        settled = clashes[0] if len(clashes) else len(claim_targets)
+
+        winners.append(claim_sources[:settled])
+        victims.append(claim_targets[:settled])
+        taken[claim_targets[:settled]] = True
+        keep = pair_sources > claim_sources[settled - 1]
+        pair_sources = pair_sources[keep]
+        pair_targets = pair_targets[keep]
+
+    if not winners:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+    return np.concatenate(winners), np.concatenate(victims)
+
+
+def earliest_first(pair_sources, pair_targets, entries):
+    """Pairs that made contact, sorted by source, then entry fraction, then target"""
+    touched = np.isfinite(entries)
+    pair_sources = pair_sources[touched]
+    pair_targets = pair_targets[touched]
+    order = np.lexsort((pair_targets, entries[touched], pair_sources))
+    return pair_sources[order], pair_targets[order]
+
+
+def segment_pairs(starts, ends, targets, radius, max_pairs=MAX_PAIR_BLOCK):
+    """(segment, target) pairs where the segment passes within radius, earliest contact first"""
+    if not len(starts) or not len(targets):
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+
+    # Broadphase on segment midpoints, widened by the longest half-segment
+    mids = (starts + ends) * 0.5
+    steps = ends - starts
+    reach = radius + np.sqrt(np.einsum('ij,ij->i', steps, steps).max()) * 0.5
+    pair_sources, pair_targets = candidate_pairs(mids, targets, reach, max_pairs)
+    entries = segment_sphere_entries(starts[pair_sources], ends[pair_sources],
+                                     targets[pair_targets], radius)
+    return earliest_first(pair_sources, pair_targets, entries)
+
+
+def resolve_missile_hits(missile_pos, hostile_pos, radius, max_pairs=MAX_PAIR_BLOCK,
+                         missile_start=None):
+    """Missile/hostile index pairs destroyed this tick, one kill per missile and per hostile
+
+    With missile_start, each missile is tested along its path from there and hits
+    the hostile it reaches first.
+    """
+    if missile_start is None:
+        missile_start = missile_pos
+    pair_missiles, pair_hostiles = segment_pairs(missile_start, missile_pos, hostile_pos, radius,
+                                                 max_pairs)
+    return resolve_first_hits(pair_missiles, pair_hostiles, len(hostile_pos))
@@ -0,0 +1,42 @@
+# Flat RGB materials shared by the model parts, keyed by name. Each palette covers
+# every material of the models it is drawn with, so geometry never hard-codes a colour.
+FINAL_PALETTE = {
+    # Player aircraft
+    'hull': (0.75, 0.75, 0.75),
+    'wing': (0.85, 0.85, 0.85),
+    'tail': (0.65, 0.65, 0.65),
+    'propeller': (0.25, 0.25, 0.25),
+    'canopy': (0.15, 0.15, 0.55),
+    # Ring gate bands, outermost first
+    'ring_outer': (0.0, 0.0, 0.5),
+    'ring_middle': (0.5, 0.5, 0),
+    'ring_inner': (0, 0, 0),
+    # Hazards
+    'cloud': (0.95, 0.95, 0.95),
+    'rock': (0.45, 0.35, 0.25),
+    'balloon': (1.0, 0.42, 0.72),
+    'tether': (0.9, 0.9, 0.9),
+    # Enemies and projectiles
+    'hostile_body': (0.85, 0.15, 0.15),
+    'hostile_wing': (0.65, 0.05, 0.05),
+    'hostile_tail': (0.55, 0.05, 0.05),
+    'beacon': (1, 0, 0),
+    'missile': (1, 0.95, 0),
+    # Powerup crystal and its frame
+    'pickup': (0, 0.95, 0.95),
+    'pickup_frame': (1, 1, 1),
+}
+
+# Gold rings and red balloons, as edit01.py draws them; its rings have no inner band
+CLASSIC_PALETTE = dict(
+    {name: colour for name, colour in FINAL_PALETTE.items() if name != 'ring_inner'},
+    ring_outer=(1, 0.95, 0),
+    ring_middle=(0.5, 0.475, 0),
+    balloon=(0.95, 0.15, 0.15),
+    tether=(0.75, 0.75, 0.75),
+)
+
+PALETTES = {
+    'final': FINAL_PALETTE,
+    'classic': CLASSIC_PALETTE,
+}
@@ -0,0 +1,117 @@
+import math
+
+import numpy as np
+
+from gl_resources import CUBE_FACES, part_at_lod
+
+
+class Mesh:
+    """Flattened model geometry: rows of x, y, z, r, g, b for triangles and lines"""
+
+    def __init__(self, triangles, lines):
+        self.triangles = triangles
+        self.lines = lines
+
+
+def transform_matrix(ops):
+    """4x4 matrix for translate/rotate/scale ops composed the way GL does"""
+    matrix = np.identity(4)
+    for op in ops:
+        step = np.identity(4)
+        if op[0] == 'translate':
+            step[:3, 3] = op[1:]
+        elif op[0] == 'scale':
+            step[0, 0], step[1, 1], step[2, 2] = op[1:]
+        else:
+            angle, x, y, z = op[1:]
+            axis = np.array([x, y, z], dtype=float)
+            axis /= np.linalg.norm(axis)
+            c = math.cos(math.radians(angle))
+            s = math.sin(math.radians(angle))
+            cross = np.array([[0, -axis[2], axis[1]],
+                              [axis[2], 0, -axis[0]],
+                              [-axis[1], axis[0], 0]])
+            step[:3, :3] = c * np.identity(3) + s * cross + (1 - c) * np.outer(axis, axis)
+        matrix = matrix @ step
+    return matrix
+
+
+def cube_triangles(size):
+    half = size / 2
+    vertices = []
+    for _, corners in CUBE_FACES:
+        a, b, c, d = corners
+        vertices.extend((a, b, c, a, c, d))
+    return np.array(vertices, dtype=float) * half
+
+
+def cube_lines(size):
+    half = size / 2
+    vertices = []
+    for _, corners in CUBE_FACES:
+        for index in range(4):
+            vertices.append(corners[index])
+            vertices.append(corners[(index + 1) % 4])
+    return np.array(vertices, dtype=float) * half
+
+
+def grid_triangles(points):
+    """Two triangles per cell of an (rows, cols, 3) grid of points"""
+    a = points[:-1, :-1]
+    b = points[:-1, 1:]
+    c = points[1:, 1:]
+    d = points[1:, :-1]
+    return np.stack((a, b, c, a, c, d), axis=2).reshape(-1, 3)
+
+
+def sphere_triangles(radius, slices, stacks):
+    """Same layout as gluSphere: poles on the z axis"""
+    theta = np.linspace(0, math.pi, stacks + 1)[:, None]
+    phi = np.linspace(0, 2 * math.pi, slices + 1)[None, :]
+    points = np.stack((np.sin(theta) * np.cos(phi),
+                       np.sin(theta) * np.sin(phi),
+                       np.cos(theta) * np.ones_like(phi)), axis=-1)
+    return grid_triangles(points * radius)
+
+
+def cylinder_triangles(base, top, height, slices, stacks):
+    """Same layout as gluCylinder: an open tube from z=0 to z=height"""
+    along = np.linspace(0, 1, stacks + 1)[:, None]
+    phi = np.linspace(0, 2 * math.pi, slices + 1)[None, :]
+    radius = base + (top - base) * along
+    points = np.stack((radius * np.cos(phi),
+                       radius * np.sin(phi),
+                       height * along * np.ones_like(phi)), axis=-1)
+    return grid_triangles(points)
+
+
+SHAPE_TRIANGLES = {
+    'cube': cube_triangles,
+    'sphere': sphere_triangles,
+    'cylinder': cylinder_triangles,
+}
+
+
+def colored(vertices, ops, color):
+    """Transformed vertices with the part's colour appended; no colour means white"""
+    homogeneous = np.hstack((vertices, np.ones((len(vertices), 1))))
+    placed = (homogeneous @ transform_matrix(ops).T)[:, :3]
+    rgb = np.broadcast_to(color if color is not None else (1.0, 1.0, 1.0), (len(vertices), 3))
+    return np.hstack((placed, rgb))
+
+
+def build_mesh(parts, palette, level=0):
+    """Tessellate a model's parts into one Mesh at a level of detail, coloured from palette"""
+    triangles = [np.zeros((0, 6))]
+    lines = [np.zeros((0, 6))]
+    for item in parts:
+        item = part_at_lod(item, level)
+        material = item['material']
+        color = palette[material] if material is not None else None
+        if item['shape'] == 'wire_cube':
+            lines.append(colored(cube_lines(*item['dims']), item['ops'], color))
+        else:
+            vertices = SHAPE_TRIANGLES[item['shape']](*item['dims'])
+            triangles.append(colored(vertices, item['ops'], color))
+    return Mesh(np.concatenate(triangles).astype(np.float32),
+                np.concatenate(lines).astype(np.float32))
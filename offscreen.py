@@ -0,0 +1,49 @@
+import ctypes
+import os
+
+# PyOpenGL picks its platform on first import, so this module has to be
+# imported before anything else touches OpenGL. Without an X display, Mesa's
+# surfaceless EGL platform still gives a full software (llvmpipe) context.
+os.environ.setdefault('PYOPENGL_PLATFORM', 'egl')
+if not os.environ.get('DISPLAY'):
+    os.environ.setdefault('EGL_PLATFORM', 'surfaceless')
+
+from OpenGL import EGL
+
+
+class OffscreenContext:
+    """Desktop GL context on an EGL pbuffer, for rendering without a window"""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+        major, minor = EGL.EGLint(), EGL.EGLint()
+        if not EGL.eglInitialize(self.display, ctypes.pointer(major), ctypes.pointer(minor)):
+            raise RuntimeError("Could not initialise an EGL display")
+
+        attributes = (EGL.EGLint * 13)(
+            EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+            EGL.EGL_RED_SIZE, 8, EGL.EGL_GREEN_SIZE, 8, EGL.EGL_BLUE_SIZE, 8,
+            EGL.EGL_DEPTH_SIZE, 24,
+            EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+            EGL.EGL_NONE)
+        config = EGL.EGLConfig()
+        count = EGL.EGLint()
+        if not EGL.eglChooseConfig(self.display, attributes, ctypes.pointer(config), 1,
+                                   ctypes.pointer(count)) or not count.value:
+            raise RuntimeError("No EGL config supports desktop OpenGL pbuffers")
+
+        size = (EGL.EGLint * 5)(EGL.EGL_WIDTH, width, EGL.EGL_HEIGHT, height, EGL.EGL_NONE)
+        self.surface = EGL.eglCreatePbufferSurface(self.display, config, size)
+        EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+        self.context = EGL.eglCreateContext(self.display, config, EGL.EGL_NO_CONTEXT, None)
+        if not EGL.eglMakeCurrent(self.display, self.surface, self.surface, self.context):
+            raise RuntimeError("Could not make the offscreen GL context current")
+
+    def release(self):
+        EGL.eglMakeCurrent(self.display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE,
+                           EGL.EGL_NO_CONTEXT)
+        EGL.eglDestroyContext(self.display, self.context)
+        EGL.eglDestroySurface(self.display, self.surface)
+        EGL.eglTerminate(self.display)
@@ -0,0 +1,84 @@
+import numpy as np
+from OpenGL.GL import *
+
+from culling import matrix_rows
+
+
+SPRITE_SIZE = 32                # texels across the round sprite texture
+# Quad corners as (right, up) multiples of a particle's radius, with texcoords
+CORNERS = np.array([(-1, -1), (1, -1), (1, 1), (-1, 1)], dtype=np.float32)
+CORNER_TEXCOORDS = (CORNERS + 1) * 0.5
+
+
+class ParticleSprites:
+    """Camera-facing round sprites for every live particle in one draw call
+
+    Each particle becomes a quad spanning its radius along the camera's right
+    and up axes, textured with a disc whose outside is dropped by the alpha
+    test, so puffs depth-sort against the world like the spheres they replace.
+    """
+
+    def __init__(self):
+        self.texture = None
+        self.draw_calls = 0
+
+    def build(self):
+        if self.texture is not None:
+            return
+        # Opaque inside the unit disc, transparent outside it
+        centres = (np.arange(SPRITE_SIZE) + 0.5) / SPRITE_SIZE * 2 - 1
+        inside = centres[:, None] ** 2 + centres[None, :] ** 2 <= 1.0
+        alpha = np.where(inside, 255, 0).astype(np.uint8)
+
+        self.texture = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_ALPHA, SPRITE_SIZE, SPRITE_SIZE, 0, GL_ALPHA,
+                     GL_UNSIGNED_BYTE, alpha)
+        glBindTexture(GL_TEXTURE_2D, 0)
+
+    def draw(self, particles):
+        """Draw a ParticleSystem; the modelview must hold only the camera's view"""
+        self.draw_calls = 0
+        count = len(particles)
+        if not count or self.texture is None:
+            return
+        # The view matrix's first two rows are the camera's right and up in world space
+        view = np.array(matrix_rows(GL_MODELVIEW_MATRIX), dtype=np.float32)
+        axes = view[:2, :3]
+
+        progress = particles.progress()
+        sizes = particles.sizes()
+        offsets = CORNERS @ axes
+        vertices = (particles.pos[:count, None, :] + sizes[:, None, None] * offsets).astype(np.float32)
+        colors = np.empty((count, 4, 3), dtype=np.float32)
+        colors[..., 0] = 1.0
+        colors[..., 1] = (1.0 - progress)[:, None]
+        colors[..., 2] = 0.0
+        texcoords = np.broadcast_to(CORNER_TEXCOORDS, (count, 4, 2)).copy()
+
+        glPushAttrib(GL_ENABLE_BIT | GL_COLOR_BUFFER_BIT | GL_TEXTURE_BIT | GL_CURRENT_BIT)
+        glPushClientAttrib(GL_CLIENT_VERTEX_ARRAY_BIT)
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        glTexEnvi(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_MODULATE)
+        glEnable(GL_ALPHA_TEST)
+        glAlphaFunc(GL_GREATER, 0.5)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, vertices)
+        glColorPointer(3, GL_FLOAT, 0, colors)
+        glTexCoordPointer(2, GL_FLOAT, 0, texcoords)
+        glDrawArrays(GL_QUADS, 0, count * 4)
+        self.draw_calls += 1
+        glPopClientAttrib()
+        glPopAttrib()
+
+    def release(self):
+        if self.texture is not None:
+            glDeleteTextures(1, [self.texture])
+            self.texture = None
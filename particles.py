@@ -0,0 +1,96 @@
+import numpy as np
+
+
+PARTICLES_PER_BURST = 5
+BURST_SPREAD = 20.0             # largest spawn offset from the burst centre on each axis
+BURST_DRIFT = 40.0              # largest drift speed on each axis, units per second
+BURST_BASE_SIZE = 10.0
+BURST_GROWTH = 40.0             # size added over a particle's lifetime
+TIMER_EPSILON = 1e-9            # as in simulation, so bursts end on their effect's tick
+# Later puffs of a burst are smaller, as the five-sphere explosions were
+BURST_SCALES = 1.0 - np.arange(PARTICLES_PER_BURST) * 0.2
+
+
+class ParticleSystem:
+    """Fixed-capacity particle buffer kept in NumPy columns
+
+    Live particles are always rows [:count] in spawn order. Offsets and drift
+    velocities are drawn once when a burst is emitted, so a burst looks the same
+    every frame and replays identically for a given seed. advance() ages every
+    particle at once and compacts the survivors without reordering them; when
+    the buffer is full the oldest particles at the front make room.
+    """
+
+    def __init__(self, capacity, lifetime, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.lifetime = lifetime
+        self.pos = np.zeros((capacity, 3))
+        self.vel = np.zeros((capacity, 3))
+        self.scale = np.zeros(capacity)
+        self.timer = np.zeros(capacity)
+        self.count = 0
+        self.overflows = 0
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def capacity(self):
+        return len(self.timer)
+
+    def emit(self, origins):
+        """Start one burst at each row of an (n, 3) array of positions"""
+        origins = np.asarray(origins, dtype=float).reshape(-1, 3)
+        spawned = len(origins) * PARTICLES_PER_BURST
+        if not spawned:
+            return
+        rng = self.rng
+        pos = np.repeat(origins, PARTICLES_PER_BURST, axis=0)
+        pos += rng.uniform(-BURST_SPREAD, BURST_SPREAD, (spawned, 3))
+        vel = rng.uniform(-BURST_DRIFT, BURST_DRIFT, (spawned, 3))
+        scale = np.tile(BURST_SCALES, len(origins))
+
+        # Keep only the newest particles if a single emit overfills the buffer
+        capacity = self.capacity
+        if spawned > capacity:
+            self.overflows += spawned - capacity
+            pos, vel, scale = pos[-capacity:], vel[-capacity:], scale[-capacity:]
+            spawned = capacity
+        excess = self.count + spawned - capacity
+        if excess > 0:
+            self.overflows += excess
+            self.keep(slice(excess, self.count))
+
+        start, end = self.count, self.count + spawned
+        self.pos[start:end] = pos
+        self.vel[start:end] = vel
+        self.scale[start:end] = scale
+        self.timer[start:end] = self.lifetime
+        self.count = end
+
+    def advance(self, dt):
+        """Move and age every live particle by dt, dropping the expired ones"""
+        live = slice(0, self.count)
+        self.pos[live] += self.vel[live] * dt
+        self.timer[live] -= dt
+        expired = self.timer[live] <= TIMER_EPSILON
+        if expired.any():
+            self.keep(~expired)
+
+    def keep(self, rows):
+        """Compact the live rows selected by a slice or mask to the front"""
+        for column in (self.pos, self.vel, self.scale, self.timer):
+            kept = column[:self.count][rows]
+            column[:len(kept)] = kept
+        self.count = len(kept)
+
+    def progress(self):
+        """Fraction of its lifetime each live particle has used, 0 at spawn"""
+        return 1.0 - self.timer[:self.count] / self.lifetime
+
+    def sizes(self):
+        """Current radius of each live particle"""
+        return (BURST_BASE_SIZE + self.progress() * BURST_GROWTH) * self.scale[:self.count]
+
+    def clear(self):
+        self.count = 0
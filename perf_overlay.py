@@ -0,0 +1,147 @@
+import time
+from collections import deque
+
+import numpy as np
+from OpenGL.GL import *
+
+from profiling import NULL_SCOPE
+
+
+PHASES = ('sim', 'render', 'swap')
+PHASE_COLORS = {
+    'sim': (0.3, 0.6, 1.0),
+    'render': (0.3, 0.9, 0.3),
+    'swap': (1.0, 0.6, 0.2),
+}
+IDLE_COLOR = (0.45, 0.45, 0.45)     # the rest of the frame interval: waiting, event handling
+BUDGET_COLOR = (1.0, 0.2, 0.2)
+BACKDROP_ALPHA = 0.6
+
+GRAPH_FRAMES = 240                  # frames of history scrolling across the graph
+GRAPH_ORIGIN = (500, 10)            # bottom-left corner in HUD coordinates
+GRAPH_SIZE = (480, 120)
+GRAPH_RANGE = 2.0                   # graph height in frame budgets; longer frames are clipped
+AVERAGE_FRAMES = 30                 # frames the text readouts average over
+
+
+class PerfOverlay:
+    """Per-frame timings and the scrolling graph of them drawn over the HUD
+
+    While visible, measure() times a phase of the current frame (the sim ticks
+    run from the idle callback, the render and the buffer swap) and end_frame()
+    closes it. Each frame's graph column stacks the phases under the full frame
+    interval, against a line at the frame budget. Hidden, it records nothing.
+    """
+
+    def __init__(self, budget, visible=False):
+        self.budget = budget
+        self.visible = visible
+        self.frames = deque(maxlen=GRAPH_FRAMES)
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.last_end = None
+
+    def toggle(self):
+        self.visible = not self.visible
+        # Frames while hidden were not measured, so the history starts over
+        self.frames.clear()
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.last_end = None
+
+    def measure(self, phase):
+        """Context manager adding a block's duration to the frame's phase"""
+        if not self.visible:
+            return NULL_SCOPE
+        return PhaseTimer(self.current, phase)
+
+    def end_frame(self):
+        """Close the frame at the end of its swap; its length is the time since the last one"""
+        if not self.visible:
+            return
+        now = time.perf_counter()
+        last, self.last_end = self.last_end, now
+        if last is not None:
+            self.frames.append((now - last,) + tuple(self.current[phase] for phase in PHASES))
+        self.current = dict.fromkeys(PHASES, 0.0)
+
+    def averages(self):
+        """Mean frame interval and phase times in seconds over the last AVERAGE_FRAMES"""
+        recent = list(self.frames)[-AVERAGE_FRAMES:]
+        if not recent:
+            return dict.fromkeys(('frame',) + PHASES, 0.0)
+        means = np.mean(recent, axis=0)
+        return dict(zip(('frame',) + PHASES, means.tolist()))
+
+    def draw_graph(self):
+        """Stacked phase columns for each recorded frame and the budget line
+
+        Expects the HUD's 2D projection; every column is built in one NumPy pass
+        and drawn from client arrays so the overlay stays cheap next to the frame
+        it measures.
+        """
+        left, bottom = GRAPH_ORIGIN
+        width, height = GRAPH_SIZE
+        glPushAttrib(GL_ENABLE_BIT | GL_COLOR_BUFFER_BIT | GL_CURRENT_BIT)
+        glDisable(GL_TEXTURE_2D)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glColor4f(0, 0, 0, BACKDROP_ALPHA)
+        glRectf(left, bottom, left + width, bottom + height)
+        glDisable(GL_BLEND)
+
+        if self.frames:
+            glPushClientAttrib(GL_CLIENT_VERTEX_ARRAY_BIT)
+            vertices, colors = self.graph_quads()
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glEnableClientState(GL_COLOR_ARRAY)
+            glVertexPointer(2, GL_FLOAT, 0, vertices)
+            glColorPointer(3, GL_FLOAT, 0, colors)
+            glDrawArrays(GL_QUADS, 0, len(vertices))
+            glPopClientAttrib()
+
+        budget_y = bottom + height / GRAPH_RANGE
+        glColor3f(*BUDGET_COLOR)
+        glBegin(GL_LINES)
+        glVertex2f(left, budget_y)
+        glVertex2f(left + width, budget_y)
+        glEnd()
+        glPopAttrib()
+
+    def graph_quads(self):
+        """Vertex and colour arrays for a quad per phase band of every frame, newest at the right"""
+        left, bottom = GRAPH_ORIGIN
+        width, height = GRAPH_SIZE
+        frames = np.array(self.frames)
+        count = len(frames)
+        # Band edges: the phases stacked from zero, then idle time up to the frame interval
+        edges = np.zeros((count, len(PHASES) + 2))
+        edges[:, 1:-1] = np.cumsum(frames[:, 1:], axis=1)
+        edges[:, -1] = np.maximum(frames[:, 0], edges[:, -2])
+        edges = bottom + np.minimum(edges * (height / (GRAPH_RANGE * self.budget)), height)
+
+        column = width / GRAPH_FRAMES
+        x0 = left + (GRAPH_FRAMES - count + np.arange(count)) * column
+        x1 = x0 + column
+        lows, highs = edges[:, :-1], edges[:, 1:]
+        bands = lows.shape[1]
+        xs = np.stack([x0, x1, x1, x0], axis=1)[:, None, :].repeat(bands, axis=1)
+        ys = np.stack([lows, lows, highs, highs], axis=2)
+        vertices = np.stack([xs, ys], axis=3).reshape(-1, 2).astype(np.float32)
+
+        palette = np.array([PHASE_COLORS[phase] for phase in PHASES] + [IDLE_COLOR], dtype=np.float32)
+        colors = np.broadcast_to(palette[None, :, None, :], (count, bands, 4, 3)).reshape(-1, 3)
+        return vertices, np.ascontiguousarray(colors)
+
+
+class PhaseTimer:
+    def __init__(self, totals, phase):
+        self.totals = totals
+        self.phase = phase
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.totals[self.phase] += time.perf_counter() - self.start
+        return False
@@ -0,0 +1,70 @@
+# Overflow policies when a pool is full
+DROP_OLDEST = 'drop_oldest'
+REFUSE = 'refuse'
+
+
+class EntityPool:
+    """Fixed set of preallocated entity dicts; the live ones are items[:count]
+
+    Items are reused in place and removed by swapping the last live item into
+    the hole, so acquiring and releasing never allocate and never shift the list.
+    Iteration order is therefore not spawn order.
+    """
+
+    def __init__(self, factory, capacity, overflow=DROP_OLDEST):
+        if overflow not in (DROP_OLDEST, REFUSE):
+            raise ValueError(f"Unknown pool overflow policy: {overflow}")
+        self.items = [factory() for _ in range(capacity)]
+        for item in self.items:
+            item['serial'] = 0
+        self.count = 0
+        self.overflow = overflow
+        self.next_serial = 0
+        self.overflows = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        items = self.items
+        for index in range(self.count):
+            yield items[index]
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return self.items[index]
+
+    @property
+    def capacity(self):
+        return len(self.items)
+
+    def acquire(self):
+        """Hand out a free item to be filled in place, or None if the pool refuses"""
+        items = self.items
+        if self.count < len(items):
+            item = items[self.count]
+            self.count += 1
+        else:
+            self.overflows += 1
+            if self.overflow == REFUSE:
+                return None
+            # Recycle the oldest live item; only scanned when the pool is full
+            oldest = 0
+            for index in range(1, self.count):
+                if items[index]['serial'] < items[oldest]['serial']:
+                    oldest = index
+            item = items[oldest]
+        item['serial'] = self.next_serial
+        self.next_serial += 1
+        return item
+
+    def release_at(self, index):
+        """Free the live item at index by swapping the last live item into its place"""
+        last = self.count - 1
+        items = self.items
+        items[index], items[last] = items[last], items[index]
+        self.count = last
+
+    def clear(self):
+        self.count = 0
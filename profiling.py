@@ -0,0 +1,192 @@
+import sys
+import time
+from abc import ABC, abstractmethod
+
+
+WINDOW = 600                    # most recent samples kept per scope and gauge
+
+
+class RollingSamples:
+    """The last WINDOW values recorded, plus a count of every value ever recorded"""
+
+    def __init__(self, window=WINDOW):
+        self.values = []
+        self.window = window
+        self.next = 0
+        self.count = 0
+
+    def add(self, value):
+        if len(self.values) < self.window:
+            self.values.append(value)
+        else:
+            self.values[self.next] = value
+            self.next = (self.next + 1) % self.window
+        self.count += 1
+
+    def summary(self):
+        """Min, mean, p99 and latest over the window, or None before the first sample"""
+        if not self.values:
+            return None
+        ordered = sorted(self.values)
+        return {
+            'count': self.count,
+            'min': ordered[0],
+            'mean': sum(ordered) / len(ordered),
+            'p99': ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+            'latest': self.values[self.next - 1],
+        }
+
+
+def wrap_call(function, enter, leave):
+    """function wrapped to run leave(enter()) around every call, even one that raises"""
+    def wrapper(*args, **kwargs):
+        token = enter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            leave(token)
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+class Instrumentation(ABC):
+    """Timing wrappers installed on named functions, shared by Profiler and TraceRecorder
+
+    Functions are timed by replacing them on their owner with a wrapper around
+    perf_counter_ns (instrument()), so a disabled instance installs nothing and
+    costs nothing. Subclasses decide what a timed call records (finish()) and
+    what a sampled call reads afterwards (sample()).
+    """
+
+    enabled = False
+
+    @abstractmethod
+    def finish(self, name, start, end):
+        """Record one call of the function timed under name, both perf_counter_ns readings"""
+
+    def sample(self):
+        pass
+
+    def timed(self, name, function, sample=False):
+        """function wrapped to record its duration under name, then sample if asked"""
+        counter = time.perf_counter_ns
+        finish = self.finish
+
+        def leave(start):
+            finish(name, start, counter())
+            if sample:
+                self.sample()
+        return wrap_call(function, counter, leave)
+
+    def instrument(self, owner, names, prefix='', sample=False):
+        """Time each named function or method of owner under prefix + name"""
+        if not self.enabled:
+            return
+        for name in names:
+            setattr(owner, name, self.timed(prefix + name, getattr(owner, name), sample))
+
+
+class Profiler(Instrumentation):
+    """Named timing scopes and gauges for the update and render loops
+
+    Gauges are read once per sampled call of an instrumented function,
+    typically once per frame.
+    """
+
+    def __init__(self, enabled=False, window=WINDOW):
+        self.enabled = enabled
+        self.window = window
+        self.scopes = {}
+        self.gauges = {}
+        self.readers = {}
+
+    def record(self, name, nanoseconds):
+        samples = self.scopes.get(name)
+        if samples is None:
+            samples = self.scopes[name] = RollingSamples(self.window)
+        samples.add(nanoseconds)
+
+    def finish(self, name, start, end):
+        self.record(name, end - start)
+
+    def scope(self, name):
+        """Context manager timing a block; a no-op when disabled"""
+        if not self.enabled:
+            return NULL_SCOPE
+        return Scope(self, name)
+
+    def add_gauge(self, name, read):
+        """Sample read() under name whenever gauges are sampled"""
+        if self.enabled:
+            self.readers[name] = read
+
+    def reset(self):
+        """Forget every recorded sample, keeping the installed wrappers and gauges"""
+        self.scopes = {}
+        self.gauges = {}
+
+    def sample(self):
+        """Read every gauge once"""
+        for name, read in self.readers.items():
+            samples = self.gauges.get(name)
+            if samples is None:
+                samples = self.gauges[name] = RollingSamples(self.window)
+            samples.add(read())
+
+    def stats(self):
+        """Per-scope timings in microseconds and per-gauge values, keyed by name"""
+        timings = {}
+        for name, samples in self.scopes.items():
+            summary = samples.summary()
+            for key in ('min', 'mean', 'p99', 'latest'):
+                summary[key] /= 1000
+            timings[name] = summary
+        gauges = {name: samples.summary() for name, samples in self.gauges.items()}
+        return {'scopes': timings, 'gauges': gauges}
+
+    def report(self):
+        """Readable table of every scope and gauge"""
+        stats = self.stats()
+        lines = [f"{'scope':<36}{'calls':>9}{'min us':>11}{'mean us':>11}{'p99 us':>11}"]
+        for name in sorted(stats['scopes']):
+            row = stats['scopes'][name]
+            lines.append(f"{name:<36}{row['count']:>9}{row['min']:>11.1f}{row['mean']:>11.1f}"
+                         f"{row['p99']:>11.1f}")
+        if stats['gauges']:
+            lines.append(f"{'gauge':<36}{'samples':>9}{'min':>11}{'mean':>11}{'latest':>11}")
+            for name in sorted(stats['gauges']):
+                row = stats['gauges'][name]
+                lines.append(f"{name:<36}{row['count']:>9}{row['min']:>11.4g}{row['mean']:>11.4g}"
+                             f"{row['latest']:>11.4g}")
+        return "\n".join(lines)
+
+    def dump(self, stream=None):
+        """Print the report, e.g. from atexit; nothing if nothing was recorded"""
+        if self.scopes or self.gauges:
+            print(self.report(), file=stream or sys.stderr)
+
+
+class Scope:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, time.perf_counter_ns() - self.start)
+        return False
+
+
+class NullScope:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_SCOPE = NullScope()
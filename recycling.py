@@ -0,0 +1,67 @@
+import heapq
+
+
+class RecycleQueue:
+    """Min-heap of entities keyed on a lower bound of their y coordinate
+
+    Recycling pops only the entries whose bound fell below the threshold, plus
+    entities flagged directly (destroyed or collected), instead of scanning the
+    whole list. Entries may be stale; the caller re-checks each entity popped.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.flagged = {}
+        # Only the newest heap entry per key is live; older ones are skipped when popped
+        self.live = {}
+        self.next_serial = 0
+
+    def __len__(self):
+        return len(self.live)
+
+    def push(self, bound, key, entity):
+        self.next_serial += 1
+        self.live[key] = self.next_serial
+        heapq.heappush(self.heap, (bound, key, self.next_serial, entity))
+
+    def discard(self, key):
+        """Stop tracking an entity that left the world"""
+        self.live.pop(key, None)
+        self.flagged.pop(key, None)
+
+    def flag(self, key, entity):
+        """Queue an entity for the next pass whatever its position"""
+        self.flagged[key] = entity
+
+    def due(self, limit):
+        """Pop every entity whose bound is below limit, plus flagged ones, in key order
+
+        Popped entities are no longer tracked until pushed again.
+        """
+        heap = self.heap
+        live = self.live
+        found = self.flagged
+        self.flagged = {}
+        while heap and heap[0][0] < limit:
+            _, key, serial, entity = heapq.heappop(heap)
+            if live.get(key) == serial:
+                del live[key]
+                found[key] = entity
+        for key in found:
+            live.pop(key, None)
+        return [found[key] for key in sorted(found)]
+
+    def rebuild(self, entries):
+        """Replace the heap with fresh (bound, key, entity) entries"""
+        self.heap = []
+        self.live = {}
+        for bound, key, entity in entries:
+            self.next_serial += 1
+            self.live[key] = self.next_serial
+            self.heap.append((bound, key, self.next_serial, entity))
+        heapq.heapify(self.heap)
+
+    def clear(self):
+        self.heap.clear()
+        self.flagged.clear()
+        self.live.clear()
@@ -0,0 +1,191 @@
+import ctypes
+
+import numpy as np
+from OpenGL.GL import *
+from OpenGL.GL import shaders
+
+from culling import matrix_rows
+from gl_resources import LOD_SCALES
+from meshes import build_mesh, transform_matrix
+
+
+VERTEX_FLOATS = 6
+MATRIX_FLOATS = 16
+POSITION, COLOR, MODEL = 0, 1, 2    # the model matrix takes locations 2 to 5
+
+# Sunlight from high above, slightly ahead and to the side
+LIGHT_DIRECTION = np.array((0.3, -0.4, 0.87)) / np.linalg.norm((0.3, -0.4, 0.87))
+AMBIENT = 0.45
+
+# Core-profile GLSL: every transform comes from the per-instance model matrix
+# and the view-projection uniform, never from the fixed-function matrix stacks
+VERTEX_SHADER = """
+#version 330 core
+layout(location = 0) in vec3 position;
+layout(location = 1) in vec3 color;
+layout(location = 2) in mat4 model;
+uniform mat4 view_projection;
+out vec3 world_position;
+out vec3 vertex_color;
+void main() {
+    vec4 world = model * vec4(position, 1.0);
+    world_position = world.xyz;
+    vertex_color = color;
+    gl_Position = view_projection * world;
+}
+"""
+
+# Faceted lighting from the screen-space derivatives of the world position, so
+# meshes need no normals; the derived normal always faces the camera
+FRAGMENT_SHADER = """
+#version 330 core
+in vec3 world_position;
+in vec3 vertex_color;
+uniform vec3 light_direction;
+uniform float ambient;
+uniform bool lit;
+out vec4 fragment;
+void main() {
+    float light = 1.0;
+    if (lit) {
+        vec3 normal = normalize(cross(dFdx(world_position), dFdy(world_position)));
+        light = ambient + (1.0 - ambient) * max(dot(normal, light_direction), 0.0);
+    }
+    fragment = vec4(vertex_color * light, 1.0);
+}
+"""
+
+
+def model_matrices(positions, shapes):
+    """Model matrices translating each row's shape matrix to its position, in one pass
+
+    positions is (n, 3) and shapes (n, 4, 4); the result is (n, 4, 4).
+    """
+    matrices = shapes.copy()
+    matrices[:, :3, 3] += positions
+    return matrices
+
+
+class ShaderRenderer:
+    """Core-profile pipeline drawing every queued entity from one matrix buffer
+
+    queue() records a batch of positions for a mesh with an optional shape
+    transform; flush() builds the model matrix of every queued instance in one
+    NumPy pass, uploads them in a single buffer and issues one instanced draw
+    per mesh and primitive type.
+    """
+
+    def __init__(self, models, palette):
+        self.models = dict(models)
+        self.palette = palette
+        self.program = None
+        self.uniforms = {}
+        self.meshes = {}
+        self.matrix_buffer = None
+        self.batches = []
+        self.draw_calls = 0
+        self.instances = 0
+
+    def build(self):
+        if self.program is not None:
+            return
+        self.program = shaders.compileProgram(
+            shaders.compileShader(VERTEX_SHADER, GL_VERTEX_SHADER),
+            shaders.compileShader(FRAGMENT_SHADER, GL_FRAGMENT_SHADER),
+            validate=False)
+        for name in ('view_projection', 'light_direction', 'ambient', 'lit'):
+            self.uniforms[name] = glGetUniformLocation(self.program, name)
+
+        # One vertex array per mesh and primitive type, with its vertices bound
+        self.matrix_buffer = glGenBuffers(1)
+        stride = VERTEX_FLOATS * 4
+        for name, parts in self.models.items():
+            for level in range(len(LOD_SCALES)):
+                mesh = build_mesh(parts, self.palette, level)
+                arrays = []
+                for vertices in (mesh.triangles, mesh.lines):
+                    if not len(vertices):
+                        arrays.append(None)
+                        continue
+                    array = glGenVertexArrays(1)
+                    buffer = glGenBuffers(1)
+                    glBindVertexArray(array)
+                    glBindBuffer(GL_ARRAY_BUFFER, buffer)
+                    glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+                    for location, offset in ((POSITION, 0), (COLOR, 12)):
+                        glEnableVertexAttribArray(location)
+                        glVertexAttribPointer(location, 3, GL_FLOAT, GL_FALSE, stride,
+                                              ctypes.c_void_p(offset))
+                    glBindBuffer(GL_ARRAY_BUFFER, self.matrix_buffer)
+                    for column in range(4):
+                        glEnableVertexAttribArray(MODEL + column)
+                        glVertexAttribDivisor(MODEL + column, 1)
+                    arrays.append((array, buffer, len(vertices)))
+                self.meshes[name, level] = arrays
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def queue(self, name, positions, shape_ops=(), level=0):
+        """Add instances of a mesh at positions, each transformed by shape_ops first"""
+        if len(positions):
+            self.batches.append(((name, level), positions, transform_matrix(shape_ops)))
+
+    def flush(self):
+        """Draw everything queued with the camera currently set up, then forget it"""
+        batches = self.batches
+        self.batches = []
+        self.draw_calls = 0
+        self.instances = 0
+        if not batches:
+            return
+        counts = [len(positions) for _, positions, _ in batches]
+        positions = np.concatenate([np.asarray(positions, dtype=float).reshape(-1, 3)
+                                    for _, positions, _ in batches])
+        shapes = np.repeat(np.array([shape for _, _, shape in batches]), counts, axis=0)
+        # GL reads each mat4 attribute column by column
+        matrices = np.ascontiguousarray(model_matrices(positions, shapes).transpose(0, 2, 1),
+                                        dtype=np.float32)
+
+        projection = np.array(matrix_rows(GL_PROJECTION_MATRIX))
+        view = np.array(matrix_rows(GL_MODELVIEW_MATRIX))
+        glUseProgram(self.program)
+        glUniformMatrix4fv(self.uniforms['view_projection'], 1, GL_TRUE,
+                           (projection @ view).astype(np.float32))
+        glUniform3f(self.uniforms['light_direction'], *LIGHT_DIRECTION)
+        glUniform1f(self.uniforms['ambient'], AMBIENT)
+        glBindBuffer(GL_ARRAY_BUFFER, self.matrix_buffer)
+        glBufferData(GL_ARRAY_BUFFER, matrices.nbytes, matrices, GL_STREAM_DRAW)
+
+        first = 0
+        stride = MATRIX_FLOATS * 4
+        for (key, _, _), count in zip(batches, counts):
+            for entry, mode in zip(self.meshes[key], (GL_TRIANGLES, GL_LINES)):
+                if entry is None:
+                    continue
+                array, _, vertex_count = entry
+                glBindVertexArray(array)
+                for column in range(4):
+                    glVertexAttribPointer(MODEL + column, 4, GL_FLOAT, GL_FALSE, stride,
+                                          ctypes.c_void_p(first * stride + column * 16))
+                glUniform1i(self.uniforms['lit'], mode == GL_TRIANGLES)
+                glDrawArraysInstanced(mode, 0, vertex_count, count)
+                self.draw_calls += 1
+            first += count
+        self.instances = first
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glUseProgram(0)
+
+    def release(self):
+        if self.program is None:
+            return
+        for arrays in self.meshes.values():
+            for entry in arrays:
+                if entry is not None:
+                    glDeleteVertexArrays(1, [entry[0]])
+                    glDeleteBuffers(1, [entry[1]])
+        glDeleteBuffers(1, [self.matrix_buffer])
+        glDeleteProgram(self.program)
+        self.meshes = {}
+        self.matrix_buffer = None
+        self.program = None
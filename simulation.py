@@ -0,0 +1,996 @@
+import math
+import random
+from collections import deque
+
+from pools import EntityPool, DROP_OLDEST
+from recycling import RecycleQueue
+from spatial_hash import SpatialHash
+
+
+# World constants shared with the renderer
+WORLD_LIMIT = 2000
+RECYCLE_DISTANCE = 400
+SPAWN_AHEAD = 1800
+
+HAZARD_TYPES = ['cloud', 'rock', 'balloon']
+ENTITY_KINDS = ('collectibles', 'hazards', 'hostiles', 'missiles', 'pickups', 'effects')
+GRID_KINDS = ('collectibles', 'hazards', 'hostiles', 'pickups')
+# Systems tick() runs every step, in order; profiling times each by these names
+UPDATE_PHASES = ('physics_update', 'ai_behavior_update', 'projectile_physics', 'process_visual_effects',
+                 'collision_detection', 'manage_object_recycling', 'difficulty_progression')
+# Entities a mission starts with; larger counts spread over proportionally more
+# of the course so their density stays the same
+ENTITY_COUNTS = {'collectibles': 5, 'hazards': 8, 'hostiles': 3, 'pickups': 3}
+
+# Simulation rates, all expressed per second of game time
+TICK_RATE = 60
+BASE_SPEED = 42.0               # forward units per second
+SPEED_PER_LEVEL = 30.0
+BOOST_MULTIPLIER = 5
+PROP_SPIN_RATE = 1200.0         # degrees per second
+HORIZONTAL_DAMPING = 0.85 ** 60  # fraction of velocity kept after one second
+VERTICAL_DAMPING = 0.90 ** 60
+ROLL_DAMPING = 0.95 ** 60
+PITCH_DAMPING = 0.98 ** 60
+BOOST_TIME = 7.0                # seconds
+STREAK_WINDOW = 3.0
+AUTO_FIRE_INTERVAL = 5 / 60
+EFFECT_LIFETIME = 0.5
+MISSILE_SPEED = 1800.0
+MISSILE_RANGE = 1000
+PICKUP_RADIUS = 35
+MISSILE_POOL_SIZE = 64
+EFFECT_POOL_SIZE = 64
+CHASE_SPEED = 30.0
+CHASE_SPEED_PER_LEVEL = 6.0
+EVADE_X_SPEED = 180.0
+EVADE_X_FREQUENCY = 3.0         # radians per second
+EVADE_Z_SPEED = 120.0
+EVADE_Z_FREQUENCY = 2.4
+TIMER_EPSILON = 1e-9
+RECYCLE_SLACK = 1.0             # world units of headroom on the hostile recycle bounds
+MAX_FRAME_TIME = 0.25           # wall-clock seconds fed to the scheduler per frame
+
+# Control actions: (pitch change, roll change, vertical push, horizontal push in units/s)
+CONTROL_ACTIONS = {
+    'climb': (5, 0, 180, 0),
+    'dive': (-5, 0, -180, 0),
+    'bank_left': (0, 8, 0, -240),
+    'bank_right': (0, -8, 0, 240),
+    'strafe_left': (0, 0, 0, -480),
+    'strafe_right': (0, 0, 0, 480),
+    'nudge_up': (4, 0, 120, 0),
+    'nudge_down': (-4, 0, -120, 0),
+    'nudge_left': (0, 6, 0, -180),
+    'nudge_right': (0, -6, 0, 180),
+}
+
+
+# Game state container
+class GameState:
+    def __init__(self):
+        self.score = 0
+        self.lives = 3
+        self.base_speed = BASE_SPEED
+        self.boost_duration = 0
+        self.finished = False
+        self.difficulty = 1
+        self.frames = 0
+        self.clock = 0.0
+        self.enemy_hits = 0
+        self.cheat_enabled = False
+        self.weapon_cooldown = 0
+        self.active = False
+        self.suspended = False
+        self.streak = 0
+        self.streak_timeout = 0
+        self.last_collected_y = -999999
+        self.total_kills = 0
+
+
+# Player vehicle state
+class Aircraft:
+    def __init__(self):
+        self.position = [0, 0, 50]
+        self.angles = [0, 0, 0]  # roll, pitch, yaw
+        self.velocity = [0, 0, 60.0]  # horizontal, vertical, forward (units/s)
+        self.prop_spin = 0
+        # Where the last tick started, so collisions can test the whole path flown
+        self.previous = list(self.position)
+
+    def get_x(self): return self.position[0]
+    def get_y(self): return self.position[1]
+    def get_z(self): return self.position[2]
+    def set_position(self, x, y, z):
+        self.position = [x, y, z]
+        self.previous = list(self.position)
+
+
+# Entity collections
+class WorldEntities:
+    def __init__(self, missile_capacity=MISSILE_POOL_SIZE, effect_capacity=EFFECT_POOL_SIZE,
+                 overflow=DROP_OLDEST):
+        self.collectibles = []
+        self.hazards = []
+        self.hostiles = []
+        # Short-lived kinds are recycled from fixed pools instead of allocated per spawn
+        self.missiles = EntityPool(lambda: spawn_missile(0, 0, 0, [0, 0, 0]), missile_capacity, overflow)
+        self.pickups = []
+        self.effects = EntityPool(lambda: spawn_effect(0, 0, 0), effect_capacity, overflow)
+        # Broadphase grids and y-ordered recycle queues for the long-lived kinds
+        self.grids = {kind: SpatialHash() for kind in GRID_KINDS}
+        self.recycle_queues = {kind: RecycleQueue() for kind in GRID_KINDS}
+        # Added to y for each kind's recycle queue key; the simulation keeps the
+        # hostile one current (see Simulation.hostile_horizon)
+        self.horizons = {}
+        self.next_key = 0
+        self.clear()
+
+    def add(self, kind, entity):
+        """Append an entity and register it in its kind's grid and recycle queue"""
+        getattr(self, kind).append(entity)
+        grid = self.grids.get(kind)
+        if grid is not None:
+            entity['key'] = self.next_key
+            self.next_key += 1
+            grid.insert(entity['key'], *entity['pos'], entity)
+            self.recycle_queues[kind].push(entity['pos'][1] + self.horizons[kind], entity['key'], entity)
+
+    def flag_recycle(self, kind, entity):
+        """Recycle an entity on the next pass regardless of where it is"""
+        self.recycle_queues[kind].flag(entity['key'], entity)
+
+    def moved(self, kind, entity):
+        """Re-bucket an entity after its position changed"""
+        self.grids[kind].move(entity['key'], *entity['pos'])
+
+    def remove(self, kind, entity):
+        getattr(self, kind).remove(entity)
+        grid = self.grids.get(kind)
+        if grid is not None:
+            grid.remove(entity['key'])
+            self.recycle_queues[kind].discard(entity['key'])
+
+    def nearby(self, kind, x, y, z, radius):
+        """Broadphase candidates around a point, in the order they were added"""
+        return self.grids[kind].query(x, y, z, radius)
+
+    def clear(self, kinds=ENTITY_KINDS):
+        for kind in kinds:
+            getattr(self, kind).clear()
+            if kind in self.grids:
+                self.grids[kind].clear()
+                self.recycle_queues[kind].clear()
+                # Where Simulation.hostile_horizon starts, at clock 0
+                self.horizons[kind] = -RECYCLE_SLACK if kind == 'hostiles' else 0.0
+
+
+def distance_3d(x1, y1, z1, x2, y2, z2):
+    """Calculate Euclidean distance using alternative formula"""
+    dx = x2 - x1
+    dy = y2 - y1
+    dz = z2 - z1
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+
+def segment_sphere_entry(start, end, center, radius):
+    """Fraction along start->end where it first comes within radius of center, or None"""
+    sx, sy, sz = start
+    dx = end[0] - sx
+    dy = end[1] - sy
+    dz = end[2] - sz
+    fx = sx - center[0]
+    fy = sy - center[1]
+    fz = sz - center[2]
+    c = fx * fx + fy * fy + fz * fz - radius * radius
+    if c < 0:
+        return 0.0
+    a = dx * dx + dy * dy + dz * dz
+    b = fx * dx + fy * dy + fz * dz
+    if a == 0 or b >= 0:
+        return None
+    disc = b * b - a * c
+    if disc <= 0:
+        return None
+    entry = (-b - math.sqrt(disc)) / a
+    return entry if entry <= 1 else None
+
+
+def live_entry(entity, start, end, radius):
+    """segment_sphere_entry against a live entity; None for destroyed ones"""
+    if not entity['alive']:
+        return None
+    return segment_sphere_entry(start, end, entity['pos'], radius)
+
+
+def ring_crossing(start, end, center, radius):
+    """Fraction along start->end where it passes through a ring facing the y axis, or None"""
+    y0 = start[1]
+    y1 = end[1]
+    ry = center[1]
+    if not min(y0, y1) < ry <= max(y0, y1):
+        return None
+    along = (ry - y0) / (y1 - y0)
+    ox = start[0] + (end[0] - start[0]) * along - center[0]
+    oz = start[2] + (end[2] - start[2]) * along - center[2]
+    if ox * ox + oz * oz < radius * radius:
+        return along
+    return None
+
+
+def clamp_value(val, min_val, max_val):
+    """Restrict value within bounds"""
+    if val < min_val:
+        return min_val
+    if val > max_val:
+        return max_val
+    return val
+
+
+def apply_damping(value, factor, dt):
+    """Apply friction/damping to a value, factor being what survives one second"""
+    return value * factor ** dt
+
+
+def spawn_collectible(x, y, z):
+    """Create a new collectible ring"""
+    return {
+        'pos': [x, y, z],
+        'taken': False,
+        'radius': 80,
+        'thickness': 20
+    }
+
+
+def spawn_hazard(x, y, z, hazard_type):
+    """Create environmental obstacle"""
+    return {
+        'pos': [x, y, z],
+        'variant': hazard_type,
+        'size': 50
+    }
+
+
+def spawn_hostile(x, y, z):
+    """Create enemy aircraft"""
+    return {
+        'pos': [x, y, z],
+        'alive': True,
+        'size': 35
+    }
+
+
+def spawn_pickup(x, y, z):
+    """Create powerup item"""
+    return {
+        'pos': [x, y, z],
+        'taken': False,
+        'radius': PICKUP_RADIUS
+    }
+
+
+def spawn_missile(x, y, z, direction):
+    """Create projectile"""
+    return {
+        'pos': [x, y, z],
+        'dir': direction,
+        # Where the missile was at the start of the tick, for swept hit tests
+        'start': [x, y, z],
+        'vel': MISSILE_SPEED,
+        'range': MISSILE_RANGE
+    }
+
+
+def spawn_effect(x, y, z):
+    """Create explosion visual"""
+    return {
+        'pos': [x, y, z],
+        'timer': EFFECT_LIFETIME,
+        'base_size': 10
+    }
+
+
+class FixedTimestep:
+    """Accumulator that turns elapsed wall-clock time into whole simulation ticks"""
+
+    def __init__(self, dt, max_frame_time=MAX_FRAME_TIME):
+        self.dt = dt
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def advance(self, now, tick):
+        """Run as many fixed ticks as the time since the last call covers"""
+        if self.last_time is None:
+            self.last_time = now
+            return 0
+
+        # Clamp long stalls so a hitch cannot trigger a burst of catch-up ticks
+        frame_time = min(now - self.last_time, self.max_frame_time)
+        self.last_time = now
+        self.accumulator += frame_time
+
+        ticks = 0
+        while self.accumulator >= self.dt:
+            tick()
+            self.accumulator -= self.dt
+            ticks += 1
+        return ticks
+
+
+class Simulation:
+    """Self-contained game world that advances without any rendering"""
+
+    def __init__(self, seed=None, base_speed=None, active=True, verbose=False,
+                 tick_rate=TICK_RATE, missile_capacity=MISSILE_POOL_SIZE,
+                 effect_capacity=EFFECT_POOL_SIZE, pool_overflow=DROP_OLDEST, swept=True,
+                 entity_counts=None):
+        self.rng = random.Random(seed)
+        self.entity_counts = dict(ENTITY_COUNTS, **(entity_counts or {}))
+        self.pool_sizes = (missile_capacity, effect_capacity, pool_overflow)
+        # Allow testing the path covered during a tick rather than only where
+        # it ended, for tick rates too coarse for the point tests (see sweeps())
+        self.swept = swept
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.base_speed = base_speed
+        self.verbose = verbose
+        self.state = GameState()
+        self.player = Aircraft()
+        self.world = self.create_world()
+        # Where explosions started since the front end last took them; the puffs
+        # drawn for them are its business, so the simulation keeps no visual state
+        self.bursts = deque(maxlen=effect_capacity)
+        self.reset(active)
+
+    def create_world(self):
+        """Build the entity container this simulation updates"""
+        return WorldEntities(*self.pool_sizes)
+
+    def add_effect(self, x, y, z):
+        """Start an explosion from the effect pool"""
+        effect = self.world.effects.acquire()
+        if effect is None:
+            return
+        effect['pos'][0] = x
+        effect['pos'][1] = y
+        effect['pos'][2] = z
+        effect['timer'] = EFFECT_LIFETIME
+        self.bursts.append((x, y, z))
+
+    def add_missile(self, x, y, z, dir_x, dir_y, dir_z):
+        """Launch a missile from the missile pool"""
+        missile = self.world.missiles.acquire()
+        if missile is None:
+            return
+        missile['pos'][0] = x
+        missile['pos'][1] = y
+        missile['pos'][2] = z
+        missile['dir'][0] = dir_x
+        missile['dir'][1] = dir_y
+        missile['dir'][2] = dir_z
+
+    def log(self, message):
+        """Print gameplay messages only when running with a console"""
+        if self.verbose:
+            print(message)
+
+    def reset(self, active=True):
+        """Start a fresh mission with new state, player and entities"""
+        self.state = GameState()
+        if self.base_speed is not None:
+            self.state.base_speed = self.base_speed
+        self.state.active = active
+        self.player = Aircraft()
+        self.recycle_speed = 0.0
+        self.world.clear()
+        self.bursts.clear()
+        self.initialize_entities()
+
+    def restart(self):
+        """Reset game with alternative initialization"""
+        self.reset(active=True)
+
+    def hostile_horizon(self):
+        """Offset from a hostile's y to its recycle queue key
+
+        Hostiles close in by at most their chase speed, so y + speed * clock at
+        push time stays a lower bound of y + speed * clock later on. An offset
+        taken earlier in the mission is smaller, so keys pushed with it stay valid.
+        """
+        speed = CHASE_SPEED + self.state.difficulty * CHASE_SPEED_PER_LEVEL
+        return speed * self.state.clock - RECYCLE_SLACK
+
+    def initialize_entities(self):
+        """Populate world with initial objects using different distribution"""
+        world = self.world
+        player = self.player
+        rng = self.rng
+        counts = self.entity_counts
+        world.clear(GRID_KINDS)
+
+        # Distribute rings using different spacing logic
+        spacing = 300
+        for i in range(counts['collectibles']):
+            world.add(
+                'collectibles',
+                spawn_collectible(
+                    rng.randint(-500, 500),
+                    200 + i * spacing,
+                    rng.randint(100, 300)
+                )
+            )
+
+        # Scatter hazards randomly
+        spread = counts['hazards'] / ENTITY_COUNTS['hazards']
+        for _ in range(counts['hazards']):
+            world.add(
+                'hazards',
+                spawn_hazard(
+                    rng.randint(-600, 600),
+                    rng.randint(100, 100 + round(1400 * spread)),
+                    rng.randint(50, 400),
+                    rng.choice(HAZARD_TYPES)
+                )
+            )
+
+        # Place enemies in visible range using different logic
+        for i in range(counts['hostiles']):
+            offset = 300 + (i * 200)
+            world.add(
+                'hostiles',
+                spawn_hostile(
+                    player.get_x() + rng.randint(-300, 300),
+                    player.get_y() + offset,
+                    player.get_z() + rng.randint(-100, 100)
+                )
+            )
+
+        # Distribute powerups
+        spread = counts['pickups'] / ENTITY_COUNTS['pickups']
+        for _ in range(counts['pickups']):
+            world.add(
+                'pickups',
+                spawn_pickup(
+                    rng.randint(-300, 300),
+                    rng.randint(200, 200 + round(800 * spread)),
+                    rng.randint(100, 250)
+                )
+            )
+
+    def apply_input(self, action):
+        """Apply one named control action to the player"""
+        if action == 'fire':
+            self.launch_weapon()
+            return
+        if action == 'toggle_cheat':
+            self.state.cheat_enabled = not self.state.cheat_enabled
+            self.log("GOD MODE ACTIVATED!" if self.state.cheat_enabled else "God mode deactivated")
+            return
+
+        pitch, roll, climb, slide = CONTROL_ACTIONS[action]
+        player = self.player
+        if pitch:
+            player.angles[1] = clamp_value(player.angles[1] + pitch, -25, 25)
+        if roll:
+            player.angles[0] = clamp_value(player.angles[0] + roll, -35, 35)
+        player.velocity[1] += climb
+        player.velocity[0] += slide
+
+    def step(self, inputs=()):
+        """Apply control actions and advance the world by one tick"""
+        for action in inputs:
+            self.apply_input(action)
+        self.tick()
+
+    def run(self, n_ticks, inputs=()):
+        """Advance up to n_ticks, stopping early once the mission ends"""
+        ticks = 0
+        while ticks < n_ticks and not self.state.finished:
+            self.step(inputs)
+            ticks += 1
+        return ticks
+
+    def tick(self):
+        """Main update loop with alternative structure"""
+        state = self.state
+        state.frames += 1
+        state.clock += self.dt
+
+        if not state.active or state.suspended:
+            return
+
+        if not state.finished:
+            # Auto-fire in cheat mode
+            if state.cheat_enabled:
+                state.weapon_cooldown += self.dt
+                while state.weapon_cooldown >= AUTO_FIRE_INTERVAL - TIMER_EPSILON:
+                    self.launch_weapon()
+                    state.weapon_cooldown -= AUTO_FIRE_INTERVAL
+
+            # Update all systems
+            self.physics_update()
+            self.ai_behavior_update()
+            self.projectile_physics()
+            self.process_visual_effects()
+            self.collision_detection()
+            self.manage_object_recycling()
+            self.difficulty_progression()
+
+    def manage_object_recycling(self):
+        """Respawn entities that fell behind the player, visiting only those due
+
+        Each kind keeps a heap keyed on a lower bound of y, so a pass pops just
+        the entries below the threshold plus the ones flagged as used up. Due
+        entities are handled in spawn order, as a full scan would.
+        """
+        world = self.world
+        player = self.player
+        rng = self.rng
+        queues = world.recycle_queues
+        player_y = player.get_y()
+        threshold = player_y - RECYCLE_DISTANCE
+        spawn_pos = player_y + SPAWN_AHEAD
+
+        # Recycle collectibles
+        queue = queues['collectibles']
+        for item in queue.due(threshold):
+            if item['pos'][1] < threshold:
+                item['pos'][0] = rng.uniform(-500, 500)
+                item['pos'][1] = spawn_pos
+                item['pos'][2] = rng.uniform(100, 300)
+                item['taken'] = False
+                world.moved('collectibles', item)
+            queue.push(item['pos'][1], item['key'], item)
+
+        # Recycle hazards
+        queue = queues['hazards']
+        for hazard in queue.due(threshold):
+            if hazard['pos'][1] < threshold:
+                hazard['pos'][0] = rng.uniform(-600, 600)
+                hazard['pos'][1] = spawn_pos
+                hazard['pos'][2] = rng.uniform(50, 400)
+                hazard['variant'] = rng.choice(HAZARD_TYPES)
+                world.moved('hazards', hazard)
+            queue.push(hazard['pos'][1], hazard['key'], hazard)
+
+        # Recycle hostiles with proximity-based spawning, keyed on y + horizon
+        queue = queues['hostiles']
+        speed = CHASE_SPEED + self.state.difficulty * CHASE_SPEED_PER_LEVEL
+        horizon = world.horizons['hostiles'] = self.hostile_horizon()
+        if speed != self.recycle_speed:
+            self.recycle_speed = speed
+            queue.rebuild((hostile['pos'][1] + horizon, hostile['key'], hostile)
+                          for hostile in world.hostiles)
+        for hostile in queue.due(threshold + horizon + RECYCLE_SLACK):
+            should_recycle = hostile['pos'][1] < threshold or not hostile['alive']
+            if should_recycle:
+                hostile['pos'][0] = player.get_x() + rng.uniform(-300, 300)
+                hostile['pos'][1] = player.get_y() + rng.uniform(300, 800)
+                hostile['pos'][2] = player.get_z() + rng.uniform(-100, 100)
+                hostile['alive'] = True
+                world.moved('hostiles', hostile)
+            queue.push(hostile['pos'][1] + horizon, hostile['key'], hostile)
+
+        # Recycle pickups
+        queue = queues['pickups']
+        for pickup in queue.due(threshold):
+            if pickup['pos'][1] < threshold or pickup['taken']:
+                pickup['pos'][0] = rng.uniform(-300, 300)
+                pickup['pos'][1] = spawn_pos
+                pickup['pos'][2] = rng.uniform(100, 250)
+                pickup['taken'] = False
+                world.moved('pickups', pickup)
+            queue.push(pickup['pos'][1], pickup['key'], pickup)
+
+    def process_visual_effects(self):
+        """Update effects with different iteration approach"""
+        effects = self.world.effects
+        i = 0
+        while i < len(effects):
+            effect = effects[i]
+            effect['timer'] -= self.dt
+            if effect['timer'] <= TIMER_EPSILON:
+                # Swap-remove brings an unvisited effect into slot i
+                effects.release_at(i)
+                continue
+            i += 1
+
+    def physics_update(self):
+        """Update player physics with alternative logic"""
+        state = self.state
+        player = self.player
+        dt = self.dt
+        if state.finished:
+            return
+        player.previous = list(player.position)
+
+        # Propeller animation with different increment
+        player.prop_spin = (player.prop_spin + PROP_SPIN_RATE * dt) % 360
+
+        # Yaw stabilization
+        player.angles[2] = 0
+
+        # Forward motion with boost multiplier
+        speed_multiplier = BOOST_MULTIPLIER if state.boost_duration > 0 else 1
+        player.position[1] += state.base_speed * speed_multiplier * dt
+
+        # Apply velocities using different approach
+        player.position[0] += player.velocity[0] * dt
+        player.position[2] += player.velocity[1] * dt
+
+        # Roll-induced lateral drift with alternative calculation
+        roll_rad = math.radians(player.angles[0])
+        drift = player.velocity[2] * math.sin(roll_rad) * 0.3
+        player.position[0] += drift * dt
+
+        # Pitch-induced vertical movement
+        pitch_rad = math.radians(player.angles[1])
+        climb = player.velocity[2] * math.sin(pitch_rad) * 0.5
+        player.position[2] += climb * dt
+
+        # Damping with different factors
+        player.velocity[0] = apply_damping(player.velocity[0], HORIZONTAL_DAMPING, dt)
+        player.velocity[1] = apply_damping(player.velocity[1], VERTICAL_DAMPING, dt)
+
+        # Auto-stabilization using alternative threshold
+        threshold_roll = 1
+        if abs(player.angles[0]) > threshold_roll:
+            player.angles[0] = apply_damping(player.angles[0], ROLL_DAMPING, dt)
+        else:
+            player.angles[0] = 0
+
+        threshold_pitch = 1
+        if abs(player.angles[1]) > threshold_pitch:
+            player.angles[1] = apply_damping(player.angles[1], PITCH_DAMPING, dt)
+        else:
+            player.angles[1] = 0
+
+        # Ground collision with different bounds
+        min_altitude = 20
+        if player.position[2] < min_altitude:
+            player.position[2] = min_altitude
+            player.angles[1] = max(player.angles[1], 0)
+
+        # Ceiling with different limit
+        max_altitude = 500
+        if player.position[2] > max_altitude:
+            player.position[2] = max_altitude
+            player.angles[1] = min(player.angles[1], 0)
+
+        # Horizontal boundaries using different approach
+        left_bound = -1000
+        right_bound = 1000
+        if player.position[0] < left_bound:
+            player.position[0] = left_bound
+            player.angles[0] = max(player.angles[0], 0)
+        elif player.position[0] > right_bound:
+            player.position[0] = right_bound
+            player.angles[0] = min(player.angles[0], 0)
+
+        # Boost timer countdown
+        if state.boost_duration > 0:
+            state.boost_duration -= dt
+            if state.boost_duration <= TIMER_EPSILON:
+                state.boost_duration = 0
+                player.velocity[2] = state.base_speed
+
+        # Streak timer with different logic
+        if state.streak_timeout > 0:
+            state.streak_timeout -= dt
+            if state.streak_timeout <= TIMER_EPSILON:
+                state.streak_timeout = 0
+                state.streak = 0
+                self.log("Multiplier expired!")
+
+    def ai_behavior_update(self):
+        """Update enemy AI with alternative pursuit logic"""
+        state = self.state
+        player = self.player
+        world = self.world
+        dt = self.dt
+        for hostile in world.hostiles:
+            if not hostile['alive']:
+                continue
+
+            # Calculate vector to player
+            target_x = player.get_x()
+            target_y = player.get_y()
+            target_z = player.get_z()
+
+            dx = target_x - hostile['pos'][0]
+            dy = target_y - hostile['pos'][1]
+            dz = target_z - hostile['pos'][2]
+
+            # Distance calculation
+            dist = math.sqrt(dx * dx + dy * dy + dz * dz)
+
+            if dist > 0:
+                # Normalize direction
+                norm_x = dx / dist
+                norm_y = dy / dist
+                norm_z = dz / dist
+
+                # Speed calculation with difficulty scaling
+                chase_vel = (CHASE_SPEED + state.difficulty * CHASE_SPEED_PER_LEVEL) * dt
+
+                # Apply movement
+                hostile['pos'][0] += norm_x * chase_vel
+                hostile['pos'][1] += norm_y * chase_vel
+                hostile['pos'][2] += norm_z * chase_vel
+
+                # Evasive pattern with different formula
+                time_factor = state.clock * EVADE_X_FREQUENCY
+                position_factor = hostile['pos'][1] * 0.005
+                evade_x = math.sin(time_factor + position_factor) * EVADE_X_SPEED * dt
+                hostile['pos'][0] += evade_x
+
+                time_factor2 = state.clock * EVADE_Z_FREQUENCY
+                position_factor2 = hostile['pos'][0] * 0.005
+                evade_z = math.cos(time_factor2 + position_factor2) * EVADE_Z_SPEED * dt
+                hostile['pos'][2] += evade_z
+                world.moved('hostiles', hostile)
+
+    def projectile_physics(self):
+        """Update missiles with alternative logic
+
+        Missiles claim hostiles in pool order, which swap-removal makes differ
+        from launch order; nothing is allocated per missile.
+        """
+        state = self.state
+        player = self.player
+        world = self.world
+        missiles = world.missiles
+        hit_radius = 40
+
+        i = 0
+        while i < len(missiles):
+            missile = missiles[i]
+            pos = missile['pos']
+
+            # Extract direction components
+            dx = missile['dir'][0]
+            dy = missile['dir'][1]
+            dz = missile['dir'][2]
+
+            # Apply velocity, keeping the previous position in place only when it is used
+            speed = missile['vel'] * self.dt
+            if self.sweeps(speed, hit_radius):
+                start = missile['start']
+                start[0] = pos[0]
+                start[1] = pos[1]
+                start[2] = pos[2]
+            else:
+                start = pos
+            missile['pos'][0] += dx * speed
+            missile['pos'][1] += dy * speed
+            missile['pos'][2] += dz * speed
+
+            # Range check using different calculation
+            offset_x = missile['pos'][0] - player.get_x()
+            offset_y = missile['pos'][1] - player.get_y()
+            offset_z = missile['pos'][2] - player.get_z()
+            travel_dist = math.sqrt(offset_x**2 + offset_y**2 + offset_z**2)
+
+            if travel_dist > missile['range']:
+                missiles.release_at(i)
+                continue
+
+            # Collision detection against the first live hostile along the flight path
+            hostile = self.first_contact('hostiles', start, pos, hit_radius, live_entry)
+            if hostile is not None:
+                self.add_effect(*hostile['pos'])
+                hostile['alive'] = False
+                world.flag_recycle('hostiles', hostile)
+                state.score += 100
+                state.total_kills += 1
+                self.log(f"Target destroyed! +100 | Total neutralized: {state.total_kills}")
+                missiles.release_at(i)
+            else:
+                i += 1
+
+    def collision_detection(self):
+        """Check collisions with alternative detection logic"""
+        state = self.state
+        player = self.player
+        world = self.world
+        if state.finished:
+            return
+
+        end = player.position
+        previous = player.previous
+        # Decided before a crash can move the player back to the start
+        step = distance_3d(*previous, *end)
+
+        # Ring collection with combo system; swept flight has to pass through the ring
+        collection_radius = 80
+        if self.sweeps(step, collection_radius):
+            rings = self.contacts('collectibles', previous, end, collection_radius, ring_crossing)
+        else:
+            rings = self.contacts('collectibles', end, end, collection_radius)
+        for ring in rings:
+            if ring['taken']:
+                continue
+
+            ring['taken'] = True
+            ry = ring['pos'][1]
+
+            # Combo logic with different order check
+            is_forward = ry > state.last_collected_y
+            if is_forward:
+                state.streak += 1
+                state.streak_timeout = STREAK_WINDOW
+                state.last_collected_y = ry
+
+                base_value = 100
+                multiplier = state.streak
+                points_earned = base_value * multiplier
+                state.score += points_earned
+
+                self.log(f"{state.streak}x CHAIN! +{points_earned} points")
+            else:
+                state.streak = 0
+                state.streak_timeout = 0
+                state.score += 100
+
+        # Hazard collisions with alternative logic
+        hazards_to_remove = []
+        collision_size = 40
+        start = previous if self.sweeps(step, collision_size) else end
+        for hazard in self.contacts('hazards', start, end, collision_size):
+            # Skip non-solid hazards
+            if hazard['variant'] == 'cloud':
+                continue
+
+            if state.boost_duration > 0:
+                hazards_to_remove.append(hazard)
+                self.add_effect(*hazard['pos'])
+                state.score += 50
+            else:
+                state.streak = 0
+                state.streak_timeout = 0
+                self.handle_crash()
+                hazards_to_remove.append(hazard)
+            break
+
+        # Remove hazards
+        for hazard in hazards_to_remove:
+            world.remove('hazards', hazard)
+
+        # Enemy collisions with different handling
+        collision_threshold = 35
+        start = previous if self.sweeps(step, collision_threshold) else end
+        for hostile in self.contacts('hostiles', start, end, collision_threshold):
+            if not hostile['alive']:
+                continue
+
+            ex, ey, ez = hostile['pos']
+            invincible = state.boost_duration > 0 or state.cheat_enabled
+            world.flag_recycle('hostiles', hostile)
+            if invincible:
+                hostile['alive'] = False
+                self.add_effect(ex, ey, ez)
+                state.score += 150
+                state.total_kills += 1
+                self.log(f"Direct hit! +150 | Total neutralized: {state.total_kills}")
+            else:
+                state.enemy_hits += 1
+                hostile['alive'] = False
+
+                self.add_effect(ex, ey, ez)
+                self.log(f"IMPACT! Damage sustained {state.enemy_hits}/5")
+
+                max_hits = 5
+                if state.enemy_hits >= max_hits:
+                    state.streak = 0
+                    state.streak_timeout = 0
+                    self.handle_crash()
+                    state.enemy_hits = 0
+            break
+
+        # Pickup collection with different approach
+        start = previous if self.sweeps(step, PICKUP_RADIUS) else end
+        for pickup in self.contacts('pickups', start, end, PICKUP_RADIUS):
+            if pickup['taken']:
+                continue
+
+            pickup['taken'] = True
+            world.flag_recycle('pickups', pickup)
+            state.boost_duration = BOOST_TIME
+            player.velocity[2] = state.base_speed * BOOST_MULTIPLIER
+
+            self.add_effect(*pickup['pos'])
+
+            state.score += 200
+            self.log("BOOST ACQUIRED! Maximum velocity and shields engaged!")
+
+    def sweeps(self, step, radius):
+        """Whether a move of step units this tick needs a swept test against radius
+
+        The end-of-tick point tests at TICK_RATE define the game's outcomes, so
+        they are always used there. Coarser ticks sweep a path only once its step
+        outgrows the radius, i.e. when it could cross an entity between tests.
+        """
+        return self.swept and self.tick_rate < TICK_RATE and step > radius
+
+    def contacts(self, kind, start, end, radius, test=segment_sphere_entry):
+        """Entities of a kind touched by the path start->end, earliest contact first
+
+        A path whose start and end coincide reduces to a plain point-in-sphere test.
+        """
+        mid_x = (start[0] + end[0]) * 0.5
+        mid_y = (start[1] + end[1]) * 0.5
+        mid_z = (start[2] + end[2]) * 0.5
+        reach = radius + distance_3d(*start, *end) * 0.5
+        found = []
+        for entity in self.world.nearby(kind, mid_x, mid_y, mid_z, reach):
+            entry = test(start, end, entity['pos'], radius)
+            if entry is not None:
+                found.append((entry, entity['key'], entity))
+        found.sort(key=lambda contact: contact[:2])
+        return [contact[2] for contact in found]
+
+    def first_contact(self, kind, start, end, radius, test=segment_sphere_entry):
+        """The first entity contacts() would list, found without building the list"""
+        mid_x = (start[0] + end[0]) * 0.5
+        mid_y = (start[1] + end[1]) * 0.5
+        mid_z = (start[2] + end[2]) * 0.5
+        reach = radius + distance_3d(*start, *end) * 0.5
+        return self.world.grids[kind].nearest(mid_x, mid_y, mid_z, reach, test, start, end, radius)
+
+    def handle_crash(self):
+        """Process crash with alternative logic"""
+        state = self.state
+        player = self.player
+        state.lives -= 1
+        self.log(f"HULL BREACH! Remaining integrity: {state.lives}")
+
+        if state.lives <= 0:
+            state.finished = True
+            self.log(f"MISSION TERMINATED! Total score: {state.score} | Hostiles neutralized: {state.total_kills}")
+        else:
+            # Reset position using different method
+            player.set_position(0, 0, 50)
+            player.angles = [0, 0, 0]
+
+    def difficulty_progression(self):
+        """Scale difficulty with different calculation"""
+        state = self.state
+        player = self.player
+        points_per_level = 500
+        new_difficulty = 1 + (state.score // points_per_level)
+
+        if new_difficulty > state.difficulty:
+            state.difficulty = new_difficulty
+            state.base_speed += SPEED_PER_LEVEL
+            player.velocity[2] = state.base_speed
+
+            # Spawn enemies differently
+            spawn_count = 1
+            for _ in range(spawn_count):
+                new_enemy = spawn_hostile(
+                    self.rng.uniform(-400, 400),
+                    player.get_y() + self.rng.uniform(300, 600),
+                    self.rng.uniform(150, 350)
+                )
+                self.world.add('hostiles', new_enemy)
+
+            self.log(f"THREAT LEVEL {new_difficulty}! Enhanced velocity, additional hostiles detected!")
+
+    def launch_weapon(self):
+        """Fire projectile with alternative direction calculation"""
+        player = self.player
+        pitch = player.angles[1]
+        pitch_rad = math.radians(pitch)
+
+        # Direction vector components
+        dir_x = 0
+        dir_y = math.cos(pitch_rad)
+        dir_z = math.sin(pitch_rad)
+
+        # Spawn position offset
+        spawn_x = player.get_x()
+        spawn_y = player.get_y() + 50
+        spawn_z = player.get_z() + 20
+
+        self.add_missile(spawn_x, spawn_y, spawn_z, dir_x, dir_y, dir_z)
@@ -0,0 +1,98 @@
+import math
+
+
+# Grid cell edge in world units; at least twice the largest query radius
+CELL_SIZE = 200
+
+
+class SpatialHash:
+    """Uniform grid over world coordinates mapping each cell to the keys inside it"""
+
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.key_cells = {}
+
+    def __len__(self):
+        return len(self.key_cells)
+
+    def cell_of(self, x, y, z):
+        size = self.cell_size
+        return (math.floor(x / size), math.floor(y / size), math.floor(z / size))
+
+    def insert(self, key, x, y, z, item=None):
+        """Register a key at a position; item is what queries hand back"""
+        self.insert_at(key, self.cell_of(x, y, z), key if item is None else item)
+
+    def insert_at(self, key, cell, item):
+        self.key_cells[key] = cell
+        bucket = self.cells.get(cell)
+        if bucket is None:
+            bucket = self.cells[cell] = {}
+        bucket[key] = item
+
+    def move(self, key, x, y, z):
+        """Re-bucket a key after it moved; cheap when it stays in the same cell"""
+        return self.move_to(key, self.cell_of(x, y, z))
+
+    def move_to(self, key, cell):
+        old = self.key_cells[key]
+        if cell == old:
+            return False
+        bucket = self.cells[old]
+        item = bucket.pop(key)
+        if not bucket:
+            del self.cells[old]
+        self.insert_at(key, cell, item)
+        return True
+
+    def remove(self, key):
+        cell = self.key_cells.pop(key, None)
+        if cell is None:
+            return
+        bucket = self.cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self.cells[cell]
+
+    def clear(self):
+        self.cells.clear()
+        self.key_cells.clear()
+
+    def nearest(self, x, y, z, radius, rank, *args):
+        """The item query() would return with the lowest rank(item, *args), ties to the lower key
+
+        Items ranked None are skipped; None if nothing ranks. Walks the buckets
+        in place, without collecting or sorting the candidates.
+        """
+        lo_x, lo_y, lo_z = self.cell_of(x - radius, y - radius, z - radius)
+        hi_x, hi_y, hi_z = self.cell_of(x + radius, y + radius, z + radius)
+        cells = self.cells
+        best = best_key = best_rank = None
+        for cx in range(lo_x, hi_x + 1):
+            for cy in range(lo_y, hi_y + 1):
+                for cz in range(lo_z, hi_z + 1):
+                    bucket = cells.get((cx, cy, cz))
+                    if not bucket:
+                        continue
+                    for key, item in bucket.items():
+                        value = rank(item, *args)
+                        if value is None:
+                            continue
+                        if best_rank is None or value < best_rank or (value == best_rank and key < best_key):
+                            best, best_key, best_rank = item, key, value
+        return best
+
+    def query(self, x, y, z, radius):
+        """Items in every cell overlapping the sphere's bounds, ordered by key"""
+        lo_x, lo_y, lo_z = self.cell_of(x - radius, y - radius, z - radius)
+        hi_x, hi_y, hi_z = self.cell_of(x + radius, y + radius, z + radius)
+        cells = self.cells
+        found = {}
+        for cx in range(lo_x, hi_x + 1):
+            for cy in range(lo_y, hi_y + 1):
+                for cz in range(lo_z, hi_z + 1):
+                    bucket = cells.get((cx, cy, cz))
+                    if bucket:
+                        found.update(bucket)
+        return [found[key] for key in sorted(found)]
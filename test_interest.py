@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from array_simulation import ArraySimulation
+from entity_store import EntityColumns
+from interest import InterestManager, MAX_CATCH_UP, NEAR_RADIUS, FAR_RADIUS, REDUCED_INTERVAL
+
+
+DT = 1.0 / 60
+PLAYER = np.zeros(3)
+
+
+def columns_at(*distances):
+    """Hostile columns with one live row per distance ahead of a player at the origin"""
+    hostiles = EntityColumns(capacity=len(distances))
+    for distance in distances:
+        hostiles.allocate(0, distance, 0)
+    return hostiles
+
+
+def plan(manager, hostiles, frame):
+    return manager.plan(hostiles, hostiles.used & hostiles.alive, PLAYER, frame, DT)
+
+
+def test_full_tier_matches_no_interest():
+    everyone = InterestManager(near=1e9, far=2e9)
+    worlds = [ArraySimulation(seed=4, interest=everyone, entity_counts={'hostiles': 60}),
+              ArraySimulation(seed=4, entity_counts={'hostiles': 60})]
+    for sim in worlds:
+        sim.state.cheat_enabled = True
+        sim.run(600)
+    assert everyone.counts['full'] > 0
+    assert everyone.counts['reduced'] == everyone.counts['dormant'] == 0
+    with_interest, without = (sim.world.hostiles for sim in worlds)
+    assert np.array_equal(with_interest.used, without.used)
+    assert np.array_equal(with_interest.pos, without.pos)
+    assert vars(worlds[0].state) == vars(worlds[1].state)
+
+
+def test_reduced_rows_update_on_their_stagger_frame():
+    middle = (NEAR_RADIUS + FAR_RADIUS) / 2
+    hostiles = columns_at(*[middle] * 6)
+    manager = InterestManager()
+    last = {row: -1 for row in range(6)}
+    for frame in range(3 * REDUCED_INTERVAL):
+        rows, owed = plan(manager, hostiles, frame)
+        assert manager.counts == {'full': 0, 'reduced': 6, 'dormant': 0}
+        assert rows.tolist() == [row for row in range(6) if (row + frame) % REDUCED_INTERVAL == 0]
+        for row, seconds in zip(rows.tolist(), owed.tolist()):
+            # Every skipped tick is owed, plus this one
+            assert seconds == pytest.approx((frame - last[row]) * DT)
+            last[row] = frame
+
+
+@pytest.mark.parametrize('dormant_ticks', (30, 600))
+def test_promoted_dormant_row_catches_up_capped(dormant_ticks):
+    hostiles = columns_at(FAR_RADIUS * 2)
+    manager = InterestManager()
+    for frame in range(dormant_ticks):
+        rows, _ = plan(manager, hostiles, frame)
+        assert not len(rows)
+    hostiles.pos[0, 1] = NEAR_RADIUS / 2
+    rows, owed = plan(manager, hostiles, dormant_ticks)
+    assert manager.promotions == 1
+    assert rows.tolist() == [0]
+    assert owed[0] == pytest.approx(min((dormant_ticks + 1) * DT, MAX_CATCH_UP))
+    # The debt is spent: next tick owes one tick again
+    assert plan(manager, hostiles, dormant_ticks + 1)[1][0] == pytest.approx(DT)
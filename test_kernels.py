@@ -0,0 +1,126 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from array_simulation import ArraySimulation
+from kernels import MAX_PAIR_BLOCK, pursue_targets, resolve_missile_hits
+from simulation import (Simulation, CHASE_SPEED, CHASE_SPEED_PER_LEVEL, EVADE_X_FREQUENCY,
+                        EVADE_X_SPEED, EVADE_Z_FREQUENCY, EVADE_Z_SPEED, spawn_hostile)
+
+
+EMPTY = {'collectibles': 0, 'hazards': 0, 'hostiles': 0, 'pickups': 0}
+HOSTILES = 200
+TICKS = 600
+
+
+def hostile_positions(seed=3):
+    rng = random.Random(seed)
+    return [(rng.uniform(-800, 800), rng.uniform(-200, 3000), rng.uniform(20, 500))
+            for _ in range(HOSTILES)]
+
+
+def fly(sim, tick):
+    """Move the player and clock as a tick would, without the other systems"""
+    sim.state.clock += sim.dt
+    sim.state.difficulty = 1 + tick // 150
+    sim.player.position[0] = 300 * np.sin(tick * 0.01)
+    sim.player.position[1] += 90 * sim.dt
+    sim.player.position[2] = 200 + 100 * np.cos(tick * 0.013)
+
+
+def test_array_pursuit_matches_scalar_bit_for_bit():
+    scalar = Simulation(seed=5, entity_counts=EMPTY)
+    batched = ArraySimulation(seed=5, entity_counts=EMPTY)
+    for x, y, z in hostile_positions():
+        scalar.world.add('hostiles', spawn_hostile(x, y, z))
+        batched.world.add('hostiles', spawn_hostile(x, y, z))
+
+    for tick in range(TICKS):
+        for sim in (scalar, batched):
+            fly(sim, tick)
+            sim.ai_behavior_update()
+        hostiles = batched.world.hostiles
+        expected = np.array([hostile['pos'] for hostile in scalar.world.hostiles])
+        assert np.array_equal(hostiles.pos[np.flatnonzero(hostiles.used)], expected), tick
+
+
+def test_pursue_targets_matches_scalar_step():
+    state = Simulation(seed=5, entity_counts=EMPTY)
+    state.state.clock = 12.345
+    state.state.difficulty = 4
+    target = [17.5, 640.25, 180.0]
+    positions = hostile_positions(seed=9) + [tuple(target)]
+    state.player.position = list(target)
+    for x, y, z in positions:
+        state.world.add('hostiles', spawn_hostile(x, y, z))
+    state.ai_behavior_update()
+
+    pos = np.array(positions, dtype=float)
+    dt = state.dt
+    pursue_targets(pos, np.arange(len(pos)), target, (CHASE_SPEED + 4 * CHASE_SPEED_PER_LEVEL) * dt,
+                   12.345 * EVADE_X_FREQUENCY, 12.345 * EVADE_Z_FREQUENCY,
+                   EVADE_X_SPEED, EVADE_Z_SPEED, dt)
+    # The last hostile sits on the target and must not move
+    assert np.array_equal(pos, np.array([hostile['pos'] for hostile in state.world.hostiles]))
+
+
+def entry_fraction(start, end, center, radius):
+    """Where start->end first comes within radius of center, or None; one pair at a time"""
+    step = [e - s for s, e in zip(start, end)]
+    offset = [s - c for s, c in zip(start, center)]
+    c = offset[0] * offset[0] + offset[1] * offset[1] + offset[2] * offset[2] - radius * radius
+    if c < 0:
+        return 0.0
+    a = step[0] * step[0] + step[1] * step[1] + step[2] * step[2]
+    b = offset[0] * step[0] + offset[1] * step[1] + offset[2] * step[2]
+    disc = b * b - a * c
+    if a <= 0 or b >= 0 or disc <= 0:
+        return None
+    entry = (-b - math.sqrt(disc)) / a
+    return entry if entry <= 1 else None
+
+
+def reference_hits(starts, ends, hostiles, radius):
+    """Missiles in order, each killing the free hostile it reaches first (lowest index on ties)"""
+    taken = set()
+    hits = []
+    for missile, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        best = None
+        for hostile, center in enumerate(hostiles.tolist()):
+            if hostile in taken:
+                continue
+            entry = entry_fraction(start, end, center, radius)
+            if entry is not None and (best is None or entry < best[0]):
+                best = (entry, hostile)
+        if best is not None:
+            taken.add(best[1])
+            hits.append((missile, best[1]))
+    return hits
+
+
+@pytest.mark.parametrize('swept', (False, True))
+@pytest.mark.parametrize('max_pairs', (MAX_PAIR_BLOCK, 7))
+def test_resolve_missile_hits_matches_nested_loop(swept, max_pairs):
+    rng = np.random.default_rng(17)
+    for _ in range(150):
+        # A small box, so missiles compete for the same hostiles
+        hostiles = rng.uniform(0, 300, (rng.integers(0, 25), 3))
+        ends = rng.uniform(0, 300, (rng.integers(0, 25), 3))
+        starts = ends - rng.uniform(-120, 120, ends.shape) if swept else ends
+        missiles, victims = resolve_missile_hits(ends, hostiles, 40, max_pairs=max_pairs,
+                                                 missile_start=starts if swept else None)
+        assert list(zip(missiles.tolist(), victims.tolist())) == reference_hits(starts, ends, hostiles, 40)
+
+
+def test_earlier_missile_claims_a_shared_hostile():
+    hostiles = np.array([[0.0, 100, 0], [0.0, 150, 0]])
+    # Both missiles reach hostile 0; only the second can also reach hostile 1
+    ends = np.array([[0.0, 110, 0], [0.0, 125, 0]])
+    missiles, victims = resolve_missile_hits(ends, hostiles, 30, max_pairs=1)
+    assert missiles.tolist() == [0, 1]
+    assert victims.tolist() == [0, 1]
+    missiles, victims = resolve_missile_hits(ends[:1].repeat(2, axis=0), hostiles, 30)
+    assert missiles.tolist() == [0]
+    assert victims.tolist() == [0]
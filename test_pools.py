@@ -0,0 +1,55 @@
+import pytest
+
+from pools import EntityPool, DROP_OLDEST, REFUSE
+
+
+def filled(capacity, count, overflow=DROP_OLDEST):
+    """A pool with count items acquired in order, each tagged with its launch number"""
+    pool = EntityPool(dict, capacity, overflow)
+    for number in range(count):
+        pool.acquire()['number'] = number
+    return pool
+
+
+def numbers(pool):
+    return [item['number'] for item in pool]
+
+
+def test_release_swaps_the_last_live_item_into_the_hole():
+    pool = filled(6, 5)
+    items = pool.items[:]
+    pool.release_at(1)
+    assert numbers(pool) == [0, 4, 2, 3]
+    pool.release_at(0)
+    assert numbers(pool) == [3, 4, 2]
+    # Released dicts stay in the pool, past the live ones, to be reused
+    assert sorted(map(id, pool.items)) == sorted(map(id, items))
+    assert pool.acquire() is items[0]
+
+
+def test_drop_oldest_reuses_the_earliest_acquired_item():
+    pool = filled(4, 4)
+    pool.release_at(0)
+    pool.acquire()['number'] = 4
+    # Swap-removal left the oldest live item at index 1, not 0
+    assert numbers(pool) == [3, 1, 2, 4]
+    oldest = pool.acquire()
+    assert oldest is pool[1]
+    oldest['number'] = 5
+    assert numbers(pool) == [3, 5, 2, 4]
+    pool.acquire()['number'] = 6
+    assert numbers(pool) == [3, 5, 6, 4]
+    assert pool.overflows == 2
+    assert len(pool) == 4
+
+
+def test_refuse_keeps_the_live_items():
+    pool = filled(3, 3, REFUSE)
+    assert pool.acquire() is None
+    assert numbers(pool) == [0, 1, 2]
+    assert pool.overflows == 1
+
+
+def test_unknown_overflow_policy_is_rejected():
+    with pytest.raises(ValueError):
+        EntityPool(dict, 4, 'grow')
@@ -0,0 +1,134 @@
+import pytest
+
+from array_simulation import ArraySimulation
+from pools import DROP_OLDEST, REFUSE
+from simulation import (Simulation, TICK_RATE, GRID_KINDS, HAZARD_TYPES, RECYCLE_DISTANCE, SPAWN_AHEAD,
+                        spawn_collectible, spawn_hazard, spawn_hostile)
+
+
+BACKENDS = (Simulation, ArraySimulation)
+EMPTY = {'collectibles': 0, 'hazards': 0, 'hostiles': 0, 'pickups': 0}
+COARSE_RATE = 5                 # steps far larger than every collision radius
+
+
+def outcome(backend, tick_rate, place, seconds, inputs=(), **kwargs):
+    """Score, kills and lives after flying an otherwise empty course for seconds"""
+    sim = backend(seed=1, tick_rate=tick_rate, entity_counts=EMPTY, **kwargs)
+    place(sim)
+    sim.step(inputs)
+    sim.run(round(seconds * tick_rate) - 1)
+    state = sim.state
+    return state.score, state.total_kills, state.lives
+
+
+def hostile_ahead(sim):
+    # In line with the missile launcher, which sits 20 above the player
+    sim.world.add('hostiles', spawn_hostile(0, 300, 70))
+
+
+def ring_ahead(sim):
+    sim.world.add('collectibles', spawn_collectible(0, 600, 50))
+
+
+def rock_ahead(sim):
+    sim.world.add('hazards', spawn_hazard(0, 540, 50, 'rock'))
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_coarse_missile_hits_like_native_tick(backend):
+    native = outcome(backend, TICK_RATE, hostile_ahead, 1.0, ['fire'])
+    coarse = outcome(backend, COARSE_RATE, hostile_ahead, 1.0, ['fire'])
+    assert native[:2] == (100, 1)
+    assert coarse == native
+    # Without sweeping the missile jumps 360 units at a time past a 40 unit hit radius
+    assert outcome(backend, COARSE_RATE, hostile_ahead, 1.0, ['fire'], swept=False)[1] == 0
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_coarse_flight_collects_ring_like_native_tick(backend):
+    native = outcome(backend, TICK_RATE, ring_ahead, 2.0, base_speed=1200)
+    coarse = outcome(backend, COARSE_RATE, ring_ahead, 2.0, base_speed=1200)
+    assert native[0] == 100
+    assert coarse == native
+    # Tested only at the end of each 240 unit step, the flight stays 120 units from the ring
+    assert outcome(backend, COARSE_RATE, ring_ahead, 2.0, base_speed=1200, swept=False)[0] == 0
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_coarse_flight_crashes_like_native_tick(backend):
+    native = outcome(backend, TICK_RATE, rock_ahead, 2.0, base_speed=600)
+    coarse = outcome(backend, COARSE_RATE, rock_ahead, 2.0, base_speed=600)
+    assert native[2] == coarse[2] == 2
+    assert coarse == native
+    assert outcome(backend, COARSE_RATE, rock_ahead, 2.0, base_speed=600, swept=False)[2] == 3
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('overflow', (DROP_OLDEST, REFUSE))
+def test_missile_capacity_caps_both_backends(backend, overflow):
+    sim = backend(seed=1, entity_counts=EMPTY, missile_capacity=2, pool_overflow=overflow)
+    sim.step(['fire'] * 5)
+    missiles = sim.world.missiles
+    assert len(missiles) == 2
+    assert missiles.overflows == 3
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_unknown_pool_overflow_is_rejected(backend):
+    with pytest.raises(ValueError):
+        backend(pool_overflow='grow')
+
+
+class FullScanSimulation(Simulation):
+    """Recycles by testing every entity every tick, the reference for the recycle queues"""
+
+    def manage_object_recycling(self):
+        world = self.world
+        player = self.player
+        rng = self.rng
+        threshold = player.get_y() - RECYCLE_DISTANCE
+        spawn_pos = player.get_y() + SPAWN_AHEAD
+        for item in world.collectibles:
+            if item['pos'][1] < threshold:
+                item['pos'][:] = rng.uniform(-500, 500), spawn_pos, rng.uniform(100, 300)
+                item['taken'] = False
+                world.moved('collectibles', item)
+        for hazard in world.hazards:
+            if hazard['pos'][1] < threshold:
+                hazard['pos'][:] = rng.uniform(-600, 600), spawn_pos, rng.uniform(50, 400)
+                hazard['variant'] = rng.choice(HAZARD_TYPES)
+                world.moved('hazards', hazard)
+        for hostile in world.hostiles:
+            if hostile['pos'][1] < threshold or not hostile['alive']:
+                hostile['pos'][0] = player.get_x() + rng.uniform(-300, 300)
+                hostile['pos'][1] = player.get_y() + rng.uniform(300, 800)
+                hostile['pos'][2] = player.get_z() + rng.uniform(-100, 100)
+                hostile['alive'] = True
+                world.moved('hostiles', hostile)
+        for pickup in world.pickups:
+            if pickup['pos'][1] < threshold or pickup['taken']:
+                pickup['pos'][:] = rng.uniform(-300, 300), spawn_pos, rng.uniform(100, 250)
+                pickup['taken'] = False
+                world.moved('pickups', pickup)
+
+
+def world_state(sim):
+    entities = tuple((kind, tuple(entity['pos']), entity.get('alive'), entity.get('taken'))
+                     for kind in GRID_KINDS for entity in getattr(sim.world, kind))
+    state = sim.state
+    return entities, state.score, state.total_kills, state.lives, state.difficulty
+
+
+@pytest.mark.parametrize('seed', (1, 2, 3))
+def test_recycle_queues_match_full_scan(seed):
+    queued = Simulation(seed=seed)
+    scanned = FullScanSimulation(seed=seed)
+    for sim in (queued, scanned):
+        # Auto fire keeps hostiles dying and levels rising, so the hostile queue is rebuilt
+        sim.state.cheat_enabled = True
+        sim.state.lives = 1000
+    for tick in range(3000):
+        queued.tick()
+        scanned.tick()
+        assert world_state(queued) == world_state(scanned), tick
+    assert queued.state.difficulty > 1
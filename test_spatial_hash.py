@@ -0,0 +1,109 @@
+import math
+import random
+
+import pytest
+
+from spatial_hash import SpatialHash, CELL_SIZE
+
+
+def within(points, x, y, z, radius):
+    """Keys of the points within radius of (x, y, z), by brute force"""
+    return [key for key, (px, py, pz) in sorted(points.items())
+            if math.dist((px, py, pz), (x, y, z)) <= radius]
+
+
+def exact(grid, points, x, y, z, radius):
+    """The grid's candidates narrowed to those within radius"""
+    return [key for key in grid.query(x, y, z, radius)
+            if math.dist(points[key], (x, y, z)) <= radius]
+
+
+def random_point(rng):
+    return tuple(rng.uniform(-1000, 1000) for _ in range(3))
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_queries_match_brute_force_through_moves_and_removals(seed):
+    rng = random.Random(seed)
+    grid = SpatialHash()
+    points = {}
+    for key in range(300):
+        points[key] = random_point(rng)
+        grid.insert(key, *points[key])
+
+    for round_ in range(20):
+        for key in rng.sample(sorted(points), 40):
+            # Some moves stay inside the cell, some cross several
+            step = rng.choice((5, CELL_SIZE, 3 * CELL_SIZE))
+            points[key] = tuple(value + rng.uniform(-step, step) for value in points[key])
+            grid.move(key, *points[key])
+        for key in rng.sample(sorted(points), 5):
+            del points[key]
+            grid.remove(key)
+        for key in range(1000 + round_ * 5, 1005 + round_ * 5):
+            points[key] = random_point(rng)
+            grid.insert(key, *points[key])
+
+        assert len(grid) == len(points)
+        for _ in range(20):
+            x, y, z = random_point(rng)
+            radius = rng.uniform(0, CELL_SIZE / 2)
+            candidates = grid.query(x, y, z, radius)
+            assert candidates == sorted(candidates)
+            assert exact(grid, points, x, y, z, radius) == within(points, x, y, z, radius)
+
+
+def test_queries_at_cell_edges():
+    grid = SpatialHash()
+    # Points on and either side of the boundary between cells 0 and 1 on each axis
+    points = {
+        0: (CELL_SIZE, 50, 50),
+        1: (CELL_SIZE - 1e-9, 50, 50),
+        2: (50, CELL_SIZE, 50),
+        3: (50, 50, CELL_SIZE),
+        4: (-1e-9, 50, 50),
+        5: (0, 0, 0),
+    }
+    for key, point in points.items():
+        grid.insert(key, *point)
+    assert grid.cell_of(*points[0]) == (1, 0, 0)
+    assert grid.cell_of(*points[1]) == (0, 0, 0)
+    assert grid.cell_of(*points[4]) == (-1, 0, 0)
+    for x, y, z in ((CELL_SIZE - 0.5, 50, 50), (CELL_SIZE + 0.5, 50, 50), (0.5, 0.5, 0.5),
+                    (-0.5, 50, 50), (50, CELL_SIZE - 0.5, CELL_SIZE - 0.5)):
+        for radius in (0.0, 0.5, 1.0, CELL_SIZE / 2):
+            assert exact(grid, points, x, y, z, radius) == within(points, x, y, z, radius)
+
+
+def test_move_within_a_cell_keeps_the_bucket():
+    grid = SpatialHash()
+    grid.insert('a', 10, 10, 10)
+    assert not grid.move('a', 20, 20, 20)
+    assert grid.move('a', CELL_SIZE + 1, 20, 20)
+    assert grid.query(10, 10, 10, 1) == []
+    assert grid.query(CELL_SIZE + 1, 20, 20, 1) == ['a']
+    grid.remove('a')
+    grid.remove('a')
+    assert len(grid) == 0 and not grid.cells
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_nearest_matches_the_lowest_ranked_query_result(seed):
+    rng = random.Random(seed)
+    grid = SpatialHash()
+    points = {key: random_point(rng) for key in range(400)}
+    for key, point in points.items():
+        grid.insert(key, *point, item=key)
+
+    def rank(key, x, y, z, radius):
+        # Whole-unit distances make ties, which go to the lower key
+        distance = math.floor(math.dist(points[key], (x, y, z)))
+        return distance if distance <= radius else None
+
+    for _ in range(50):
+        x, y, z = random_point(rng)
+        radius = rng.uniform(0, CELL_SIZE / 2)
+        ranked = [(rank(key, x, y, z, radius), key) for key in grid.query(x, y, z, radius)]
+        ranked = [entry for entry in ranked if entry[0] is not None]
+        expected = min(ranked)[1] if ranked else None
+        assert grid.nearest(x, y, z, radius, rank, x, y, z, radius) == expected
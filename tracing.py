@@ -0,0 +1,123 @@
+import gc
+import json
+import os
+import sys
+import time
+from collections import deque
+
+from profiling import Instrumentation, wrap_call
+
+
+CAPACITY = 20000                # events kept; a frame of update and render phases is about 40
+THREAD_ID = 1                   # the game runs every loop on the one GLUT thread
+
+
+class TraceRecorder(Instrumentation):
+    """The most recent update, render and gameplay events as Chrome trace events
+
+    Phases are recorded as complete ('X') events, which carry their begin time
+    and duration together, so dropping the oldest events from the full ring
+    never leaves a begin without its end. write() produces JSON that loads in
+    chrome://tracing and Perfetto. Like the profiler, a disabled recorder
+    installs no wrappers.
+    """
+
+    def __init__(self, enabled=False, capacity=CAPACITY):
+        self.enabled = enabled
+        self.events = deque(maxlen=capacity)
+        self.recorded = 0
+        self.counters = {}
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.gc_start = None
+
+    @property
+    def dropped(self):
+        """Events pushed out of the ring by newer ones"""
+        return self.recorded - len(self.events)
+
+    def timestamp(self, nanoseconds=None):
+        """Microseconds since the recorder was created, the unit trace events use"""
+        if nanoseconds is None:
+            nanoseconds = time.perf_counter_ns()
+        return (nanoseconds - self.origin) / 1000
+
+    def add(self, event):
+        event['pid'] = self.pid
+        event['tid'] = THREAD_ID
+        self.events.append(event)
+        self.recorded += 1
+
+    def complete(self, name, category, start, end, args=None):
+        """A phase that ran from start to end, both perf_counter_ns readings"""
+        event = {'name': name, 'cat': category, 'ph': 'X',
+                 'ts': self.timestamp(start), 'dur': (end - start) / 1000}
+        if args:
+            event['args'] = args
+        self.add(event)
+
+    def instant(self, name, category, args=None):
+        event = {'name': name, 'cat': category, 'ph': 'i', 's': 'p', 'ts': self.timestamp()}
+        if args:
+            event['args'] = args
+        self.add(event)
+
+    def finish(self, name, start, end):
+        # Timed phases are grouped by the first part of their name, e.g. 'update'
+        self.complete(name, name.partition('.')[0], start, end)
+
+    def watch(self, owner, name, event, read, threshold=1):
+        """Mark event whenever read() rises by at least threshold across a call of owner.name"""
+        if not self.enabled:
+            return
+
+        def leave(before):
+            after = read()
+            if after - before >= threshold:
+                self.instant(event, 'gameplay', {'before': before, 'after': after})
+        setattr(owner, name, wrap_call(getattr(owner, name), read, leave))
+
+    def add_counter(self, name, read):
+        """Record read(), a dict of series to values, as a counter track whenever sampled"""
+        if self.enabled:
+            self.counters[name] = read
+
+    def sample(self):
+        """Record every counter track once"""
+        now = self.timestamp()
+        for name, read in self.counters.items():
+            self.add({'name': name, 'ph': 'C', 'ts': now, 'args': read()})
+
+    def watch_gc(self):
+        """Record every garbage collection pass as a complete event"""
+        if self.enabled and self.gc_callback not in gc.callbacks:
+            gc.callbacks.append(self.gc_callback)
+
+    def gc_callback(self, phase, info):
+        if phase == 'start':
+            self.gc_start = time.perf_counter_ns()
+        elif self.gc_start is not None:
+            self.complete(f"gc.gen{info['generation']}", 'gc', self.gc_start, time.perf_counter_ns(),
+                          {'collected': info['collected'], 'uncollectable': info['uncollectable']})
+            self.gc_start = None
+
+    def trace(self):
+        """The recorded events as a Chrome trace object"""
+        metadata = [
+            {'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'args': {'name': 'Sky Racer'}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': THREAD_ID,
+             'args': {'name': 'main loop'}},
+        ]
+        return {
+            'traceEvents': metadata + list(self.events),
+            'displayTimeUnit': 'ms',
+            'otherData': {'recorded': self.recorded, 'dropped': self.dropped},
+        }
+
+    def write(self, path):
+        """Save the trace as JSON at path; nothing if nothing was recorded"""
+        if not self.events:
+            return
+        with open(path, 'w') as stream:
+            json.dump(self.trace(), stream)
+        print(f"Wrote {len(self.events)} trace events to {path}", file=sys.stderr)